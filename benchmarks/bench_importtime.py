@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a run without -o should not have to import
+OUTPUT_MODULES = ["yaml", "csv", "xml.etree.ElementTree", "xml.dom.minidom", "openpyxl", "pandas"]
+
+def import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Import `module` in a fresh interpreter and return {module: (self us, cumulative us)} from -X importtime."""
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                             cwd=ROOT, capture_output=True, text=True, check=True)
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if not fields[0].strip().isdigit():
+            continue
+        times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return times
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure what importing the scanner costs, with python -X importtime")
+    parser.add_argument("--module", default="fwf", help="Module to import")
+    parser.add_argument("--repeat", type=int, default=10, help="Fresh interpreters to average over")
+    parser.add_argument("--top", type=int, default=10, help="Project modules to list by cumulative time")
+    args = parser.parse_args()
+
+    runs = [import_times(args.module) for _ in range(args.repeat)]
+    totals = [run[args.module][1] for run in runs]
+    print(f"import {args.module}: median {statistics.median(totals) / 1000:.1f} ms, "
+          f"min {min(totals) / 1000:.1f} ms over {args.repeat} runs")
+
+    last = runs[-1]
+    print("\noutput modules imported:")
+    for module in OUTPUT_MODULES:
+        cost = f"{statistics.median(run[module][1] for run in runs) / 1000:.1f} ms" if module in last else "no"
+        print(f"  {module:<24} {cost}")
+
+    project = sorted((name for name in last if name.startswith("src.")),
+                     key=lambda name: statistics.median(run[name][1] for run in runs), reverse=True)
+    print("\nslowest project modules (cumulative):")
+    for name in project[:args.top]:
+        print(f"  {name:<32} {statistics.median(run[name][1] for run in runs) / 1000:>7.1f} ms")
+
+if __name__ == '__main__':
+    main()
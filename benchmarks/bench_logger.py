@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from run_benchmarks import start_server, write_wordlist
+from src.constants.default import DEFAULT_USERAGENT
+from src.models.config import ScanConfig
+from src.scanner.scanner import FwFScanner
+from src.output.logger import Logger
+
+logger = Logger.get_instance()
+
+class SlowTerminal:
+    """A stdout that takes per_write seconds for every write plus the time to push the bytes at bytes_per_s."""
+    def __init__(self, per_write: float, bytes_per_s: float):
+        self.per_write = per_write
+        self.bytes_per_s = bytes_per_s
+        self.writes = 0
+
+    def write(self, data: str) -> int:
+        self.writes += 1
+        delay = self.per_write + (len(data) / self.bytes_per_s if self.bytes_per_s else 0.0)
+        if delay:
+            time.sleep(delay)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def isatty(self) -> bool:
+        return True
+
+def run(url: str, wordlist: str, concurrency: int, terminal: SlowTerminal, buffered: bool) -> tuple[float, float]:
+    """Scan in verbose mode so every response is printed, and return the scan rate and the time to drain the output."""
+    logger.set_buffered(buffered).set_verbose(True)
+    config = ScanConfig(urls=[url], wordlist=[wordlist], concurrency=concurrency, timeout=10,
+                        user_agent=str(DEFAULT_USERAGENT), verbose=True)
+    scanner = FwFScanner(config)
+    stdout = sys.stdout
+    sys.stdout = terminal
+    try:
+        started = time.perf_counter()
+        asyncio.run(scanner.run())
+        elapsed = time.perf_counter() - started
+        logger.flush()
+        drained = time.perf_counter() - started
+    finally:
+        sys.stdout = stdout
+    return scanner.requests_sent / elapsed, drained
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the scan rate with direct and queued console output")
+    parser.add_argument("--size", type=int, default=5000, help="Wordlist size")
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--per-write", type=float, default=0.0005, help="Seconds each write to the slow terminal takes")
+    parser.add_argument("--bandwidth", type=float, default=500_000, help="Bytes per second the slow terminal accepts")
+    args = parser.parse_args()
+
+    server, url = start_server([])
+    terminals = {
+        "fast": lambda: SlowTerminal(0.0, 0.0),
+        "slow": lambda: SlowTerminal(args.per_write, args.bandwidth),
+    }
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            wordlist = write_wordlist(directory, args.size)
+            print(f"{'terminal':>8} {'output':>8} {'req/s':>9} {'writes':>7} {'drained s':>9}")
+            for name, make_terminal in terminals.items():
+                for buffered in (False, True):
+                    terminal = make_terminal()
+                    rate, drained = run(url, wordlist, args.concurrency, terminal, buffered)
+                    print(f"{name:>8} {'queued' if buffered else 'direct':>8} {rate:>9.1f} "
+                          f"{terminal.writes:>7} {drained:>9.2f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import time
+import argparse
+
+from multidict import CIMultiDict
+from yarl import URL
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.config import ScanConfig
+from src.scanner.request import RequestTemplate, build_url
+
+def per_request_preparation(config: ScanConfig, target: str, path: str, user_agent: str):
+    """What process_request and aiohttp did for every path before templates."""
+    url = build_url(target, path)
+    headers = {
+        "User-Agent": user_agent,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.5",
+        "Accept-Encoding": "gzip, deflate",
+    }
+    if config.cookie:
+        headers["Cookie"] = config.cookie
+    method_func = {"GET": 1, "POST": 2, "HEAD": 3, "PUT": 4, "DELETE": 5}.get(config.method.upper())
+    request_url = URL(url)
+    if config.params:
+        request_url = request_url.extend_query(config.params)
+    return method_func, request_url, CIMultiDict(headers)
+
+def template_preparation(template: RequestTemplate, target: str, path: str, user_agent: str):
+    return template.method, template.url(target, path), template.kwargs(user_agent)
+
+def measure(label: str, func, paths: list[str]) -> float:
+    start = time.process_time()
+    for path in paths:
+        func(path)
+    per_request = (time.process_time() - start) / len(paths) * 1e6
+    print(f"{label:<12} {per_request:8.2f} us/request")
+    return per_request
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-request CPU cost of request preparation")
+    parser.add_argument("-n", "--requests", type=int, default=200_000)
+    args = parser.parse_args()
+
+    config = ScanConfig(urls=["http://127.0.0.1:8080/"], wordlist=[], cookie="session=abc",
+                        params={"lang": "en", "debug": "1"})
+    user_agent = "Mozilla/5.0 (X11; Linux x86_64) FwF"
+    template = RequestTemplate(config, [user_agent])
+    target = config.urls[0]
+    paths = [f"dir{i % 997}/file{i}.php" for i in range(args.requests)]
+
+    before = measure("per-request", lambda p: per_request_preparation(config, target, p, user_agent), paths)
+    after = measure("template", lambda p: template_preparation(template, target, p, user_agent), paths)
+    print(f"{'speedup':<12} {before / after:8.2f}x")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import tracemalloc
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.result import ScanResult
+from src.models.result_store import ResultStore
+
+CONTENT_TYPES = ["text/html; charset=utf-8", "application/json", "text/plain", "image/png", None]
+STATUSES = [200, 200, 200, 301, 302, 401, 403, 500]
+
+@dataclass
+class DictResult:
+    """ScanResult as it was before, with a per-instance __dict__."""
+    url: str
+    status: int
+    content_length: int
+    response_time: float
+    content_type: Optional[str] = None
+    target: Optional[str] = None
+    redirect: Optional[str] = None
+    payload: Optional[str] = None
+    body: Optional[bytes] = None
+
+def rows(count: int, targets: int) -> Iterator[tuple]:
+    """
+    Yield result fields as a recursive scan of a few targets would produce
+    them, every response bringing its own strings.
+    """
+    rng = random.Random(7)
+    hosts = [f"https://target{t}.example.com/" for t in range(targets)]
+    for i in range(count):
+        target = hosts[i % targets]
+        depth = "/".join(f"dir{rng.randrange(50)}" for _ in range(rng.randrange(3)))
+        url = f"{target}{depth + '/' if depth else ''}path-{i:07d}"
+        status = rng.choice(STATUSES)
+        content_type = rng.choice(CONTENT_TYPES)
+        yield (url, status, rng.randrange(100_000), rng.random(),
+               None if content_type is None else "".join(content_type),
+               "".join(target), url + "/" if status in (301, 302) else None)
+
+def measure(build) -> tuple[object, int, float]:
+    """Return what build() made, the bytes it holds on to and the seconds it took."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    built = build()
+    elapsed = time.perf_counter() - started
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return built, size, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare memory per result and sort time of the result layouts")
+    parser.add_argument("--size", type=int, default=200_000, help="Number of results")
+    parser.add_argument("--targets", type=int, default=4, help="Number of distinct targets")
+    args = parser.parse_args()
+
+    layouts = {
+        "dataclass": lambda: [DictResult(*row) for row in rows(args.size, args.targets)],
+        "slots": lambda: [ScanResult(*row) for row in rows(args.size, args.targets)],
+        "store": lambda: ResultStore(ScanResult(*row) for row in rows(args.size, args.targets)),
+    }
+    print(f"{args.size} results")
+    print(f"{'layout':>10} {'bytes/result':>13} {'build s':>8} {'sort s':>7}")
+    for name, build in layouts.items():
+        results, size, built = measure(build)
+        started = time.perf_counter()
+        if isinstance(results, ResultStore):
+            ordered = results.sorted(("status", "url"))
+        else:
+            ordered = sorted(results, key=lambda x: (x.status, x.url))
+        sort_time = time.perf_counter() - started
+        assert len(ordered) == args.size
+        print(f"{name:>10} {size / args.size:>13.1f} {built:>8.2f} {sort_time:>7.2f}")
+        del results, ordered
+
+if __name__ == '__main__':
+    main()
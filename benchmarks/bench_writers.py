@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import subprocess
+import xml.dom.minidom as minidom
+import xml.etree.ElementTree as ET
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.result import ScanResult
+from src.models.result_store import ResultStore
+from src.output.logger import Logger
+from src.output.writers import get_writer
+from src.output.summary import peak_memory_mb
+
+logger = Logger.get_instance()
+
+CONTENT_TYPES = ["text/html; charset=utf-8", "application/json", "text/plain", None]
+
+def legacy_xml(results, output_file: str, command: str) -> bool:
+    """The XML writer as it was: a full ElementTree, serialized, re-parsed and pretty-printed."""
+    root = ET.Element("FwFScanResults")
+    ET.SubElement(root, "Command").text = command
+    results_element = ET.SubElement(root, "Results")
+    for result in results:
+        item = ET.SubElement(results_element, "Result")
+        ET.SubElement(item, "URL").text = result.url
+        ET.SubElement(item, "Status").text = str(result.status)
+        ET.SubElement(item, "ContentLength").text = str(result.content_length)
+        ET.SubElement(item, "ResponseTime").text = f"{result.response_time:.3f}"
+        ET.SubElement(item, "ContentType").text = result.content_type or "N/A"
+    with open(output_file, 'w') as f:
+        f.write(minidom.parseString(ET.tostring(root)).toprettyxml(indent="  "))
+    return True
+
+def build_store(count: int) -> ResultStore:
+    store = ResultStore()
+    for i in range(count):
+        store.append(ScanResult(f"https://target.example.com/dir{i % 97}/path-{i:07d}", (200, 301, 403)[i % 3],
+                                i % 50_000, (i % 1000) / 1000, CONTENT_TYPES[i % len(CONTENT_TYPES)]))
+    return store
+
+def run_case(name: str, size: int, output_file: str) -> dict:
+    """Write `size` results in this process and measure it; the store is built first, so the peak RSS growth is the writer's."""
+    results = build_store(size).sorted(("status", "url"))
+    writer = legacy_xml if name == "xml-tree" else get_writer(name)
+    peak_before = peak_memory_mb()
+    started = time.perf_counter()
+    if not writer(results, output_file, "fwf benchmark"):
+        raise RuntimeError(f"writing {output_file} failed")
+    elapsed = time.perf_counter() - started
+    logger.flush()
+    return {"seconds": elapsed, "peak_growth_mb": peak_memory_mb() - peak_before,
+            "file_mb": os.path.getsize(output_file) / 2 ** 20}
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure time and peak memory of the report writers as results grow")
+    parser.add_argument("--sizes", default="10000,100000,1000000", help="Comma-separated result counts")
+    parser.add_argument("--formats", default="xml,html,xlsx", help="Comma-separated formats")
+    parser.add_argument("--legacy-max", type=int, default=100_000,
+                        help="Largest result count to run the old tree-building XML writer on")
+    parser.add_argument("--case", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        # a single measurement, in a fresh interpreter so peak RSS belongs to it
+        measured = run_case(args.case, int(args.sizes), args.output)
+        print(json.dumps(measured))
+        return
+
+    formats = args.formats.split(',')
+    print(f"{'format':>10} {'results':>9} {'seconds':>8} {'peak +MiB':>10} {'file MiB':>9}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in (int(s) for s in args.sizes.split(',')):
+            cases = formats + (["xml-tree"] if "xml" in formats and size <= args.legacy_max else [])
+            for name in cases:
+                output_file = os.path.join(directory, f"results.{name.split('-')[0]}")
+                process = subprocess.run([sys.executable, os.path.abspath(__file__), "--case", name,
+                                          "--sizes", str(size), "--output", output_file],
+                                         capture_output=True, text=True, check=True)
+                measured = json.loads(process.stdout.strip().splitlines()[-1])
+                print(f"{name:>10} {size:>9} {measured['seconds']:>8.2f} "
+                      f"{measured['peak_growth_mb']:>10.1f} {measured['file_mb']:>9.1f}", flush=True)
+                os.remove(output_file)
+
+if __name__ == '__main__':
+    main()
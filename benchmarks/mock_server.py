@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import sys
+import random
+import asyncio
+import hashlib
+import argparse
+from aiohttp import web
+
+def parse_status_mix(value: str) -> list[tuple[int, float]]:
+    """Parse 'status:weight,...' (e.g. '404:0.95,200:0.04,301:0.01') into cumulative weights."""
+    mix = []
+    total = 0.0
+    for item in value.split(','):
+        status, weight = item.split(':')
+        total += float(weight)
+        mix.append((int(status), total))
+    return [(status, cumulative / total) for status, cumulative in mix]
+
+class MockServer:
+    """
+    Target for benchmarks. The status of a path is picked from the status
+    mix by a hash of the path, so every run sees the same hits; latency and
+    injected failures are random per request, from a seeded generator.
+    """
+    def __init__(self, args):
+        self.args = args
+        self.status_mix = parse_status_mix(args.status_mix)
+        self.body = b"x" * args.body_size
+        self.random = random.Random(args.seed)
+
+    def status_of(self, path: str) -> int:
+        point = int.from_bytes(hashlib.blake2b(path.encode(), digest_size=4).digest(), "little") / 2**32
+        for status, cumulative in self.status_mix:
+            if point < cumulative:
+                return status
+        return self.status_mix[-1][0]
+
+    def latency(self) -> float:
+        args = self.args
+        if args.latency == "fixed":
+            value = args.latency_mean
+        elif args.latency == "uniform":
+            value = self.random.uniform(0, 2 * args.latency_mean)
+        elif args.latency == "exponential":
+            value = self.random.expovariate(1 / args.latency_mean) if args.latency_mean else 0
+        else:
+            value = self.random.lognormvariate(0, args.latency_sigma) * args.latency_mean
+        return value / 1000
+
+    async def handle(self, request: web.Request) -> web.StreamResponse:
+        args = self.args
+        delay = self.latency()
+        if delay:
+            await asyncio.sleep(delay)
+        roll = self.random.random()
+        if roll < args.reset_rate:
+            request.transport.close()
+            raise asyncio.CancelledError()
+        roll -= args.reset_rate
+        if roll < args.hang_rate:
+            await asyncio.sleep(args.hang_seconds)
+        roll -= args.hang_rate
+        status = 500 if roll < args.error_rate else self.status_of(request.path)
+
+        headers = {}
+        if 300 <= status < 400:
+            headers["Location"] = request.path.rstrip('/') + '/'
+        response = web.Response(status=status, body=self.body if request.method != "HEAD" else None, headers=headers)
+        if not args.keepalive:
+            response.force_close()
+        return response
+
+def parse_arguments(argv=None):
+    parser = argparse.ArgumentParser(description="Mock HTTP target for FwF benchmarks")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="Port to listen on (0: any free port)")
+    parser.add_argument("--latency", choices=["fixed", "uniform", "exponential", "lognormal"], default="fixed")
+    parser.add_argument("--latency-mean", type=float, default=0.0, help="Mean response latency in milliseconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Shape of the lognormal latency distribution")
+    parser.add_argument("--status-mix", default="404:0.95,200:0.03,301:0.01,403:0.01",
+                        help="Status codes and their weights, e.g. '404:0.95,200:0.05'")
+    parser.add_argument("--body-size", type=int, default=256, help="Response body size in bytes")
+    parser.add_argument("--no-keepalive", dest="keepalive", action="store_false", help="Close every connection")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 500")
+    parser.add_argument("--reset-rate", type=float, default=0.0, help="Fraction of connections dropped without a response")
+    parser.add_argument("--hang-rate", type=float, default=0.0, help="Fraction of requests delayed by --hang-seconds")
+    parser.add_argument("--hang-seconds", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    return parser.parse_args(argv)
+
+async def serve(args):
+    server = MockServer(args)
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", server.handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, args.host, args.port, backlog=1024)
+    await site.start()
+    port = runner.addresses[0][1]
+    # the benchmark runner reads this line to find the server
+    print(f"listening http://{args.host}:{port}", flush=True)
+    await asyncio.Event().wait()
+
+def main():
+    try:
+        asyncio.run(serve(parse_arguments()))
+    except KeyboardInterrupt:
+        sys.exit(0)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import json
+import shlex
+import platform
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime, timezone
+from typing import Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, PROJECT_ROOT)
+
+from src.constants.default import VERSION
+
+def start_server(server_args: list[str]) -> tuple[subprocess.Popen, str]:
+    """Start the mock server in its own process and return it with its base URL."""
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(BENCH_DIR, "mock_server.py"), *server_args],
+        stdout=subprocess.PIPE, text=True
+    )
+    line = process.stdout.readline().strip()
+    if not line.startswith("listening "):
+        process.kill()
+        raise RuntimeError(f"Mock server failed to start: {line or 'no output'}")
+    return process, line.split(" ", 1)[1]
+
+def write_wordlist(directory: str, size: int) -> str:
+    path = os.path.join(directory, f"words-{size}.txt")
+    with open(path, 'w') as f:
+        f.writelines(f"path{i:07d}\n" for i in range(size))
+    return path
+
+def run_case(url: str, wordlist: str, concurrency: int, timeout: int, scan_config: str) -> dict:
+    """Run one scan in a fresh interpreter so peak RSS and CPU belong to that scan alone."""
+    output = subprocess.run(
+        [sys.executable, os.path.join(BENCH_DIR, "scan_case.py"), "--url", url, "--wordlist", wordlist,
+         "--concurrency", str(concurrency), "--timeout", str(timeout), "--config", scan_config],
+        capture_output=True, text=True, check=True
+    )
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=PROJECT_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(results: dict, baseline: dict, tolerance: float) -> bool:
+    """Print each case against the baseline run and return True if any case regressed beyond tolerance."""
+    previous = {(c["wordlist_size"], c["concurrency"]): c for c in baseline["cases"]}
+    regressed = False
+    print(f"\nAgainst {baseline.get('version')} ({baseline.get('git') or 'unknown revision'}):")
+    for case in results["cases"]:
+        old = previous.get((case["wordlist_size"], case["concurrency"]))
+        if old is None:
+            continue
+        rate = case["requests_per_s"] / old["requests_per_s"] if old["requests_per_s"] else 0.0
+        cpu = case["cpu_us_per_request"] / old["cpu_us_per_request"] if old["cpu_us_per_request"] else 0.0
+        worse = rate < 1 - tolerance or cpu > 1 + tolerance
+        regressed = regressed or worse
+        print(f"  {case['wordlist_size']:>8} x {case['concurrency']:<5} req/s {rate:6.2f}x  "
+              f"cpu/request {cpu:6.2f}x{'  REGRESSION' if worse else ''}")
+    return regressed
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark FwFScanner against a local mock server")
+    parser.add_argument("--sizes", default="1000,10000", help="Comma-separated wordlist sizes")
+    parser.add_argument("--concurrency", default="10,50,200", help="Comma-separated concurrency levels")
+    parser.add_argument("--timeout", type=int, default=10, help="Scanner request timeout in seconds")
+    parser.add_argument("--server", default="", help="Mock server options, e.g. \"--latency exponential --latency-mean 5\"")
+    parser.add_argument("--scan-config", default="{}", help="Extra ScanConfig fields as a JSON object")
+    parser.add_argument("-o", "--output", default=None, help="Write the results to this JSON file")
+    parser.add_argument("--compare", default=None, help="Compare with a previous results file")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="Relative slowdown reported as a regression")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(',')]
+    levels = [int(level) for level in args.concurrency.split(',')]
+    server, url = start_server(shlex.split(args.server))
+    results = {
+        "version": VERSION,
+        "git": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "server": args.server,
+        "scan_config": json.loads(args.scan_config),
+        "cases": [],
+    }
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            print(f"{'words':>8} {'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+                  f"{'RSS MiB':>8} {'cpu us/req':>10} {'failed':>6}")
+            for size in sizes:
+                wordlist = write_wordlist(directory, size)
+                for concurrency in levels:
+                    case = {"wordlist_size": size, "concurrency": concurrency,
+                            **run_case(url, wordlist, concurrency, args.timeout, args.scan_config)}
+                    results["cases"].append(case)
+                    latency = case["latency_ms"]
+                    print(f"{size:>8} {concurrency:>5} {case['requests_per_s']:>9.1f} {latency['p50']:>8.2f} "
+                          f"{latency['p95']:>8.2f} {latency['p99']:>8.2f} {case['peak_rss_mb']:>8.1f} "
+                          f"{case['cpu_us_per_request']:>10.1f} {case['failed']:>6}")
+    finally:
+        server.terminate()
+        server.wait()
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+    if args.compare:
+        with open(args.compare) as f:
+            if compare(results, json.load(f), args.tolerance):
+                sys.exit(1)
+
+if __name__ == '__main__':
+    main()
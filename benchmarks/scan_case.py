@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import resource
+import statistics
+from array import array
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.constants.default import DEFAULT_USERAGENT
+from src.models.config import ScanConfig
+from src.scanner.scanner import FwFScanner
+from src.scanner.metrics import Histogram
+from src.output.summary import peak_memory_mb
+from src.output.logger import Logger
+
+logger = Logger.get_instance()
+
+class SampledHistogram(Histogram):
+    """Histogram that also keeps every value, so the benchmark reports exact percentiles."""
+    def __init__(self):
+        super().__init__()
+        self.samples = array('d')
+
+    def record(self, value: float):
+        super().record(value)
+        self.samples.append(value)
+
+def percentiles(samples: array, points: tuple[int, ...] = (50, 95, 99)) -> dict[str, float]:
+    """Return the given percentiles of the samples in milliseconds."""
+    if len(samples) < 2:
+        return {f"p{point}": round(samples[0] * 1000 if samples else 0.0, 3) for point in points}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {f"p{point}": round(cuts[point - 1] * 1000, 3) for point in points}
+
+def run_case(url: str, wordlist: str, concurrency: int, timeout: int, extra: dict) -> dict:
+    """Scan url with the real FwFScanner and measure it, with scanner output discarded."""
+    config = ScanConfig(urls=[url], wordlist=[wordlist], concurrency=concurrency, timeout=timeout,
+                        user_agent=str(DEFAULT_USERAGENT), **extra)
+    scanner = FwFScanner(config)
+    latency = scanner.metrics.phases["total"] = SampledHistogram()
+
+    stdout = sys.stdout
+    usage_before = resource.getrusage(resource.RUSAGE_SELF)
+    started = time.perf_counter()
+    with open(os.devnull, 'w') as devnull:
+        sys.stdout = devnull
+        try:
+            asyncio.run(scanner.run())
+        finally:
+            logger.flush()
+            sys.stdout = stdout
+    elapsed = time.perf_counter() - started
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+
+    requests = scanner.requests_sent
+    cpu = (usage.ru_utime - usage_before.ru_utime) + (usage.ru_stime - usage_before.ru_stime)
+    return {
+        "requests": requests,
+        "results": scanner.results_count,
+        "failed": sum(scanner.failed_tasks.values()),
+        "elapsed_s": round(elapsed, 4),
+        "requests_per_s": round(requests / elapsed, 1) if elapsed else 0.0,
+        # every response, not only the ones kept as results
+        "latency_ms": percentiles(latency.samples),
+        "peak_rss_mb": round(peak_memory_mb() or 0.0, 1),
+        "cpu_us_per_request": round(cpu / requests * 1e6, 1) if requests else 0.0,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Run one benchmark scan and print its measurements as JSON")
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--wordlist", required=True)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--timeout", type=int, default=10)
+    parser.add_argument("--config", default="{}", help="Extra ScanConfig fields as a JSON object")
+    args = parser.parse_args()
+    print(json.dumps(run_case(args.url, args.wordlist, args.concurrency, args.timeout, json.loads(args.config))))
+
+if __name__ == '__main__':
+    main()
@@ -7,6 +7,7 @@ License: MIT
 """
 
 import sys
+import signal
 sys.dont_write_bytecode = True
 
 try:
@@ -20,6 +21,8 @@ try:
     from src.models.config import ScanConfig
     from src.output.logger import Logger
     from src.scanner.scanner import FwFScanner
+    from src.scanner.parallel import ParallelScanner
+    from src.scanner.checkpoint import Checkpoint
     from src.input.cli_parser import parse_arguments
     from src.output.banner import print_banner
 except ImportError as e:
@@ -28,30 +31,94 @@ except ImportError as e:
 
 logger = Logger.get_instance()
 
-def main():
-    args = parse_arguments()
+def build_config(args) -> ScanConfig:
+    """Build the scan configuration from parsed command-line arguments."""
+    adaptive = args.concurrency == "auto"
+    body_policy = args.body_policy
+    if body_policy == "keep" and not any(name.strip().endswith(".jsonl") for name in (args.output or "").split(",")):
+        # only JSONL output writes kept bodies; without one, keeping them would only fill memory
+        logger.warning("[BODY POLICY]", "'keep' needs a .jsonl output file, draining bodies instead")
+        body_policy = "drain"
     
-    logger.set_color(args.color).set_verbose(args.verbose)
-    
-    config = ScanConfig(
-        url=args.url,
+    return ScanConfig(
+        urls=args.url,
         method=args.method,
         timeout=args.timeout,
         follow_redirects=args.follow_redirects,
         cookie=args.cookie,
         params=args.params,
         data=args.data,
+        headers=args.header or None,
+        probe=args.probe,
+        body_policy=body_policy,
+        body_limit=args.body_limit,
+        keepalive_timeout=args.keepalive_timeout,
+        prewarm=args.prewarm,
         user_agent=args.user_agent,
         wordlist=args.wordlist,
-        concurrency=args.concurrency,
+        wordlist_mmap=args.mmap,
+        extensions=args.extensions,
+        prefixes=args.prefixes,
+        suffixes=args.suffixes,
+        case=args.case,
+        number_range=args.number_range,
+        fuzz_mode=args.mode,
+        concurrency=args.max_concurrency if adaptive else args.concurrency,
+        adaptive_concurrency=adaptive,
+        min_concurrency=args.min_concurrency,
+        host_concurrency=args.host_concurrency,
+        workers=args.workers,
         retry=args.retry,
+        retry_backoff=args.retry_backoff,
+        retry_max_delay=args.retry_max_delay,
+        retry_budget=args.retry_budget,
+        depth=args.depth,
+        depth_limit=args.depth_limit,
+        rate=args.rate,
+        host_rate=args.host_rate,
+        burst=args.burst,
         match_codes=args.match_codes,
+        filter_codes=args.filter_codes,
+        match_size=args.match_size,
+        filter_size=args.filter_size,
+        match_words=args.match_words,
+        filter_words=args.filter_words,
+        match_lines=args.match_lines,
+        filter_lines=args.filter_lines,
+        match_time=args.match_time,
+        filter_time=args.filter_time,
+        match_type=args.match_type,
+        filter_type=args.filter_type,
+        match_regex=args.match_regex,
+        filter_regex=args.filter_regex,
+        calibrate=args.calibrate,
+        calibration_samples=args.calibration_samples,
         output=args.output,
+        checkpoint=args.checkpoint,
+        checkpoint_interval=args.checkpoint_interval,
+        progress=args.progress,
+        metrics_file=args.metrics_file,
         verbose=args.verbose,
     )
+
+def main():
+    # a terminated scan unwinds like an interrupted one, closing its outputs and removing its spool
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    args = parse_arguments()
+    
+    logger.set_color(args.color).set_verbose(args.verbose)
+    
+    if args.resume:
+        config = Checkpoint.load_config(args.resume)
+        config.resume = args.resume
+        config.checkpoint = args.resume
+        config.color = args.color
+        config.verbose = args.verbose
+    else:
+        config = build_config(args)
     
     print_banner()
-    scanner = FwFScanner(config)
+    scanner = ParallelScanner(config) if config.workers > 1 else FwFScanner(config)
     asyncio.run(scanner.run())
     
 if __name__ == "__main__":
@@ -62,5 +129,6 @@ if __name__ == "__main__":
         logger.info("[KEYBOARD INTERRUPT] Scan terminated by user")
         sys.exit(0)
     except Exception as e:
+        Logger.get_instance().flush()
         print(f"Unhandled exception: {str(e)}")
         sys.exit(1)
\ No newline at end of file
@@ -16,7 +16,7 @@ VERSION = "1.0.0"
 LICENSE = "MIT"
 URL = "https://github.com/waibui/FwF"        
 COPYRIGHT = f"© 2025 {AUTHOR}"
-USAGE = "python fwf.py [-u|--url] target [options]"
+USAGE = "python fwf.py [-u|--url] target [-U|--url-file] targets.txt [options]"
 EPILOG = "Example: python -u example.com -r -mc 200,301"
 
 # Project paths
@@ -27,21 +27,53 @@ REQUIREMENTS = Path.joinpath(PROJECT_ROOT, 'requirements.txt')
 
 # Default values
 DEFAULT_CONCURRENCY = 100
+DEFAULT_MIN_CONCURRENCY = 5
+DEFAULT_MAX_CONCURRENCY = 500
+DEFAULT_WORKERS = 1
 DEFAULT_TIMEOUT = 10
 DEFAULT_RETRY = 0
+DEFAULT_RETRY_BACKOFF = 0.5
+DEFAULT_RETRY_MAX_DELAY = 30.0
+DEFAULT_RETRY_BUDGET = 0.1
 DEFAULT_CRAWL = 2
+DEFAULT_DEPTH_LIMIT = 100
 DEFAULT_STATUS_CODES = [
     200, 201, 202, 203, 204,             # Success codes
     301, 302, 307, 308,                  # Redirects
     401, 403                             # Auth-related 
 ]
 DEFAULT_FOLLOW_REDIRECTS = False
+DEFAULT_CALIBRATION_SAMPLES = 3
 DEFAULT_METHOD = 'GET'
+DEFAULT_PROBE = 'method'
+DEFAULT_BODY_POLICY = 'drain'
+DEFAULT_BODY_LIMIT = 65536
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+DEFAULT_FUZZ_KEYWORD = 'FUZZ'
+DEFAULT_FUZZ_MODE = 'clusterbomb'
 
 # Default output
 DEFAULT_COLOR = False
 DEFAULT_VERBOSE = False
+SINK_BATCH_SIZE = 256
+# Results a report writer renders before each write, and the row limit of an Excel sheet
+WRITER_CHUNK_SIZE = 1024
+XLSX_MAX_ROWS = 1048576
+DEFAULT_CHECKPOINT_INTERVAL = 10.0
+DEFAULT_PROGRESS_INTERVAL = 2.0
 
 # Default allow
 ALLOW_METHOD = ["GET", "POST", "HEAD", "PUT", "DELETE"]
-ALLOW_OUTPUT_FORMAT = ["txt", "log", "json", "csv", "xlsx", "yaml", "yml", "md", "html", "xml"]
\ No newline at end of file
+ALLOW_BODY_POLICY = ["drain", "keep", "close"]
+ALLOW_PROBE = ["method", "head"]
+ALLOW_CASE = ["lower", "upper", "capital"]
+ALLOW_FUZZ_MODE = ["clusterbomb", "pitchfork"]
+# Built-in report formats and the module under src.output.writers that writes each
+OUTPUT_WRITERS = {
+    "txt": "txt_writer", "log": "txt_writer", "json": "json_writer", "jsonl": "jsonl_writer",
+    "csv": "csv_writer", "xlsx": "xlsx_writer", "yaml": "yaml_writer", "yml": "yaml_writer",
+    "md": "md_writer", "html": "html_writer", "xml": "xml_writer",
+}
+ALLOW_OUTPUT_FORMAT = list(OUTPUT_WRITERS)
+# Entry point group third-party packages register extra report formats under, named by extension
+OUTPUT_WRITER_ENTRY_POINTS = "fwf.writers"
\ No newline at end of file
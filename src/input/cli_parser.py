@@ -10,6 +10,8 @@ import argparse
 
 from src import __version__
 from src.constants import default as df 
+from src.input.file_getter import load_targets
+from src.input.fuzz import placed_keywords, request_texts, wordlist_keywords
 from src.validator.parser_validator import ParserValidator as pv
 
 def parse_arguments() -> argparse.Namespace: 
@@ -34,9 +36,16 @@ def parse_arguments() -> argparse.Namespace:
     http = parser.add_argument_group("HTTP Option")
     http.add_argument(
         "-u", "--url",
-        required=True,
+        action="append",
         type=pv.is_valid_url,
-        help="Target URL"
+        default=[],
+        help="Target URL (repeat to scan several targets)"
+    )
+    http.add_argument(
+        "-U", "--url-file",
+        type=pv.is_valid_path,
+        default=None,
+        help="Path to a file of target URLs, one per line"
     )
     http.add_argument(
         "-X", "--method",
@@ -62,6 +71,13 @@ def parse_arguments() -> argparse.Namespace:
         default=None,
         help="Cookies for requests (e.g., 'key=value,key2=value2')"
     )
+    http.add_argument(
+        "-H", "--header",
+        action="append",
+        type=pv.is_header,
+        default=[],
+        help="Extra request header (repeatable) (e.g., 'X-Api-Key: FUZZ')"
+    )
     http.add_argument(
         "-p", "--params",
         type=pv.parse_key_value_string,
@@ -74,14 +90,69 @@ def parse_arguments() -> argparse.Namespace:
         default=None,
         help="Request body data (for POST, PUT, etc.) (e.g., 'key=value,key2=value2')"
     )
+    http.add_argument(
+        "--probe",
+        type=pv.is_probe_mode,
+        default=df.DEFAULT_PROBE,
+        help="'method' sends the configured method; 'head' sends HEAD first and GET only for matching statuses"
+    )
+    http.add_argument(
+        "--body-policy",
+        type=pv.is_body_policy,
+        default=df.DEFAULT_BODY_POLICY,
+        help="Response bodies: 'drain' discards up to --body-limit bytes to keep the connection, "
+             "'keep' reads them and writes them to JSONL output, 'close' drops the connection"
+    )
+    http.add_argument(
+        "--body-limit",
+        type=pv.is_positive_number,
+        default=df.DEFAULT_BODY_LIMIT,
+        help="Maximum response body bytes read per request; larger bodies close the connection"
+    )
+    http.add_argument(
+        "--keepalive-timeout",
+        type=pv.is_positive_float,
+        default=df.DEFAULT_KEEPALIVE_TIMEOUT,
+        help="Seconds an idle connection stays in the pool"
+    )
+    http.add_argument(
+        "--prewarm",
+        type=pv.is_non_negative,
+        default=0,
+        help="Connections to open to each host before the scan starts"
+    )
 
     # ========= General Options ==========
     general = parser.add_argument_group("General Option")
     general.add_argument(
         "-c", "--concurrency",
-        type=pv.is_positive_number,
+        type=pv.is_concurrency,
         default=df.DEFAULT_CONCURRENCY,
-        help="Number of concurrent threads"
+        help="Number of concurrent threads, or 'auto' to adapt it to the target"
+    )
+    general.add_argument(
+        "--min-concurrency",
+        type=pv.is_positive_number,
+        default=df.DEFAULT_MIN_CONCURRENCY,
+        help="Lower bound for --concurrency auto"
+    )
+    general.add_argument(
+        "--max-concurrency",
+        type=pv.is_positive_number,
+        default=df.DEFAULT_MAX_CONCURRENCY,
+        help="Upper bound for --concurrency auto"
+    )
+    general.add_argument(
+        "--host-concurrency",
+        type=pv.is_positive_number,
+        default=None,
+        help="Maximum concurrent requests per host (default: fair share of --concurrency)"
+    )
+    general.add_argument(
+        "--workers",
+        type=pv.is_positive_number,
+        default=df.DEFAULT_WORKERS,
+        help="Number of scanner processes; the wordlist, concurrency and rate limits are split between them"
     )
     general.add_argument(
         "-y", "--retry",
@@ -89,14 +160,109 @@ def parse_arguments() -> argparse.Namespace:
         default=df.DEFAULT_RETRY,
         help="Number of times to retry failed requests"
     )
+    general.add_argument(
+        "--retry-backoff",
+        type=pv.is_positive_float,
+        default=df.DEFAULT_RETRY_BACKOFF,
+        help="Base delay in seconds for exponential backoff between retries"
+    )
+    general.add_argument(
+        "--retry-max-delay",
+        type=pv.is_positive_float,
+        default=df.DEFAULT_RETRY_MAX_DELAY,
+        help="Maximum delay in seconds between retries"
+    )
+    general.add_argument(
+        "--retry-budget",
+        type=pv.is_ratio,
+        default=df.DEFAULT_RETRY_BUDGET,
+        help="Maximum retries as a fraction of requests (e.g., 0.1 for 10%%)"
+    )
+    general.add_argument(
+        "-D", "--depth",
+        type=pv.is_non_negative,
+        nargs="?",
+        const=df.DEFAULT_CRAWL,
+        default=0,
+        help=f"Recurse into discovered directories up to this depth (alone: {df.DEFAULT_CRAWL})"
+    )
+    general.add_argument(
+        "--depth-limit",
+        type=pv.is_positive_number,
+        default=df.DEFAULT_DEPTH_LIMIT,
+        help="Maximum number of directories queued for recursion at each depth"
+    )
+    general.add_argument(
+        "--rate",
+        type=pv.is_positive_float,
+        default=None,
+        help="Maximum requests per second across all targets"
+    )
+    general.add_argument(
+        "--host-rate",
+        type=pv.is_positive_float,
+        default=None,
+        help="Maximum requests per second to each host"
+    )
+    general.add_argument(
+        "--burst",
+        type=pv.is_positive_number,
+        default=None,
+        help="Requests allowed in a burst above the rate (default: a tenth of a second's worth)"
+    )
     
     # ========= Input Options ==========
     input = parser.add_argument_group("Input Options")
     input.add_argument(
         "-w", "--wordlist",
-        type=pv.is_valid_path,
-        default=df.DEFAULT_WORDLIST,
-        help="Path to Wordlist file"
+        type=pv.is_valid_paths,
+        default=[str(df.DEFAULT_WORDLIST)],
+        help="Path to Wordlist file, or several comma-separated files (.gz supported); "
+             "'file:KEYWORD' fills KEYWORD wherever it appears in the URL, headers, params, data or cookie "
+             "instead of appending to the URL (default keyword: FUZZ)"
+    )
+    input.add_argument(
+        "--mode",
+        type=pv.is_fuzz_mode,
+        default=df.DEFAULT_FUZZ_MODE,
+        help="How several keyword wordlists combine: 'clusterbomb' tries every combination, "
+             "'pitchfork' pairs their n-th words"
+    )
+    input.add_argument(
+        "--mmap",
+        action="store_true",
+        default=False,
+        help="Memory-map uncompressed wordlist files while reading them"
+    )
+    input.add_argument(
+        "-e", "--extensions",
+        type=pv.parse_list,
+        default=[],
+        help="Also try each word with these extensions (e.g., 'php,bak,~')"
+    )
+    input.add_argument(
+        "--prefixes",
+        type=pv.parse_list,
+        default=[],
+        help="Also try each word with these prefixes (e.g., '.,_,old_')"
+    )
+    input.add_argument(
+        "--suffixes",
+        type=pv.parse_list,
+        default=[],
+        help="Also try each word with these suffixes, before any extension (e.g., '_old,-backup')"
+    )
+    input.add_argument(
+        "--case",
+        type=pv.is_case_list,
+        default=[],
+        help=f"Also try each word in these cases ({', '.join(df.ALLOW_CASE)})"
+    )
+    input.add_argument(
+        "--number-range",
+        type=pv.is_number_range,
+        default=None,
+        help="Also try each word followed by every number in START-END, before any extension (e.g., '1-10', '001-100')"
     )
     input.add_argument(
         "-a", "--user-agent",
@@ -125,6 +291,36 @@ def parse_arguments() -> argparse.Namespace:
         default=None,
         help="Save output to file (.txt, .log, .json, etc.)"
     )
+    output.add_argument(
+        "--checkpoint",
+        default=None,
+        help="Periodically save scan progress to this state file"
+    )
+    output.add_argument(
+        "--checkpoint-interval",
+        type=pv.is_positive_float,
+        default=df.DEFAULT_CHECKPOINT_INTERVAL,
+        help="Seconds between checkpoints"
+    )
+    output.add_argument(
+        "--resume",
+        type=pv.is_valid_path,
+        default=None,
+        help="Resume the scan saved in this state file, appending to its outputs"
+    )
+    output.add_argument(
+        "--progress",
+        type=pv.is_positive_float,
+        nargs="?",
+        const=df.DEFAULT_PROGRESS_INTERVAL,
+        default=None,
+        help=f"Print a progress line every this many seconds (alone: {df.DEFAULT_PROGRESS_INTERVAL:g})"
+    )
+    output.add_argument(
+        "--metrics-file",
+        default=None,
+        help="Keep Prometheus-format scan metrics in this file, refreshed every progress interval"
+    )
     
     # ========== Filter Options ==========
     filters = parser.add_argument_group("filter option")
@@ -134,7 +330,83 @@ def parse_arguments() -> argparse.Namespace:
         default=", ".join(map(str, df.DEFAULT_STATUS_CODES)),
         help=f"Filter status codes (comma-separated)."
     )
+    filters.add_argument(
+        "--filter-codes",
+        type=pv.is_status_codes,
+        default=[],
+        help="Drop responses with these status codes (comma-separated)"
+    )
+    for name, measure in (("size", "body size in bytes"), ("words", "word count"), ("lines", "line count"),
+                          ("time", "response time in milliseconds")):
+        filters.add_argument(
+            f"--match-{name}",
+            type=pv.is_ranges,
+            default=None,
+            help=f"Keep only responses whose {measure} is in these values or ranges (e.g., '0,100-200,1000-')"
+        )
+        filters.add_argument(
+            f"--filter-{name}",
+            type=pv.is_ranges,
+            default=None,
+            help=f"Drop responses whose {measure} is in these values or ranges"
+        )
+    filters.add_argument(
+        "--match-type",
+        type=pv.parse_list,
+        default=[],
+        help="Keep only responses whose Content-Type contains one of these (e.g., 'json,html')"
+    )
+    filters.add_argument(
+        "--filter-type",
+        type=pv.parse_list,
+        default=[],
+        help="Drop responses whose Content-Type contains one of these"
+    )
+    filters.add_argument(
+        "--match-regex",
+        type=pv.is_regex,
+        default=None,
+        help="Keep only responses whose body, up to --body-limit bytes, matches this regular expression"
+    )
+    filters.add_argument(
+        "--filter-regex",
+        type=pv.is_regex,
+        default=None,
+        help="Drop responses whose body, up to --body-limit bytes, matches this regular expression"
+    )
+    filters.add_argument(
+        "--calibrate",
+        action="store_true",
+        default=False,
+        help="Probe random paths first and discard wildcard / soft-404 responses"
+    )
+    filters.add_argument(
+        "--calibration-samples",
+        type=pv.is_positive_number,
+        default=df.DEFAULT_CALIBRATION_SAMPLES,
+        help="Number of random paths probed per target during calibration"
+    )
     
     args = parser.parse_args()
     
+    targets = list(args.url)
+    if args.url_file:
+        try:
+            targets.extend(pv.is_valid_url(target) for target in load_targets(args.url_file))
+        except argparse.ArgumentTypeError as e:
+            parser.error(f"argument -U/--url-file: {e}")
+    if not targets and not args.resume:
+        parser.error("one of the arguments -u/--url -U/--url-file is required")
+    args.url = list(dict.fromkeys(targets))
+    args.header = dict(args.header)
+    keywords = wordlist_keywords(args.wordlist)
+    placed = placed_keywords(keywords, request_texts(args.url, args.header, args.params, args.data, args.cookie))
+    if (placed or len(keywords) > 1) and len(placed) < len(keywords):
+        unused = ", ".join(k for k in keywords if k not in placed)
+        parser.error(f"keyword {unused} does not appear in the URL, headers, params, data or cookie")
+    if placed and args.depth:
+        parser.error("-D/--depth cannot be combined with keyword placement")
+    if args.concurrency == "auto" and args.min_concurrency > args.max_concurrency:
+        parser.error("--min-concurrency must not exceed --max-concurrency")
+    
     return args
\ No newline at end of file
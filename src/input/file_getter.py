@@ -6,14 +6,514 @@ Author: WaiBui
 License: MIT
 """
 
-def load_wordlist(wordlist_path: str = 'data/common.txt') -> list[str]:
-    """Load a Wordlist from file."""
-    return _load_lines_from_file(wordlist_path)
+import os
+import gzip
+import json
+import mmap
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+import weakref
+from array import array
+from bisect import bisect_right
+from itertools import islice
+from typing import Iterator, Optional
+from src.input.mutation import Mutator
+
+# Files of a spool directory: the words, their offset index, and the final counts
+SPOOL_WORDS = "words"
+SPOOL_INDEX = "index"
+SPOOL_DONE = "done"
+# Words between two index records
+SPOOL_INDEX_STRIDE = 256
+# Words in the first flushed batch of a spool, and the most in any batch
+SPOOL_FIRST_BATCH = 64
+SPOOL_MAX_BATCH = 65536
+# Pause between checks of a thread waiting for the spool writer
+SPOOL_POLL_INTERVAL = 0.005
+
+def load_wordlist(wordlist_paths: list[str] | str = 'data/common.txt', use_mmap: bool = False,
+                  mutator: Optional[Mutator] = None) -> "Wordlist":
+    """Load a lazy, deduplicated Wordlist from one or more files, expanded by `mutator` if given."""
+    if isinstance(wordlist_paths, str):
+        wordlist_paths = [wordlist_paths]
+    return Wordlist(wordlist_paths, use_mmap=use_mmap, mutator=mutator)
+
+def load_targets(targets_path: str) -> list[str]:
+    """Load target URLs from file, one per line, skipping blank lines and comments."""
+    return [
+        line.strip() for line in _load_lines_from_file(targets_path)
+        if line.strip() and not line.strip().startswith('#')
+    ]
 
 def load_user_agents(user_agent_path: str = 'data/user_agent.txt') -> list[str]:
     """Load a User-Agent from file."""
     return _load_lines_from_file(user_agent_path)
 
+def fingerprint(value: bytes) -> int:
+    """Return a compact 64-bit fingerprint of a value, stable across processes."""
+    return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "little")
+
+class FingerprintSet:
+    """
+    Open-addressing set of 64-bit fingerprints stored in a flat array.
+
+    Each slot costs 8 bytes, against roughly 60 bytes per entry for a
+    built-in set of ints. Zero marks an empty slot, so it is remapped to 1.
+    """
+    def __init__(self, capacity: int = 1024):
+        size = 16
+        while size < capacity * 2:
+            size <<= 1
+        self._slots = array('Q', bytes(8 * size))
+        self._mask = size - 1
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __contains__(self, key: int) -> bool:
+        key = key or 1
+        slots, mask = self._slots, self._mask
+        i = key & mask
+        while True:
+            value = slots[i]
+            if value == key:
+                return True
+            if value == 0:
+                return False
+            i = (i + 1) & mask
+
+    def add(self, key: int) -> bool:
+        """Add a fingerprint, returning False if it was already present."""
+        key = key or 1
+        slots, mask = self._slots, self._mask
+        i = key & mask
+        while True:
+            value = slots[i]
+            if value == key:
+                return False
+            if value == 0:
+                break
+            i = (i + 1) & mask
+        slots[i] = key
+        self._len += 1
+        if self._len * 2 > len(slots):
+            self._grow()
+        return True
+
+    def _grow(self):
+        old = self._slots
+        self._slots = array('Q', bytes(16 * len(old)))
+        self._mask = len(self._slots) - 1
+        self._len = 0
+        for key in old:
+            if key:
+                self.add(key)
+
+class Wordlist:
+    """
+    Stream normalized, deduplicated paths from one or more wordlist files.
+
+    Files ending in .gz are decompressed on the fly; plain files may be
+    memory-mapped. Blank lines and '#' comments are skipped, leading slashes
+    are dropped, and duplicates are removed using a FingerprintSet instead of
+    keeping the paths themselves. Nothing is materialized: every spool
+    re-reads the files. With a Mutator, each unique word stands for all the
+    candidates it expands to, which are generated only as they are read.
+    """
+    def __init__(self, paths: list[str], use_mmap: bool = False, mutator: Optional[Mutator] = None):
+        self.paths = list(paths)
+        self.use_mmap = use_mmap
+        self.mutator = mutator
+        self._count: Optional[int] = None
+
+    def spool(self, shard_index: int = 0, shard_count: int = 1) -> "WordSpool":
+        """
+        Start writing the unique paths to a spool directory on a background
+        thread and return the spool right away, so the scan can begin on the
+        first words while the rest are still being read and deduplicated.
+        The spool is indexed for shard_count shards, and the returned one
+        yields every shard_count-th unique path starting at shard_index;
+        other processes open the same directory with WordSpool.open.
+        Mutations are not written out; cursors expand each word as they
+        reach it.
+        """
+        for path in self.paths:
+            try:
+                open(path, 'rb').close()
+            except OSError as e:
+                raise RuntimeError(f"Failed to load wordlist from file: {path}") from e
+        directory = tempfile.mkdtemp(prefix="fwf-spool-")
+        words_file = open(os.path.join(directory, SPOOL_WORDS), 'wb')
+        index_file = open(os.path.join(directory, SPOOL_INDEX), 'wb')
+        stop = threading.Event()
+        writer = threading.Thread(target=self._write_spool, args=(directory, words_file, index_file, shard_count, stop),
+                                  name="fwf-spool", daemon=True)
+        writer.start()
+        return WordSpool(directory, self.mutator, shard_index, shard_count, writer=(writer, stop))
+
+    def _write_spool(self, directory: str, words_file, index_file, shard_count: int, stop: threading.Event):
+        """Fill a spool, then record its counts, or the error that ended it, in its done file."""
+        try:
+            done = self._fill_spool(words_file, index_file, shard_count, stop)
+        except Exception as e:
+            done = {"error": str(e)}
+        finally:
+            words_file.close()
+            index_file.close()
+        if done is not None:
+            temporary = os.path.join(directory, SPOOL_DONE + ".tmp")
+            with open(temporary, 'w') as f:
+                json.dump(done, f)
+            os.replace(temporary, os.path.join(directory, SPOOL_DONE))
+
+    def _fill_spool(self, words_file, index_file, shard_count: int, stop: threading.Event) -> Optional[dict]:
+        """
+        Append each unique word as a line, and every SPOOL_INDEX_STRIDE-th
+        word an index record of its offset and of the candidates each shard
+        has before it. Lines are flushed in batches that start small and
+        double, and index records only after the lines they point to.
+        """
+        seen = FingerprintSet(self._count or 1024)
+        candidates = [0] * shard_count
+        records = array('q')
+        offset = unique = 0
+        batch = flush_at = SPOOL_FIRST_BATCH
+        for word in self._iter_normalized():
+            if not seen.add(fingerprint(word)):
+                continue
+            if unique % SPOOL_INDEX_STRIDE == 0:
+                records.append(offset)
+                records.extend(candidates)
+            words_file.write(word + b'\n')
+            offset += len(word) + 1
+            candidates[unique % shard_count] += self.mutator.count(word) if self.mutator else 1
+            unique += 1
+            if unique >= flush_at:
+                if stop.is_set():
+                    return None
+                _flush_spool(words_file, index_file, records)
+                batch = min(batch * 2, SPOOL_MAX_BATCH)
+                flush_at = unique + batch
+        _flush_spool(words_file, index_file, records)
+        self._count = unique
+        return {"words": unique, "candidates": candidates}
+
+    def _iter_normalized(self) -> Iterator[bytes]:
+        for path in self.paths:
+            for line in self._iter_raw_lines(path):
+                word = line.strip()
+                if not word or word.startswith(b'#'):
+                    continue
+                word = word.lstrip(b'/')
+                if word:
+                    yield word
+
+    def _iter_raw_lines(self, path: str) -> Iterator[bytes]:
+        try:
+            if path.endswith('.gz'):
+                with gzip.open(path, 'rb') as f:
+                    yield from f
+            elif self.use_mmap:
+                with open(path, 'rb') as f:
+                    if f.seek(0, 2) == 0:
+                        return
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        yield from iter(mm.readline, b'')
+            else:
+                with open(path, 'rb') as f:
+                    yield from f
+        except OSError as e:
+            raise RuntimeError(f"Failed to load wordlist from file: {path}") from e
+
+def _flush_spool(words_file, index_file, records: array):
+    words_file.flush()
+    if records:
+        index_file.write(records.tobytes())
+        index_file.flush()
+        del records[:]
+
+class WordSpool:
+    """
+    Unique paths in a spool directory that another thread, or another
+    process, may still be writing.
+
+    The words file holds one path per line and is memory-mapped, and mapped
+    again further whenever a reader reaches the end of what it has mapped.
+    The index file holds a record every SPOOL_INDEX_STRIDE words with the
+    word's offset and the candidates of each shard before it, so a cursor
+    starts at any index after a short walk. The done file appears once the
+    writer has finished, with the final counts.
+
+    Any number of WordCursor objects can walk the spool independently, each
+    holding only an index and a byte offset, so scanning the same wordlist
+    against many targets costs no extra memory per target. A cursor that
+    overtakes the writer raises BlockingIOError instead of waiting, since it
+    is read on the event loop, and can be asked for its next word again once
+    grow() returns on another thread. `count` is the number of candidates
+    this shard's cursors yield, which with a Mutator is larger than the
+    number of words, and is None until the writer has finished.
+    """
+    def __init__(self, directory: str, mutator: Optional[Mutator] = None, shard_index: int = 0, shard_count: int = 1,
+                 writer: Optional[tuple[threading.Thread, threading.Event]] = None):
+        self.directory = directory
+        self.mutator = mutator
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self._writer = writer
+        self._words_file = open(os.path.join(directory, SPOOL_WORDS), 'rb')
+        self._index_file = open(os.path.join(directory, SPOOL_INDEX), 'rb')
+        self._index = array('q')
+        self._index_tail = b''
+        self._mm: Optional[mmap.mmap] = None
+        self._mapped = 0
+        self._done: Optional[dict] = None
+        # the spool that writes a directory removes it when closed, or at exit if it never is
+        self._cleanup = weakref.finalize(self, shutil.rmtree, directory, True) if writer is not None else None
+
+    @classmethod
+    def open(cls, directory: str, mutator: Optional[Mutator] = None, shard_index: int = 0,
+             shard_count: int = 1) -> "WordSpool":
+        """Open a spool another process is writing; shard_count must match the one it was written for."""
+        return cls(directory, mutator, shard_index, shard_count)
+
+    @property
+    def count(self) -> Optional[int]:
+        if self._poll_done() is None:
+            return None
+        return self._done["candidates"][self.shard_index]
+
+    @property
+    def spooled(self) -> int:
+        """
+        The candidates of this shard known so far: `count` once the writer is
+        done, a lower bound before. A closed spool reports what it last read.
+        """
+        count = self.count
+        if count is not None:
+            return count
+        if not self._index_file.closed:
+            self._read_index()
+        width = self.shard_count + 1
+        return self._index[len(self._index) - width + self.shard_index + 1] if self._index else 0
+
+    @property
+    def total(self) -> Optional[int]:
+        """The candidates of every shard together, None until the writer has finished."""
+        if self._poll_done() is None:
+            return None
+        return sum(self._done["candidates"])
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        """Block until the writer has finished, or `timeout` seconds have passed, and return `count`."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while self._poll_done() is None:
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(SPOOL_POLL_INTERVAL)
+        return self.count
+
+    def cursor(self, start: int = 0, skip: Optional[set[int]] = None) -> "WordCursor | MutatedCursor":
+        if self.mutator:
+            return MutatedCursor(self, start, skip)
+        return WordCursor(self, start, skip)
+
+    def seek(self, start: int) -> tuple[int, int, int]:
+        """
+        Return the offset and word number of the last indexed word at or
+        before candidate `start` of this shard, with the candidate index it
+        begins at.
+        """
+        if start <= 0:
+            return 0, 0, 0
+        self._read_index()
+        width, column = self.shard_count + 1, self.shard_index + 1
+        index = self._index
+        record = bisect_right(range(len(index) // width), start, key=lambda r: index[r * width + column]) - 1
+        if record < 0:
+            return 0, 0, 0
+        return index[record * width], record * SPOOL_INDEX_STRIDE, index[record * width + column]
+
+    def line(self, offset: int) -> Optional[tuple[bytes, int]]:
+        """
+        Return the word starting at `offset` and the offset after it, or
+        None past the last word. Raises BlockingIOError if the writer has
+        not got that far yet.
+        """
+        while True:
+            mm = self._mm
+            if mm is not None:
+                end = mm.find(b'\n', offset)
+                if end >= 0:
+                    return mm[offset:end], end + 1
+            if not self._remap():
+                if self._done is not None:
+                    return None
+                raise BlockingIOError(f"Wordlist spool has no word at offset {offset} yet")
+
+    def grow(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until the writer has added words beyond those mapped or has
+        finished, or `timeout` seconds have passed; True unless it timed out.
+        Only looks at the files, so it can run on a thread while the spool
+        is read elsewhere.
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        words = os.path.join(self.directory, SPOOL_WORDS)
+        done = os.path.join(self.directory, SPOOL_DONE)
+        while True:
+            try:
+                if os.path.exists(done) or os.path.getsize(words) > self._mapped:
+                    return True
+            except OSError:
+                # the spool was closed and removed; let the reader find out
+                return True
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(SPOOL_POLL_INTERVAL)
+
+    def _remap(self) -> bool:
+        """Map the words written since the last call; False if there are none."""
+        # the done file is checked before the size, so once it exists the size read is final
+        self._poll_done()
+        size = os.fstat(self._words_file.fileno()).st_size
+        if size <= self._mapped:
+            return False
+        self._mm = mmap.mmap(self._words_file.fileno(), size, access=mmap.ACCESS_READ)
+        self._mapped = size
+        return True
+
+    def _read_index(self):
+        data = self._index_file.read()
+        if data:
+            data = self._index_tail + data
+            whole = len(data) - len(data) % (8 * (self.shard_count + 1))
+            self._index.frombytes(data[:whole])
+            self._index_tail = data[whole:]
+
+    def _poll_done(self) -> Optional[dict]:
+        if self._done is None:
+            try:
+                with open(os.path.join(self.directory, SPOOL_DONE)) as f:
+                    self._done = json.load(f)
+            except FileNotFoundError:
+                return None
+            if "error" in self._done:
+                raise RuntimeError(self._done["error"])
+        return self._done
+
+    def close(self):
+        if self._writer is not None:
+            thread, stop = self._writer
+            stop.set()
+            thread.join()
+        if self._mm is not None:
+            self._mm.close()
+        self._words_file.close()
+        self._index_file.close()
+        if self._cleanup is not None:
+            self._cleanup()
+
+class WordCursor:
+    """
+    Iterator over a WordSpool yielding (index, path) pairs, optionally
+    starting at a given index and passing over indices listed in `skip`.
+    `offset` and `number` locate the next word of the spool, of any shard.
+    The walk from the nearest indexed word to `start` happens on the first
+    read, and like every read it can be retried after a BlockingIOError.
+    """
+    def __init__(self, spool: WordSpool, start: int = 0, skip: Optional[set[int]] = None):
+        self.spool = spool
+        self._skip = skip
+        self._start = start
+        self.offset, self.number, self.index = spool.seek(start)
+
+    def next_word(self) -> Optional[bytes]:
+        """Return the next word of the spool's shard, or None past the last one."""
+        spool = self.spool
+        while True:
+            line = spool.line(self.offset)
+            if line is None:
+                return None
+            word, self.offset = line
+            number = self.number
+            self.number += 1
+            if number % spool.shard_count == spool.shard_index:
+                return word
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> tuple[int, str]:
+        while self.index < self._start:
+            if self.next_word() is None:
+                raise StopIteration
+            self.index += 1
+        word = self.next_word()
+        if self._skip:
+            while word is not None and self.index in self._skip:
+                self._skip.discard(self.index)
+                self.index += 1
+                word = self.next_word()
+        if word is None:
+            raise StopIteration
+        index = self.index
+        self.index += 1
+        return index, word.decode('utf-8', errors='replace')
+
+class MutatedCursor:
+    """
+    Iterator over a WordSpool yielding (index, candidate) pairs, where the
+    candidates of each word come from the spool's Mutator and indices count
+    candidates rather than words. Starting at an index jumps to the nearest
+    indexed word, then, on the first read, skips whole words by their
+    candidate count without expanding them.
+    """
+    def __init__(self, spool: WordSpool, start: int = 0, skip: Optional[set[int]] = None):
+        self.spool = spool
+        self._words = WordCursor(spool)
+        self._words.offset, self._words.number, self.index = spool.seek(start)
+        self._mutator = spool.mutator
+        self._skip = skip
+        self._start: Optional[int] = start
+        self._variants: Iterator[str] = iter(())
+
+    def _seek(self):
+        """Walk to the candidate at `start`; a word is only counted once it is read, so this can be retried."""
+        start = self._start
+        while True:
+            _, word = next(self._words)
+            if self.index >= start:
+                self._variants = self._mutator.variants(word)
+                break
+            count = self._mutator.count(word)
+            if self.index + count > start:
+                self._variants = islice(self._mutator.variants(word), start - self.index, None)
+                self.index = start
+                break
+            self.index += count
+        self._start = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> tuple[int, str]:
+        if self._start is not None:
+            self._seek()
+        while True:
+            for candidate in self._variants:
+                index = self.index
+                self.index += 1
+                if self._skip and index in self._skip:
+                    self._skip.discard(index)
+                    continue
+                return index, candidate
+            _, word = next(self._words)
+            self._variants = self._mutator.variants(word)
+
 def _load_lines_from_file(path: str):
     """Read all lines from a file asynchronously and return as a list."""
     try:
@@ -21,4 +521,4 @@ def _load_lines_from_file(path: str):
             lines = f.read()
             return lines.splitlines()
     except Exception as e:
-        raise RuntimeError(f"Failed to load wordlist from file: {path}") from e
\ No newline at end of file
+        raise RuntimeError(f"Failed to load wordlist from file: {path}") from e
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import re
+import time
+from itertools import islice
+from math import prod
+from typing import Iterable, Iterator, Optional
+
+from src.models.config import ScanConfig
+from src.input.mutation import Mutator
+from src.input.file_getter import WordSpool, load_wordlist
+from src.constants.default import DEFAULT_FUZZ_KEYWORD
+
+# A wordlist given as 'path:KEYWORD' fills the placeholder KEYWORD
+_KEYWORD_SPEC = re.compile(r"^(.+):([A-Z][A-Z0-9_]*)$")
+
+def split_keyword(spec: str) -> tuple[str, Optional[str]]:
+    """Split 'words.txt:USER' into ('words.txt', 'USER'); a plain path has no keyword."""
+    match = _KEYWORD_SPEC.match(spec)
+    return (match.group(1), match.group(2)) if match else (spec, None)
+
+def wordlist_keywords(specs: list[str]) -> dict[str, list[str]]:
+    """Group wordlist files by keyword, in order of first appearance; files without one fill FUZZ."""
+    keywords: dict[str, list[str]] = {}
+    for spec in specs:
+        path, keyword = split_keyword(spec)
+        keywords.setdefault(keyword or DEFAULT_FUZZ_KEYWORD, []).append(path)
+    return keywords
+
+def request_texts(urls: list[str], headers: Optional[dict] = None, params: Optional[dict] = None,
+                  data: Optional[dict] = None, cookie: Optional[str] = None) -> list[str]:
+    """Every part of a request a keyword may be placed in."""
+    texts = list(urls)
+    for fields in (headers, params, data):
+        for key, value in (fields or {}).items():
+            texts.extend((key, value))
+    if cookie:
+        texts.append(cookie)
+    return texts
+
+def placed_keywords(keywords: Iterable[str], texts: list[str]) -> list[str]:
+    return [keyword for keyword in keywords if any(keyword in text for text in texts)]
+
+def config_placed_keywords(config: ScanConfig) -> list[str]:
+    """Return the wordlist keywords that appear somewhere in the request; none means words are appended to the URL."""
+    texts = request_texts(config.urls, config.headers, config.params, config.data, config.cookie)
+    return placed_keywords(wordlist_keywords(config.wordlist), texts)
+
+def combination_count(counts: list[int], mode: str) -> int:
+    if not counts:
+        return 0
+    return min(counts) if mode == "pitchfork" else prod(counts)
+
+class FuzzSpace:
+    """
+    Combinations of several keyword wordlists, one word from each.
+
+    'clusterbomb' yields every combination, the last wordlist varying
+    fastest; 'pitchfork' pairs the n-th words of all lists and stops at the
+    shortest. Combinations are generated from the spools' cursors as they
+    are read and never stored, and the combination at any index can be
+    reached by arithmetic, so checkpoints resume without replaying the
+    product. With shard_count > 1 only every shard_count-th combination,
+    starting at shard_index, is yielded, indexed from zero. The arithmetic
+    needs the length of every list, so a FuzzSpace waits for its spools to
+    finish.
+    """
+    def __init__(self, spools: list[WordSpool], mode: str, shard_index: int = 0, shard_count: int = 1):
+        self.spools = spools
+        self.mode = mode
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+        self.total = combination_count([spool.wait() for spool in spools], mode)
+        self.count = len(range(shard_index, self.total, shard_count))
+        self.spooled = self.count
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        return self.count
+
+    def cursor(self, start: int = 0, skip: Optional[set[int]] = None) -> "FuzzCursor":
+        return FuzzCursor(self, start, skip)
+
+    def close(self):
+        for spool in self.spools:
+            spool.close()
+
+    def combinations(self, start: int = 0) -> Iterator[tuple[str, ...]]:
+        """Yield the combinations from global index `start` on."""
+        if start >= self.total:
+            return
+        if self.mode == "pitchfork":
+            cursors = [spool.cursor(start) for spool in self.spools]
+            for pairs in zip(*cursors):
+                yield tuple(word for _, word in pairs)
+            return
+        digits = []
+        for spool in reversed(self.spools):
+            start, digit = divmod(start, spool.count)
+            digits.append(digit)
+        yield from self._product(0, digits[::-1], ())
+
+    def _product(self, level: int, digits: Optional[list[int]], prefix: tuple) -> Iterator[tuple[str, ...]]:
+        last = level == len(self.spools) - 1
+        for _, word in self.spools[level].cursor(digits[level] if digits else 0):
+            if last:
+                yield prefix + (word,)
+            else:
+                yield from self._product(level + 1, digits, prefix + (word,))
+            # only the first pass through the inner lists starts part-way
+            digits = None
+
+class FuzzCursor:
+    """Iterator over a FuzzSpace yielding (index, words) pairs, passing over indices listed in `skip`."""
+    def __init__(self, space: FuzzSpace, start: int = 0, skip: Optional[set[int]] = None):
+        self._skip = skip
+        self.index = start
+        step = space.shard_count
+        self._combinations = islice(space.combinations(space.shard_index + start * step), 0, None, step)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> tuple[int, tuple[str, ...]]:
+        while True:
+            words = next(self._combinations)
+            index = self.index
+            self.index += 1
+            if self._skip and index in self._skip:
+                self._skip.discard(index)
+                continue
+            return index, words
+
+def load_paths(config: ScanConfig, shard_index: int = 0, shard_count: int = 1,
+               spools: Optional[list[str]] = None) -> WordSpool | FuzzSpace:
+    """
+    Spool the wordlists of a scan, or open the spool directories another
+    process is writing for them. A single keyword gives a WordSpool of
+    words; several give a FuzzSpace of their combinations in config.fuzz_mode.
+    """
+    mutator = Mutator.from_config(config)
+    keywords = wordlist_keywords(config.wordlist)
+    if spools is not None:
+        if len(keywords) == 1:
+            return WordSpool.open(spools[0], mutator, shard_index, shard_count)
+        return FuzzSpace([WordSpool.open(directory, mutator) for directory in spools], config.fuzz_mode,
+                         shard_index, shard_count)
+    if len(keywords) == 1:
+        paths = next(iter(keywords.values()))
+        return load_wordlist(paths, use_mmap=config.wordlist_mmap, mutator=mutator).spool(shard_index, shard_count)
+    spools = [load_wordlist(paths, use_mmap=config.wordlist_mmap, mutator=mutator).spool()
+              for paths in keywords.values()]
+    return FuzzSpace(spools, config.fuzz_mode, shard_index, shard_count)
+
+def spool_paths(config: ScanConfig, shard_count: int) -> list[WordSpool]:
+    """
+    Start spooling every keyword wordlist for worker processes to open with
+    load_paths. A single list is indexed for shard_count shards; the lists
+    of a FuzzSpace are read whole by every worker, which shards their
+    combinations instead.
+    """
+    mutator = Mutator.from_config(config)
+    keywords = wordlist_keywords(config.wordlist)
+    shards = shard_count if len(keywords) == 1 else 1
+    return [load_wordlist(paths, use_mmap=config.wordlist_mmap, mutator=mutator).spool(0, shards)
+            for paths in keywords.values()]
+
+def spooled_total(spools: list[WordSpool], mode: str, timeout: float = 0.0) -> Optional[int]:
+    """
+    Return the words or combinations the spools of spool_paths make up,
+    waiting up to `timeout` seconds for them to finish; None if they have not.
+    """
+    deadline = time.monotonic() + timeout
+    totals = []
+    for spool in spools:
+        spool.wait(max(0.0, deadline - time.monotonic()))
+        totals.append(spool.total)
+    if None in totals:
+        return None
+    return totals[0] if len(totals) == 1 else combination_count(totals, mode)
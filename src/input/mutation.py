@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+from typing import Iterator, Optional
+
+# Case transforms applied to a word besides the word as written
+CASE_TRANSFORMS = {
+    "lower": str.lower,
+    "upper": str.upper,
+    "capital": str.capitalize,
+}
+
+def parse_number_range(value: str) -> tuple[range, int]:
+    """
+    Parse 'START-END' into an inclusive range and a zero-padding width;
+    a start written with a leading zero, as in '001-100', pads to its length.
+    """
+    start, sep, end = value.partition('-')
+    if not sep or not start.isdigit() or not end.isdigit() or int(start) > int(end):
+        raise ValueError(f"Invalid number range '{value}'. Use START-END, e.g. 1-100 or 001-100")
+    width = len(start) if len(start) > 1 and start.startswith('0') else 0
+    return range(int(start), int(end) + 1), width
+
+def _extension(value: str) -> str:
+    """'php' becomes '.php'; values starting with punctuation, like '.bak' or '~', are appended as given."""
+    return f".{value}" if value[0].isalnum() else value
+
+class Mutator:
+    """
+    Expands each wordlist entry into candidate paths while the scan runs.
+
+    A word yields every combination of its case variants, a prefix, a
+    suffix or number, and an extension, where each list also includes the
+    empty choice, so the word as written always comes first:
+
+        prefix + case(word) + (suffix | number) + extension
+
+    Nothing is materialized. The number of candidates of a word is the
+    number of distinct case variants times a fixed block size, so counting
+    them only needs the words themselves. Case variants that coincide, such
+    as 'admin' and its lowercase form, are generated once.
+    """
+    def __init__(self, extensions: list[str] = (), prefixes: list[str] = (), suffixes: list[str] = (),
+                 cases: list[str] = (), number_range: Optional[str] = None):
+        self.extensions = ["", *dict.fromkeys(_extension(e) for e in extensions if e)]
+        self.prefixes = ["", *dict.fromkeys(p for p in prefixes if p)]
+        self.suffixes = ["", *dict.fromkeys(s for s in suffixes if s)]
+        self.cases = [CASE_TRANSFORMS[case] for case in dict.fromkeys(cases)]
+        self.numbers, self.width = parse_number_range(number_range) if number_range else (range(0), 0)
+        self.block = len(self.prefixes) * (len(self.suffixes) + len(self.numbers)) * len(self.extensions)
+
+    @classmethod
+    def from_config(cls, config) -> Optional["Mutator"]:
+        """Return the Mutator described by a ScanConfig, or None if it asks for no mutations."""
+        if not (config.extensions or config.prefixes or config.suffixes or config.case or config.number_range):
+            return None
+        return cls(config.extensions, config.prefixes, config.suffixes, config.case, config.number_range)
+
+    def case_variants(self, word: str) -> list[str]:
+        if not self.cases:
+            return [word]
+        return list(dict.fromkeys([word, *(transform(word) for transform in self.cases)]))
+
+    def count(self, word: str | bytes) -> int:
+        """Return the number of candidates a word expands to."""
+        if not self.cases:
+            return self.block
+        if isinstance(word, bytes):
+            word = word.decode('utf-8', errors='replace')
+        return len(self.case_variants(word)) * self.block
+
+    def variants(self, word: str) -> Iterator[str]:
+        for base in self.case_variants(word):
+            for prefix in self.prefixes:
+                for suffix in self._suffixes():
+                    stem = prefix + base + suffix
+                    for extension in self.extensions:
+                        yield stem + extension
+
+    def _suffixes(self) -> Iterator[str]:
+        yield from self.suffixes
+        width = self.width
+        for number in self.numbers:
+            yield f"{number:0{width}d}" if width else str(number)
@@ -13,28 +13,73 @@ from typing import Optional, List, Dict
 class ScanConfig:
     """Configuration object for FwF - Fast Web Fuzzer."""
     # HTTP Options
-    url: Optional[str] = None
+    urls: List[str] = field(default_factory=list)
     method: str = "GET"
     timeout: int = 10
     follow_redirects: bool = False
     cookie: Optional[str] = None
     params: Optional[Dict[str, str]] = None 
     data: Optional[Dict[str, str]] = None  
+    headers: Optional[Dict[str, str]] = None
+    probe: str = "method"
+    body_policy: str = "drain"
+    body_limit: int = 65536
+    keepalive_timeout: float = 15.0
+    prewarm: int = 0
     
     # General Options
     concurrency: int = 10
+    host_concurrency: Optional[int] = None
+    adaptive_concurrency: bool = False
+    min_concurrency: int = 1
+    workers: int = 1
+    rate: Optional[float] = None
+    host_rate: Optional[float] = None
+    burst: Optional[int] = None
     retry: int = 0
+    retry_backoff: float = 0.5
+    retry_max_delay: float = 30.0
+    retry_budget: Optional[float] = 0.1
+    depth: int = 0
+    depth_limit: Optional[int] = None
     
     # Input Options
-    wordlist: str = "wordlists/default.txt"
+    wordlist: List[str] = field(default_factory=lambda: ["wordlists/default.txt"])
+    wordlist_mmap: bool = False
+    extensions: List[str] = field(default_factory=list)
+    prefixes: List[str] = field(default_factory=list)
+    suffixes: List[str] = field(default_factory=list)
+    case: List[str] = field(default_factory=list)
+    number_range: Optional[str] = None
+    fuzz_mode: str = "clusterbomb"
     user_agent: str = "wordlists/user-agents.txt"
     
     # Output Options
     color: bool = False
     verbose: bool = False
     output: Optional[str] = None
+    checkpoint: Optional[str] = None
+    checkpoint_interval: float = 10.0
+    resume: Optional[str] = None
+    progress: Optional[float] = None
+    metrics_file: Optional[str] = None
     
     # Filter Options
+    calibrate: bool = False
+    calibration_samples: int = 3
     match_codes: List[int] = field(default_factory=lambda: [
         200, 201, 202, 203, 204, 301, 302, 307, 308, 401, 403
     ])
+    filter_codes: List[int] = field(default_factory=list)
+    match_size: Optional[str] = None
+    filter_size: Optional[str] = None
+    match_words: Optional[str] = None
+    filter_words: Optional[str] = None
+    match_lines: Optional[str] = None
+    filter_lines: Optional[str] = None
+    match_time: Optional[str] = None
+    filter_time: Optional[str] = None
+    match_type: List[str] = field(default_factory=list)
+    filter_type: List[str] = field(default_factory=list)
+    match_regex: Optional[str] = None
+    filter_regex: Optional[str] = None
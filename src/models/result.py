@@ -6,12 +6,10 @@ Author: WaiBui
 License: MIT
 """
 
-import time
-
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Optional
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """Represents the result of a path scan."""
     url: str
@@ -19,14 +17,51 @@ class ScanResult:
     content_length: int
     response_time: float
     content_type: Optional[str] = None
+    target: Optional[str] = None
+    redirect: Optional[str] = None
+    # Keyword words of the request, when its URL does not show them all
+    payload: Optional[str] = None
+    # Start of the response body, kept only with --body-policy keep and written to JSONL output
+    body: Optional[bytes] = None
     
     def __hash__(self):
         """Make ScanResult hashable for use in sets."""
-        return hash((self.url, self.path, self.status))
+        return hash((self.url, self.status))
     
     def __eq__(self, other):
         """Define equality for ScanResult objects."""
         if not isinstance(other, ScanResult):
             return False
         return (self.url == other.url and 
-                self.status == other.status)
\ No newline at end of file
+                self.status == other.status)
+
+    def to_dict(self) -> dict:
+        """Return the result as a plain dictionary suitable for serialization."""
+        data = {
+            "url": self.url,
+            "status": self.status,
+            "content_length": self.content_length,
+            "response_time": round(self.response_time, 3),
+            "content_type": self.content_type,
+            "target": self.target,
+            "redirect": self.redirect,
+        }
+        if self.payload is not None:
+            data["payload"] = self.payload
+        if self.body is not None:
+            data["body"] = self.body.decode("utf-8", errors="replace")
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScanResult":
+        """Rebuild a ScanResult from the output of to_dict."""
+        return cls(
+            url=data["url"],
+            status=data["status"],
+            content_length=data["content_length"],
+            response_time=data["response_time"],
+            content_type=data.get("content_type"),
+            target=data.get("target"),
+            redirect=data.get("redirect"),
+            payload=data.get("payload"),
+        )
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+from array import array
+from collections.abc import Sequence
+from typing import Iterable, Iterator, Optional
+
+from src.models.result import ScanResult
+from src.output.logger import Logger
+
+logger = Logger.get_instance()
+
+# Columns a store can be sorted and grouped by
+COLUMNS = ("url", "status", "content_length", "response_time", "content_type", "target", "redirect", "payload")
+LOW_CARDINALITY = ("status", "content_type", "target")
+
+class InternTable:
+    """Distinct strings of a column, numbered in order of first appearance; 0 stands for None."""
+    def __init__(self):
+        self.values: list[Optional[str]] = [None]
+        self._ids: dict[str, int] = {}
+
+    def intern(self, value: Optional[str]) -> int:
+        if value is None:
+            return 0
+        index = self._ids.get(value)
+        if index is None:
+            index = self._ids[value] = len(self.values)
+            self.values.append(value)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.values) - 1
+
+class ResultStore:
+    """
+    Results kept column by column instead of as one object each.
+
+    URLs are packed into a single UTF-8 buffer with an offsets array, the
+    layout of an Arrow large_string column; numbers live in typed arrays;
+    content types and targets, which repeat across results, are interned and
+    stored as small integer codes; redirects and payloads, which most
+    results lack, are kept in sparse maps. A result costs a few dozen bytes
+    plus its URL, and ScanResult objects are only built when one is read.
+    Response bodies are not kept.
+    """
+    def __init__(self, results: Iterable[ScanResult] = ()):
+        self._urls = bytearray()
+        self._offsets = array('q', [0])
+        self._status = array('H')
+        self._length = array('q')
+        self._time = array('d')
+        self._content_types = InternTable()
+        self._content_type_ids = array('I')
+        self._targets = InternTable()
+        self._target_ids = array('I')
+        self._redirects: dict[int, str] = {}
+        self._payloads: dict[int, str] = {}
+        self.extend(results)
+
+    def append(self, result: ScanResult):
+        index = len(self._status)
+        self._urls += result.url.encode('utf-8')
+        self._offsets.append(len(self._urls))
+        self._status.append(result.status)
+        self._length.append(result.content_length)
+        self._time.append(result.response_time)
+        self._content_type_ids.append(self._content_types.intern(result.content_type))
+        self._target_ids.append(self._targets.intern(result.target))
+        if result.redirect is not None:
+            self._redirects[index] = result.redirect
+        if result.payload is not None:
+            self._payloads[index] = result.payload
+
+    def extend(self, results: Iterable[ScanResult]):
+        for result in results:
+            self.append(result)
+
+    def __len__(self) -> int:
+        return len(self._status)
+
+    def __getitem__(self, index: int) -> ScanResult:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("result index out of range")
+        return ScanResult(
+            url=self.url(index),
+            status=self._status[index],
+            content_length=self._length[index],
+            response_time=self._time[index],
+            content_type=self._content_types.values[self._content_type_ids[index]],
+            target=self._targets.values[self._target_ids[index]],
+            redirect=self._redirects.get(index),
+            payload=self._payloads.get(index),
+        )
+
+    def __iter__(self) -> Iterator[ScanResult]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def url(self, index: int) -> str:
+        return self._url_bytes(index).decode('utf-8')
+
+    def _url_bytes(self, index: int) -> bytes:
+        return bytes(self._urls[self._offsets[index]:self._offsets[index + 1]])
+
+    def _key(self, column: str):
+        """Return a function mapping a row index to its sort key in `column`; missing strings sort first."""
+        if column == "url":
+            # UTF-8 bytes order the same way as the strings they encode
+            return self._url_bytes
+        if column == "status":
+            return self._status.__getitem__
+        if column == "content_length":
+            return self._length.__getitem__
+        if column == "response_time":
+            return self._time.__getitem__
+        if column in ("content_type", "target"):
+            table, ids = self._interned(column)
+            # rank the distinct values once, so rows compare as integers
+            rank = [0] * len(table.values)
+            for position, code in enumerate(sorted(range(1, len(table.values)), key=table.values.__getitem__), 1):
+                rank[code] = position
+            return lambda index: rank[ids[index]]
+        if column in ("redirect", "payload"):
+            values = self._redirects if column == "redirect" else self._payloads
+            return lambda index: values.get(index, "")
+        raise ValueError(f"Unknown result column '{column}'. Use one of: {', '.join(COLUMNS)}")
+
+    def _interned(self, column: str) -> tuple[InternTable, array]:
+        if column == "content_type":
+            return self._content_types, self._content_type_ids
+        return self._targets, self._target_ids
+
+    def order(self, by: tuple[str, ...] = ("status", "url")) -> array:
+        """Return the row indices sorted by the given columns."""
+        if len(by) > 1 and by[0] in LOW_CARDINALITY:
+            # few distinct values lead: bucket the rows, then sort each bucket by the rest
+            first = self._key(by[0])
+            buckets: dict = {}
+            for index in range(len(self)):
+                buckets.setdefault(first(index), []).append(index)
+            key = self._row_key(by[1:])
+            rows = array('I')
+            for value in sorted(buckets):
+                rows.extend(sorted(buckets[value], key=key))
+            return rows
+        return array('I', sorted(range(len(self)), key=self._row_key(by)))
+
+    def _row_key(self, by: tuple[str, ...]):
+        keys = [self._key(column) for column in by]
+        if len(keys) == 1:
+            key = keys[0]
+        elif len(keys) == 2:
+            first, second = keys
+            key = lambda index: (first(index), second(index))
+        else:
+            key = lambda index: tuple(k(index) for k in keys)
+        return key
+
+    def sorted(self, by: tuple[str, ...] = ("status", "url")) -> "ResultView":
+        """Return the results sorted by the given columns, without copying them."""
+        return ResultView(self, self.order(by))
+
+    def group_by(self, column: str) -> dict:
+        """Split the results by the value of a column, keeping their order within each group."""
+        if column in ("content_type", "target"):
+            table, ids = self._interned(column)
+            rows: dict[int, array] = {}
+            for index, code in enumerate(ids):
+                rows.setdefault(code, array('I')).append(index)
+            return {table.values[code]: ResultView(self, group) for code, group in rows.items()}
+        if column == "status":
+            rows = {}
+            for index, status in enumerate(self._status):
+                rows.setdefault(status, array('I')).append(index)
+            return {status: ResultView(self, group) for status, group in rows.items()}
+        groups: dict = {}
+        for index, result in enumerate(self):
+            groups.setdefault(getattr(result, column), array('I')).append(index)
+        return {value: ResultView(self, group) for value, group in groups.items()}
+
+    def columns(self) -> dict[str, list]:
+        """Return every column as a plain list."""
+        count = len(self)
+        content_types, targets = self._content_types.values, self._targets.values
+        return {
+            "url": [self.url(index) for index in range(count)],
+            "status": self._status.tolist(),
+            "content_length": self._length.tolist(),
+            "response_time": self._time.tolist(),
+            "content_type": [content_types[code] for code in self._content_type_ids],
+            "target": [targets[code] for code in self._target_ids],
+            "redirect": [self._redirects.get(index) for index in range(count)],
+            "payload": [self._payloads.get(index) for index in range(count)],
+        }
+
+    def to_numpy(self) -> dict:
+        """
+        Return the columns as NumPy arrays. Numbers keep their native
+        dtypes; strings are object arrays, with None where a value is missing.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            logger.error("Output", "NumPy export requires numpy. Install with: pip install numpy")
+            raise RuntimeError("numpy is not installed") from None
+
+        def strings(values: list) -> "np.ndarray":
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            return column
+
+        def interned(table: InternTable, ids: array) -> "np.ndarray":
+            return strings(table.values)[np.frombuffer(ids, dtype=np.uint32)]
+
+        count = len(self)
+        return {
+            "url": strings([self.url(index) for index in range(count)]),
+            "status": np.array(self._status, dtype=np.uint16),
+            "content_length": np.array(self._length, dtype=np.int64),
+            "response_time": np.array(self._time, dtype=np.float64),
+            "content_type": interned(self._content_types, self._content_type_ids),
+            "target": interned(self._targets, self._target_ids),
+            "redirect": strings([self._redirects.get(index) for index in range(count)]),
+            "payload": strings([self._payloads.get(index) for index in range(count)]),
+        }
+
+    def to_arrow(self):
+        """
+        Return the results as a pyarrow Table, for Parquet, Feather or a
+        DataFrame. The URL, offset and number arrays are handed over without
+        copying, so the store cannot grow while the table is alive; content
+        types and targets become dictionary-encoded columns.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError:
+            logger.error("Output", "Arrow export requires pyarrow. Install with: pip install pyarrow")
+            raise RuntimeError("pyarrow is not installed") from None
+
+        count = len(self)
+
+        def column(values: array, arrow_type) -> "pa.Array":
+            return pa.Array.from_buffers(arrow_type, len(values), [None, pa.py_buffer(values)])
+
+        def interned(table: InternTable, ids: array) -> "pa.DictionaryArray":
+            # code 0 is None, which Arrow expresses as a null index
+            codes = column(ids, pa.uint32())
+            indices = pc.if_else(pc.not_equal(codes, 0), pc.subtract(codes, pa.scalar(1, pa.uint32())), None)
+            return pa.DictionaryArray.from_arrays(indices.cast(pa.int32()),
+                                                  pa.array(table.values[1:], type=pa.string()))
+
+        urls = pa.LargeStringArray.from_buffers(count, pa.py_buffer(self._offsets), pa.py_buffer(self._urls))
+        return pa.table({
+            "url": urls,
+            "status": column(self._status, pa.uint16()),
+            "content_length": column(self._length, pa.int64()),
+            "response_time": column(self._time, pa.float64()),
+            "content_type": interned(self._content_types, self._content_type_ids),
+            "target": interned(self._targets, self._target_ids),
+            "redirect": pa.array([self._redirects.get(index) for index in range(count)], type=pa.string()),
+            "payload": pa.array([self._payloads.get(index) for index in range(count)], type=pa.string()),
+        })
+
+class ResultView(Sequence):
+    """A selection of a ResultStore's rows, in a given order; results are built as they are read."""
+    def __init__(self, store: ResultStore, rows: array):
+        self.store = store
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ResultView(self.store, self.rows[index])
+        return self.store[self.rows[index]]
+
+    def __iter__(self) -> Iterator[ScanResult]:
+        store = self.store
+        for row in self.rows:
+            yield store[row]
@@ -23,5 +23,6 @@ def get_banner() -> str:
     """
 
 def print_banner():
-    """Print the tool banner."""
-    logger.info(get_banner())
\ No newline at end of file
+    """Print the tool banner, unless the output is read by a program."""
+    if not logger.is_compact():
+        logger.info(get_banner())
\ No newline at end of file
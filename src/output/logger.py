@@ -6,18 +6,49 @@ Author: WaiBui
 License: MIT
 """
 
+import sys
+import time
+import queue
+import atexit
+import threading
+from typing import Optional
+
 from src.constants.color import RESET, RED, GREEN, YELLOW, MAGENTA, CYAN, BOLD
 
+# Lines waiting for the writer thread; beyond this, progress and verbose-only lines are dropped and counted
+LOG_QUEUE_SIZE = 65536
+# Lines written per batch, and the most batches written per second
+LOG_BATCH_SIZE = 4096
+LOG_FRAME_RATE = 30
+# Writes up to this size are atomic on a pipe, so lines from parallel worker processes do not interleave
+PIPE_BUF = 4096
+
 class Logger:
     """
     Provides methods for printing messages with different
     log levels: info, success, warning, error, debug, bold, plain, and http.
+
+    Lines are queued and written in batches by a background thread at most
+    LOG_FRAME_RATE times a second, so a slow terminal never blocks the scan.
+    When the queue is full, progress lines and lines shown only with
+    --verbose, such as non-matching responses, are dropped and counted;
+    matched results and other lines wait for room, since the console may be
+    the only place a finding is reported. When stdout is not a terminal, lines use a compact tab-separated format:
+    the level, then each field.
     """
     _instance = None
 
-    def __init__(self, use_color: bool = False, verbose: bool = False):
+    def __init__(self, use_color: bool = False, verbose: bool = False, buffered: bool = True):
         self.use_color = use_color
         self.verbose = verbose
+        self.buffered = buffered
+        self.compact: Optional[bool] = None
+        self.dropped = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._tty_stream = None
+        self._tty = False
 
     @classmethod
     def get_instance(cls, use_color: bool = False, verbose: bool = False):
@@ -33,24 +64,120 @@ class Logger:
         self.use_color = use_color
         return self
 
-    def _print(self, *args, color_code: str = "", always: bool = True):
-        if not always and not self.verbose:
-            return
+    def set_buffered(self, buffered: bool):
+        """Write each line directly instead of through the writer thread."""
+        self.flush()
+        self.buffered = buffered
+        return self
+
+    def set_compact(self, compact: Optional[bool]):
+        """Force the compact format on or off; None picks it from whether stdout is a terminal."""
+        self.compact = compact
+        return self
+
+    def is_compact(self) -> bool:
+        if self.compact is not None:
+            return self.compact
+        stream = sys.stdout
+        # isatty is a system call, so only ask again when stdout was replaced
+        if stream is not self._tty_stream:
+            self._tty_stream = stream
+            try:
+                self._tty = stream.isatty()
+            except (AttributeError, ValueError):
+                self._tty = False
+        return not self._tty
+
+    def flush(self):
+        """Wait until every queued line has been written."""
+        if self._thread is not None and self._thread.is_alive():
+            self._queue.join()
+
+    def _format(self, args: tuple, color_code: str, level: str) -> str:
+        if self.is_compact():
+            return "\t".join([level, *(str(arg).strip() for arg in args)]) + "\n"
         message = " ".join(str(arg) for arg in args)
         if self.use_color and color_code:
-            print(f"{color_code}{message}{RESET}")
-        else:
-            print(message)
+            return f"{color_code}{message}{RESET}\n"
+        return f"{message}\n"
+
+    def _print(self, *args, color_code: str = "", always: bool = True, level: str = "info",
+               droppable: Optional[bool] = None):
+        if not always and not self.verbose:
+            return
+        if droppable is None:
+            droppable = not always
+        line = self._format(args, color_code, level)
+        if not self.buffered:
+            # one write per line, so lines from parallel worker processes do not interleave
+            sys.stdout.write(line)
+            return
+        if self._thread is None:
+            self._start()
+        if not droppable:
+            self._queue.put(line)
+            return
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="fwf-logger", daemon=True)
+                self._thread.start()
+                atexit.register(self.flush)
+
+    def _run(self):
+        interval = 1 / LOG_FRAME_RATE
+        while True:
+            lines = [self._queue.get()]
+            try:
+                while len(lines) < LOG_BATCH_SIZE:
+                    lines.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            started = time.monotonic()
+            count = len(lines)
+            self._write(lines)
+            for _ in range(count):
+                self._queue.task_done()
+            # cap the frame rate so a busy scan fills fewer, larger batches
+            remaining = interval - (time.monotonic() - started)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def _write(self, lines: list[str]):
+        dropped, self.dropped = self.dropped, 0
+        if dropped:
+            message = f"[LOGGER] {dropped} progress or verbose lines dropped, output could not keep up"
+            lines.append(self._format((message,), YELLOW, "warning"))
+        stream = sys.stdout
+        try:
+            chunk, size = [], 0
+            for line in lines:
+                if size + len(line) > PIPE_BUF and chunk:
+                    stream.write("".join(chunk))
+                    chunk, size = [], 0
+                chunk.append(line)
+                size += len(line)
+            stream.write("".join(chunk))
+            stream.flush()
+        except (OSError, ValueError):
+            # a closed pipe or stream must not kill the writer, or flush would wait forever
+            pass
 
     def info(self, *args): self._print(*args, color_code=CYAN)
-    def success(self, *args): self._print(*args, color_code=GREEN, always=False)
-    def warning(self, *args): self._print(*args, color_code=YELLOW, always=False)
-    def error(self, *args): self._print(*args, color_code=RED, always=False)
-    def debug(self, *args): self._print(*args, color_code=MAGENTA, always=False)
-    def bold(self, *args): self._print(*args, color_code=BOLD, always=False)
-    def plain(self, *args): self._print(*args, always=False)
-
-    def http(self, status_code: int, match_code: list[int],*args):
+    def progress(self, *args): self._print(*args, color_code=CYAN, droppable=True)
+    def success(self, *args): self._print(*args, color_code=GREEN, always=False, level="success")
+    def warning(self, *args): self._print(*args, color_code=YELLOW, always=False, level="warning")
+    def error(self, *args): self._print(*args, color_code=RED, always=False, level="error")
+    def debug(self, *args): self._print(*args, color_code=MAGENTA, always=False, level="debug")
+    def bold(self, *args): self._print(*args, color_code=BOLD, always=False, level="bold")
+    def plain(self, *args): self._print(*args, always=False, level="plain")
+
+    def http(self, status_code: int, matched: bool, *args):
         color_map = {
             1: CYAN,
             2: GREEN,
@@ -58,7 +185,7 @@ class Logger:
             4: RED,
             5: MAGENTA
         }
-        color_code = color_map.get(status_code // 100, "")
-        message = f"[{status_code}] {' '.join(str(arg) for arg in args)}"
-        if status_code in match_code or self.verbose:
-            self._print(message, color_code=color_code)
+        if matched or self.verbose:
+            color_code = color_map.get(status_code // 100, "")
+            status = status_code if self.is_compact() else f"[{status_code}]"
+            self._print(status, *args, color_code=color_code, level="http", droppable=not matched)
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+from typing import Optional
+from src.output.logger import Logger
+from src.scanner.metrics import Histogram
+
+logger = Logger.get_instance()
+
+# Export every 8th phase histogram bound, one per doubling, to keep the metrics file small
+PHASE_BUCKET_STEP = 8
+
+def print_progress(snapshot: dict, previous: Optional[dict], interval: float):
+    """Print one progress line: completion, request and error rates over the last interval, in-flight and ETA."""
+    done, total = snapshot["done"], snapshot["total"]
+    previous = previous or {"requests": 0, "errors": 0, "done": 0}
+    rate = (snapshot["requests"] - previous["requests"]) / interval
+    errors = (snapshot["errors"] - previous["errors"]) / interval
+    done_rate = (done - previous["done"]) / interval
+    percent = done / total * 100 if total else 100.0
+    if done_rate > 0 and total > done:
+        seconds = int((total - done) / done_rate)
+        eta = f"{seconds // 3600}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+    else:
+        eta = "-"
+    logger.progress("[PROGRESS]", f"{percent:5.1f}% {done}/{total} | {rate:.0f} req/s | {errors:.1f} err/s | "
+                              f"{snapshot['in_flight']} in flight | ETA {eta}")
+
+def write_metrics_file(path: str, snapshot: dict, phases: dict[str, Histogram]):
+    """Write the scan counters and phase histograms in the Prometheus text format, replacing the file atomically."""
+    lines = []
+
+    def metric(name: str, kind: str, help_text: str, value):
+        lines.extend([f"# HELP {name} {help_text}", f"# TYPE {name} {kind}", f"{name} {value}"])
+
+    metric("fwf_requests_total", "counter", "Requests sent.", snapshot["requests"])
+    metric("fwf_request_errors_total", "counter", "Requests that failed without a response.", snapshot["errors"])
+    metric("fwf_requests_in_flight", "gauge", "Requests waiting for a response.", snapshot["in_flight"])
+    metric("fwf_results_total", "counter", "Responses recorded as results.", snapshot["results"])
+    metric("fwf_paths_done_total", "counter", "Paths checked so far.", snapshot["done"])
+    metric("fwf_paths", "gauge", "Paths to check, growing as directories are found.", snapshot["total"])
+
+    name = "fwf_request_phase_seconds"
+    lines.extend([f"# HELP {name} Time spent in each phase of a request.", f"# TYPE {name} histogram"])
+    for phase, histogram in phases.items():
+        for bound, cumulative in histogram.cumulative()[::PHASE_BUCKET_STEP]:
+            lines.append(f'{name}_bucket{{phase="{phase}",le="{bound:.6g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{phase="{phase}",le="+Inf"}} {histogram.count}')
+        lines.append(f'{name}_sum{{phase="{phase}"}} {histogram.sum:.6f}')
+        lines.append(f'{name}_count{{phase="{phase}"}} {histogram.count}')
+
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.error("[METRICS]", f"Failed to write {path}: {e}")
@@ -6,11 +6,13 @@ Author: WaiBui
 License: MIT
 """
 
+from typing import Optional
 from src.models.config import ScanConfig
+from src.input.fuzz import wordlist_keywords
 from src.output.logger import Logger
 logger = Logger.get_instance()
 
-def print_scan_info(config: ScanConfig):
+def print_scan_info(config: ScanConfig, total_paths: Optional[int] = None):
     """Prints the configuration settings before starting the scan."""
     logger.info("-" * 60)
 
@@ -19,20 +21,57 @@ def print_scan_info(config: ScanConfig):
             logger.info(f":: {name}: {value}")
 
     print_field("Method", config.method)
-    print_field("Target", config.url)
-    print_field("Wordlist", config.wordlist)
+    if len(config.urls) == 1:
+        print_field("Target", config.urls[0])
+    else:
+        print_field("Targets", f"{len(config.urls)} hosts")
+    print_field("Wordlist", ", ".join(config.wordlist))
+    print_field("Total Paths", total_paths)
+    if len(wordlist_keywords(config.wordlist)) > 1:
+        print_field("Mode", config.fuzz_mode)
+    print_field("Extensions", ", ".join(config.extensions) or None)
+    print_field("Prefixes", ", ".join(config.prefixes) or None)
+    print_field("Suffixes", ", ".join(config.suffixes) or None)
+    print_field("Case", ", ".join(config.case) or None)
+    print_field("Number Range", config.number_range)
     print_field("User-Agent", config.user_agent)
-    print_field("Concurrency", config.concurrency)
+    if config.adaptive_concurrency:
+        print_field("Concurrency", f"auto ({config.min_concurrency}-{config.concurrency})")
+    else:
+        print_field("Concurrency", config.concurrency)
+    print_field("Host Concurrency", config.host_concurrency)
+    print_field("Workers", f"{config.workers} processes" if config.workers > 1 else None)
+    print_field("Rate Limit", f"{config.rate:g} req/s" if config.rate else None)
+    print_field("Host Rate Limit", f"{config.host_rate:g} req/s" if config.host_rate else None)
     print_field("Timeout", config.timeout)
     print_field("Retries", config.retry)
+    print_field("Recursion Depth", config.depth or None)
+    if config.probe == "head":
+        print_field("Probe", "HEAD, then GET for matches" if config.method == "GET" else f"HEAD-first ignored for {config.method}")
+    print_field("Body Policy", f"{config.body_policy} (limit {config.body_limit} bytes)")
+    print_field("Prewarm", f"{config.prewarm} connections per host" if config.prewarm else None)
     print_field("Follow Redirects", config.follow_redirects if config.follow_redirects else None)
     print_field("Cookies", config.cookie)
     
+    print_field("Calibration", f"{config.calibration_samples} probes per target" if config.calibrate else None)
+
     if config.match_codes:
         print_field("Match Code", ", ".join(map(str, config.match_codes)))
+    print_field("Filter Code", ", ".join(map(str, config.filter_codes)) or None)
+    for kind in ("match", "filter"):
+        for name in ("size", "words", "lines", "time", "type", "regex"):
+            value = getattr(config, f"{kind}_{name}")
+            print_field(f"{kind.capitalize()} {name.capitalize()}", (", ".join(value) or None) if isinstance(value, list) else value)
 
     print_field("Output File", config.output)
+    print_field("Checkpoint", config.checkpoint)
+    print_field("Resumed From", config.resume)
+    print_field("Headers", config.headers)
     print_field("Params", config.params)
     print_field("Data", config.data)
 
     logger.info("-" * 60)
+
+def print_total_paths(total_paths: int):
+    """Print the number of paths of a scan whose header went out before its wordlist was counted."""
+    logger.info(f":: Total Paths: {total_paths}")
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import queue
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import replace
+from typing import Optional
+from src.models.result import ScanResult
+from src.models.result_store import ResultStore
+from src.output.logger import Logger
+from src.output.writer import FileWriter, temporary_path
+from src.output.writers import LineWriter, get_writer
+from src.constants.default import SINK_BATCH_SIZE
+
+logger = Logger.get_instance()
+
+_STOP = object()
+
+class ResultSink(ABC):
+    """Receives scan results one by one while the scan is running."""
+
+    @abstractmethod
+    def emit(self, result: ScanResult):
+        """Take one result; must not block the event loop."""
+
+    def sync(self):
+        """Block until everything emitted so far is on disk."""
+
+    @abstractmethod
+    def close(self, complete: bool = True):
+        """
+        Flush everything that was emitted and release the output file.
+        `complete` is False when the scan was interrupted and may be resumed.
+        """
+
+class LineSink(ResultSink):
+    """
+    Appends a LineWriter's records to a file from a background writer thread.
+
+    emit() only enqueues the result, so the event loop never blocks on disk.
+    The writer thread drains whatever is queued, up to batch_size results at
+    a time, writes it in one go and flushes, so a crash loses at most the
+    batch in flight. The file is written under a temporary name beside
+    output_file and renamed over it when the sink is closed, like the
+    reports FileWriter writes, so an existing file is never replaced by a
+    half-written one; an interrupted scan leaves the temporary file where it
+    is instead. With append=True an existing file is extended in
+    place and its header is not repeated; atomic=False also writes in
+    place, for files that must hold every flushed batch after a crash.
+    """
+    def __init__(self, output_file: str, command: str, writer: LineWriter, batch_size: int = SINK_BATCH_SIZE,
+                 announce: bool = True, append: bool = False, atomic: bool = True):
+        self.output_file = output_file
+        self.path = output_file if append or not atomic else temporary_path(output_file)
+        self.writer = writer
+        self.command = command
+        self.batch_size = batch_size
+        self.announce = announce
+        self.append = append
+        self.failed = False
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=f"sink:{output_file}", daemon=True)
+        self._thread.start()
+
+    def emit(self, result: ScanResult):
+        if not self.failed:
+            self._queue.put(result)
+
+    def sync(self):
+        done = threading.Event()
+        self._queue.put(done)
+        while not done.wait(0.1):
+            if not self._thread.is_alive():
+                return
+
+    def close(self, complete: bool = True):
+        self._queue.put(_STOP)
+        self._thread.join()
+        if self.path != self.output_file:
+            if not complete and not self.failed:
+                # without a checkpoint the scan cannot be resumed, so its partial file must not replace the report
+                logger.info("Output", f"Scan interrupted, partial results left in {self.path}")
+                return
+            try:
+                if self.failed:
+                    os.remove(self.path)
+                else:
+                    os.replace(self.path, self.output_file)
+            except OSError as e:
+                if not self.failed:
+                    self.failed = True
+                    logger.error("Output", f"Failed to write {self.output_file}: {str(e)}")
+        if not self.failed and self.announce:
+            logger.info("Output", f"Results written to {self.output_file}")
+
+    def _run(self):
+        try:
+            extend = self.append and os.path.exists(self.path) and os.path.getsize(self.path) > 0
+            with open(self.path, 'a' if extend else 'w', newline='') as f:
+                if not extend and self.writer.write_header is not None:
+                    self.writer.write_header(f, self.command)
+                    f.flush()
+                while True:
+                    batch = [self._queue.get()]
+                    while len(batch) < self.batch_size:
+                        try:
+                            batch.append(self._queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    results = [item for item in batch if isinstance(item, ScanResult)]
+                    if results:
+                        self.writer.write_batch(f, results)
+                        f.flush()
+                    for item in batch:
+                        if isinstance(item, threading.Event):
+                            item.set()
+                    if batch[-1] is _STOP:
+                        return
+        except Exception as e:
+            self.failed = True
+            logger.error("Output", f"Failed to write {self.output_file}: {str(e)}")
+
+class SortedReportSink(ResultSink):
+    """
+    Builds the reports that need the full, sorted result set (json, yaml,
+    xlsx, md, html, xml).
+
+    Results are spilled to '<first report>.spill.jsonl' as they arrive, and
+    the reports are rendered from that file by FileWriter when the sink is
+    closed: the results are loaded and sorted once, and every report is
+    written from that order on its own thread. If the process dies before
+    that, the spill file still holds everything found so far. An interrupted
+    scan renders no reports, so existing ones are never replaced by partial
+    results: a checkpointed scan keeps the spill file for --resume to append
+    to, any other scan leaves it where the user is told to find it.
+    """
+    def __init__(self, output_files: list[str], command: str, append: bool = False, resumable: bool = False):
+        self.output_files = output_files
+        self.spill_file = f"{output_files[0]}.spill.jsonl"
+        self.resumable = resumable
+        from src.output.writers import jsonl_writer
+        self._spill = LineSink(self.spill_file, command, LineWriter(jsonl_writer.write_batch), announce=False,
+                               append=append, atomic=False)
+
+    def emit(self, result: ScanResult):
+        # reports never show bodies, so the spill file does not carry them
+        self._spill.emit(replace(result, body=None) if result.body is not None else result)
+
+    def sync(self):
+        self._spill.sync()
+
+    def close(self, complete: bool = True):
+        self._spill.close()
+        if self._spill.failed:
+            return
+        if not complete:
+            if self.resumable:
+                logger.info("Output", f"Scan interrupted, results so far kept in {self.spill_file} for --resume")
+            else:
+                logger.info("Output", f"Scan interrupted, partial results left in {self.spill_file}")
+            return
+        import json
+        results = ResultStore()
+        with open(self.spill_file, 'r') as f:
+            for line in f:
+                try:
+                    results.append(ScanResult.from_dict(json.loads(line)))
+                except (json.JSONDecodeError, KeyError):
+                    # a line cut short by a crash before the scan was resumed
+                    continue
+        written = FileWriter.write_reports(results, self.output_files)
+        if all(written.values()):
+            os.remove(self.spill_file)
+
+def open_sinks(output: Optional[str], append: bool = False, atomic: bool = True) -> list[ResultSink]:
+    """
+    Create one sink per comma-separated output file, extending existing
+    files when resuming. atomic=False writes line formats in place, as a
+    checkpointed scan needs: a crash must leave the results its checkpoint
+    counts as done where --resume will look for them.
+    """
+    if not output:
+        return []
+    command = " ".join(sys.argv) if len(sys.argv) > 0 else "fwf [unknown command]"
+    sinks = []
+    reports = []
+    for output_file in output.split(','):
+        output_file = output_file.strip()
+        writer = get_writer(output_file.split('.')[-1])
+        if isinstance(writer, LineWriter):
+            sinks.append(LineSink(output_file, command, writer, append=append, atomic=atomic))
+        else:
+            reports.append(output_file)
+    if reports:
+        sinks.append(SortedReportSink(reports, command, append=append, resumable=not atomic))
+    return sinks
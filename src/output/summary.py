@@ -6,15 +6,39 @@ Author: WaiBui
 License: MIT
 """
 
+import sys
 import time
-from src.models.result import ScanResult
+from typing import Optional
+from src.scanner.metrics import Histogram
+from src.scanner.stats import ScanStats
 from src.output.logger import Logger
 
 logger = Logger.get_instance()
 
-def print_summary(start_time: float, scan_results: list[ScanResult], failed_tasks: int = 0):
-    """Print summary statistics of the scan"""
-    if not scan_results and failed_tasks == 0:
+def peak_memory_mb() -> Optional[float]:
+    """Return the peak resident set size of the process in MiB, if available."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def print_summary(start_time: float, *, target_stats: dict[str, ScanStats],
+                  failed_tasks: Optional[dict[str, int]] = None,
+                  first_request_delay: Optional[float] = None, targets: Optional[list[str]] = None,
+                  concurrency_history: Optional[list[tuple[float, int, int, int]]] = None,
+                  requests_sent: int = 0, requested_rate: Optional[float] = None,
+                  requested_host_rate: Optional[float] = None, retries_sent: int = 0,
+                  wildcards_discarded: Optional[int] = None, connections_opened: int = 0,
+                  connections_reused: int = 0, head_probes: Optional[tuple[int, int]] = None,
+                  phase_timings: Optional[dict[str, Histogram]] = None, filtered: int = 0):
+    """Print summary statistics of the scan from the statistics kept per target"""
+    failed_tasks = failed_tasks or {}
+    total_failed = sum(failed_tasks.values())
+    stats = ScanStats.merged(target_stats.values())
+    if not stats.count and not requests_sent and total_failed == 0 and not wildcards_discarded:
         logger.warning("No paths discovered.")
         return
 
@@ -23,16 +47,103 @@ def print_summary(start_time: float, scan_results: list[ScanResult], failed_task
 
     logger.info("[*]", f"Scan completed in {elapsed:.2f} seconds")
 
-    total = len(scan_results)
-    found_2xx = sum(1 for r in scan_results if 200 <= r.status < 300)
-    found_3xx = sum(1 for r in scan_results if 300 <= r.status < 400)
-    found_4xx = sum(1 for r in scan_results if 400 <= r.status < 500)
-    found_5xx = sum(1 for r in scan_results if 500 <= r.status < 600)
+    found_2xx, found_3xx, found_4xx, found_5xx = stats.status_classes()
 
-    logger.info("::", "Total paths discovered:".ljust(25), total)
+    logger.info("::", "Total paths discovered:".ljust(25), stats.count)
     logger.info("::", "2xx Success responses:".ljust(25), found_2xx)
     logger.info("::", "3xx Redirection:".ljust(25), found_3xx)
     logger.info("::", "4xx Client errors:".ljust(25), found_4xx)
     logger.info("::", "5xx Server errors:".ljust(25), found_5xx)
-    logger.info("::", "Failed tasks:".ljust(25), failed_tasks)
+    logger.info("::", "Failed tasks:".ljust(25), total_failed)
+    if retries_sent:
+        logger.info("::", "Retries:".ljust(25), retries_sent)
+    if wildcards_discarded is not None:
+        logger.info("::", "Wildcards discarded:".ljust(25), wildcards_discarded)
+    if filtered:
+        logger.info("::", "Filtered out:".ljust(25), filtered)
+
+    if requests_sent and elapsed > 0:
+        achieved = f"{requests_sent / elapsed:.1f} req/s"
+        limits = []
+        if requested_rate:
+            limits.append(f"{requested_rate:g} req/s")
+        if requested_host_rate:
+            limits.append(f"{requested_host_rate:g} req/s per host")
+        if limits:
+            achieved += f" (limit {', '.join(limits)})"
+        logger.info("::", "Request rate:".ljust(25), achieved)
+
+    if connections_opened or connections_reused:
+        # every request sent on the session, calibration, prewarm and HEAD probes included, opens or reuses one
+        session_requests = connections_opened + connections_reused
+        reuse = connections_reused / session_requests * 100
+        logger.info("::", "Connections:".ljust(25),
+                    f"{connections_opened} opened, {connections_reused} reused ({reuse:.1f}% reuse)")
+        logger.info("::", "Handshakes per request:".ljust(25), f"{connections_opened / session_requests:.3f}")
+
+    if head_probes is not None:
+        answered, escalated = head_probes
+        logger.info("::", "HEAD probes:".ljust(25), f"{answered} answered by HEAD, {escalated} confirmed with GET")
+
+    if stats.count:
+        _print_result_distributions(stats)
+
+    if first_request_delay is not None:
+        logger.info("::", "Time to first request:".ljust(25), f"{first_request_delay:.3f}s")
+    peak_memory = peak_memory_mb()
+    if peak_memory is not None:
+        logger.info("::", "Peak memory:".ljust(25), f"{peak_memory:.1f} MiB")
+    if concurrency_history:
+        _print_concurrency_history(concurrency_history)
+    if phase_timings:
+        _print_phase_timings(phase_timings)
+
+    if targets and len(targets) > 1:
+        _print_target_breakdown(target_stats, failed_tasks, targets)
+    logger.info('-'*60)
+
+def _print_concurrency_history(history: list[tuple[float, int, int, int]], points: int = 8):
+    """Print the range of the adaptive concurrency limit and a few samples over time."""
+    lowest = min(sample[1] for sample in history)
+    highest = max(sample[2] for sample in history)
+    logger.info("::", "Concurrency limit:".ljust(25),
+                f"min {lowest} / max {highest} / final {history[-1][3]}")
+    step = max(1, len(history) // points)
+    samples = history[::step]
+    if samples[-1] is not history[-1]:
+        samples.append(history[-1])
+    logger.info("::", "Limit over time:".ljust(25), " ".join(f"{t:.0f}s:{last}" for t, _, _, last in samples))
+
+def _print_result_distributions(stats: ScanStats, content_types: int = 5):
+    """Print response time and size quantiles and the most common content types."""
+    latency = stats.latency
+    logger.info("::", "Response time (ms):".ljust(25),
+                " / ".join(f"p{q * 100:g} {latency.quantile(q) * 1000:.2f}" for q in (0.5, 0.95, 0.99)))
+    sizes = stats.sizes
+    logger.info("::", "Response size (bytes):".ljust(25),
+                f"p50 {sizes.quantile(0.5):.0f} / p95 {sizes.quantile(0.95):.0f} / max {sizes.max:.0f}")
+    common = stats.content_types.most_common(content_types)
+    logger.info("::", "Content types:".ljust(25), ", ".join(f"{name} {count}" for name, count in common))
+
+def _print_phase_timings(phase_timings: dict[str, Histogram]):
+    """Print p50/p95/p99 in milliseconds for every request phase that took measurable time."""
+    rows = [(phase, h) for phase, h in phase_timings.items() if h.count and h.max > 0]
+    if not rows:
+        return
+    logger.info("::", "Request phases (ms):".ljust(25), "    p50      p95      p99")
+    for phase, histogram in rows:
+        quantiles = " ".join(f"{histogram.quantile(q) * 1000:8.2f}" for q in (0.5, 0.95, 0.99))
+        logger.info("::", f"  {phase}".ljust(25), quantiles)
+
+def _print_target_breakdown(target_stats: dict[str, ScanStats], failed_tasks: dict[str, int], targets: list[str]):
+    """Print one line of status-class counts per target."""
+    by_target = {target: target_stats.get(target) or ScanStats() for target in targets}
+    for target, stats in target_stats.items():
+        by_target.setdefault(target, stats)
+
+    width = max(len(target) for target in by_target)
     logger.info('-'*60)
+    logger.info("::", "Target".ljust(width), "  Total    2xx    3xx    4xx    5xx Failed")
+    for target, stats in by_target.items():
+        columns = [stats.count, *stats.status_classes(), failed_tasks.get(target, 0)]
+        logger.info("::", target.ljust(width), " ".join(str(c).rjust(6) for c in columns))
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import importlib
+from dataclasses import dataclass
+from functools import cache
+from itertools import islice
+from types import ModuleType
+from typing import Callable, Optional, Sequence, TextIO
+
+from src.models.result import ScanResult
+from src.output.logger import Logger
+from src.constants.default import OUTPUT_WRITERS, OUTPUT_WRITER_ENTRY_POINTS, WRITER_CHUNK_SIZE
+
+logger = Logger.get_instance()
+
+# write(results, output_file, command) -> True on success. A writer logs its own errors;
+# output_file is a temporary name that FileWriter renames into place and announces.
+ReportWriter = Callable[[Sequence[ScanResult], str, str], bool]
+
+@dataclass(frozen=True)
+class LineWriter:
+    """
+    A format that can be streamed: the output sink writes the header once
+    and then appends each batch of results while the scan runs, so results
+    are neither kept nor sorted.
+    """
+    write_batch: Callable[[TextIO, list[ScanResult]], None]
+    write_header: Optional[Callable[[TextIO, str], None]] = None
+
+    def write(self, results: Sequence[ScanResult], output_file: str, command: str) -> bool:
+        """Write a whole result set at once, as a report writer would."""
+        try:
+            with open(output_file, 'w', newline='') as f:
+                if self.write_header is not None:
+                    self.write_header(f, command)
+                iterator = iter(results)
+                while batch := list(islice(iterator, WRITER_CHUNK_SIZE)):
+                    self.write_batch(f, batch)
+            return True
+        except Exception as e:
+            logger.error("Output", f"Failed to write {output_file}: {str(e)}")
+            return False
+
+Writer = ReportWriter | LineWriter
+
+_writers: dict[str, Writer] = {}
+
+def register_writer(extension: str, writer: Writer | ModuleType):
+    """
+    Register a writer for files ending in .extension, replacing any
+    built-in one: a report function, a LineWriter, or a module defining
+    write() or write_batch() and optionally write_header().
+    """
+    _writers[extension.lower()] = _writer_of(writer)
+
+def _writer_of(target) -> Writer:
+    """A module defining write_batch is a line format; any other module is a report writer through write()."""
+    if isinstance(target, ModuleType):
+        if hasattr(target, "write_batch"):
+            return LineWriter(target.write_batch, getattr(target, "write_header", None))
+        return target.write
+    return target
+
+def get_writer(extension: str) -> Optional[Writer]:
+    """
+    Return the writer for an extension, importing its module on first use:
+    a LineWriter for formats that stream, or a function writing a report.
+    Registered writers come first, then the built-in formats, then writers
+    published by installed packages under the 'fwf.writers' entry point group.
+    """
+    extension = extension.lower()
+    writer = _writers.get(extension)
+    if writer is not None:
+        return writer
+    if extension in OUTPUT_WRITERS:
+        writer = _writer_of(importlib.import_module(f"{__name__}.{OUTPUT_WRITERS[extension]}"))
+    else:
+        entry_point = _entry_points().get(extension)
+        if entry_point is None:
+            return None
+        try:
+            writer = _writer_of(entry_point.load())
+        except Exception as e:
+            logger.error("Output", f"Failed to load writer '{entry_point.value}' for .{extension}: {str(e)}")
+            return None
+    _writers[extension] = writer
+    return writer
+
+def is_supported(extension: str) -> bool:
+    extension = extension.lower()
+    return extension in _writers or extension in OUTPUT_WRITERS or extension in _entry_points()
+
+def supported_formats() -> list[str]:
+    return list(dict.fromkeys([*OUTPUT_WRITERS, *_writers, *_entry_points()]))
+
+@cache
+def _entry_points() -> dict:
+    # importlib.metadata scans every installed distribution, so only look when a format is not built in
+    from importlib.metadata import entry_points
+    return {entry_point.name.lower(): entry_point for entry_point in entry_points(group=OUTPUT_WRITER_ENTRY_POINTS)}
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import csv
+from datetime import datetime
+from typing import TextIO
+from src.models.result import ScanResult
+
+# A line format: results are streamed to the file while the scan runs
+
+def write_header(f: TextIO, command: str):
+    f.write(f"# Command: {command}\n")
+    f.write(f"# Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    csv.writer(f).writerow(['URL', 'Status', 'Content-Length', 'Response-Time', 'Content-Type', 'Target', 'Redirect', 'Payload'])
+
+def write_batch(f: TextIO, results: list[ScanResult]):
+    csv.writer(f).writerows(
+        [result.url, result.status, result.content_length,
+         f"{result.response_time:.3f}", result.content_type or "N/A",
+         result.target or "", result.redirect or "", result.payload or ""]
+        for result in results
+    )
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+from datetime import datetime
+from html import escape
+from itertools import islice
+from typing import Sequence
+from src.models.result import ScanResult
+from src.output.logger import Logger
+from src.constants.default import WRITER_CHUNK_SIZE
+
+logger = Logger.get_instance()
+
+_HEAD = '''<!DOCTYPE html>
+<html lang="en">
+<head>
+  <meta charset="UTF-8">
+  <meta name="viewport" content="width=device-width, initial-scale=1.0">
+  <title>FwF Scanner Results</title>
+  <style>
+    body { font-family: Arial, sans-serif; margin: 20px; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { padding: 8px; text-align: left; border: 1px solid #ddd; }
+    th { background-color: #f2f2f2; }
+    tr:nth-child(even) { background-color: #f9f9f9; }
+    .header { margin-bottom: 20px; }
+    .command { font-family: monospace; background-color: #f8f8f8; padding: 10px; border-radius: 5px; }
+  </style>
+</head>
+<body>
+'''
+
+_TABLE_HEAD = '''  <table>
+    <tr>
+      <th>URL</th>
+      <th>Status</th>
+      <th>Content-Length</th>
+      <th>Response-Time</th>
+      <th>Content-Type</th>
+      <th>Target</th>
+      <th>Redirect</th>
+      <th>Payload</th>
+    </tr>
+'''
+
+_TAIL = '''  </table>
+</body>
+</html>
+'''
+
+def _row(result: ScanResult) -> str:
+    return (
+        "    <tr>\n"
+        f"      <td>{escape(result.url, quote=False)}</td>\n"
+        f"      <td>{result.status}</td>\n"
+        f"      <td>{result.content_length}</td>\n"
+        f"      <td>{result.response_time:.3f}s</td>\n"
+        f"      <td>{escape(result.content_type or 'N/A', quote=False)}</td>\n"
+        f"      <td>{escape(result.target or '', quote=False)}</td>\n"
+        f"      <td>{escape(result.redirect or '', quote=False)}</td>\n"
+        f"      <td>{escape(result.payload or '', quote=False)}</td>\n"
+        "    </tr>\n"
+    )
+
+def write(results: Sequence[ScanResult], output_file: str, command: str) -> bool:
+    """Write results to an HTML file, emitting the table a chunk of rows at a time."""
+    try:
+        with open(output_file, 'w') as f:
+            f.write(_HEAD)
+            f.write('  <div class="header">\n')
+            f.write('    <h1>FwF Scanner Results</h1>\n')
+            f.write(f'    <div class="command"><strong>Command:</strong> {escape(command, quote=False)}</div>\n')
+            f.write(f'    <p>Scan completed: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}</p>\n')
+            f.write('  </div>\n')
+            f.write(_TABLE_HEAD)
+            
+            iterator = iter(results)
+            while chunk := list(islice(iterator, WRITER_CHUNK_SIZE)):
+                f.write("".join(map(_row, chunk)))
+            
+            f.write(_TAIL)
+
+        return True
+    except Exception as e:
+        logger.error("Output", f"Failed to write HTML file: {str(e)}")
+        return False
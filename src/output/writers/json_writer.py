@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import json
+from datetime import datetime
+from typing import Sequence
+from src.models.result import ScanResult
+from src.output.logger import Logger
+
+logger = Logger.get_instance()
+
+def write(results: Sequence[ScanResult], output_file: str, command: str) -> bool:
+    """Write results to a JSON file."""
+    try:
+        data = {
+            "command": command,
+            "scan_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            "results": [
+                {
+                    "url": result.url,
+                    "path": result.url,
+                    "status": result.status,
+                    "content_length": result.content_length,
+                    "response_time": round(result.response_time, 3),
+                    "content_type": result.content_type or "N/A",
+                    "target": result.target,
+                    "redirect": result.redirect,
+                    "payload": result.payload,
+                } 
+                for result in results
+            ]
+        }
+        
+        with open(output_file, 'w') as f:
+            json.dump(data, f, indent=2)
+
+        return True
+    except Exception as e:
+        logger.error("Output", f"Failed to write JSON file: {str(e)}")
+        return False
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import json
+from typing import TextIO
+from src.models.result import ScanResult
+
+# A line format: results are streamed to the file while the scan runs, one JSON object per line
+
+def write_batch(f: TextIO, results: list[ScanResult]):
+    f.write("".join(json.dumps(result.to_dict()) + "\n" for result in results))
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+from datetime import datetime
+from typing import Sequence
+from src.models.result import ScanResult
+from src.output.logger import Logger
+
+logger = Logger.get_instance()
+
+def _cell(value) -> str:
+    # a bare pipe would end the table cell
+    return str(value or '').replace("|", "\\|")
+
+def write(results: Sequence[ScanResult], output_file: str, command: str) -> bool:
+    """Write results to a Markdown file."""
+    try:
+        with open(output_file, 'w') as f:
+            f.write(f"# FwF Scanner Results\n\n")
+            f.write(f"**Command:** `{command}`\n\n")
+            f.write(f"*Scan completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n\n")
+            
+            f.write("| URL | Status | Content-Length | Response-Time | Content-Type | Target | Redirect | Payload |\n")
+            f.write("|-----|--------|---------------|---------------|-------------|--------|----------|---------|\n")
+            
+            for result in results:
+                f.write(f"| {result.url} | {result.status} | ")
+                f.write(f"{result.content_length} | {result.response_time:.3f}s | ")
+                f.write(f"{result.content_type or 'N/A'} | {_cell(result.target)} | ")
+                f.write(f"{_cell(result.redirect)} | {_cell(result.payload)} |\n")
+
+        return True
+    except Exception as e:
+        logger.error("Output", f"Failed to write Markdown file: {str(e)}")
+        return False
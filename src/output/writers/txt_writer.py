@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+from datetime import datetime
+from typing import TextIO
+from src.models.result import ScanResult
+
+# A line format: results are streamed to the file while the scan runs
+
+def write_header(f: TextIO, command: str):
+    f.write(f"# FwF Scanner Results - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    f.write(f"# Command: {command}\n\n")
+
+def write_batch(f: TextIO, results: list[ScanResult]):
+    f.write("".join(
+        f"URL: {result.url}\n"
+        + (f"Payload: {result.payload}\n" if result.payload else "")
+        + f"Status: {result.status}\n"
+        f"Content-Length: {result.content_length}\n"
+        f"Response-Time: {result.response_time:.3f}s\n"
+        f"Content-Type: {result.content_type or 'N/A'}\n"
+        + "-" * 60 + "\n"
+        for result in results
+    ))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+from datetime import datetime
+from typing import Sequence
+from src.models.result import ScanResult
+from src.output.logger import Logger
+from src.constants.default import XLSX_MAX_ROWS
+
+logger = Logger.get_instance()
+
+HEADER = ['URL', 'Status', 'Content-Length', 'Response-Time', 'Content-Type', 'Target', 'Redirect', 'Payload']
+
+def write(results: Sequence[ScanResult], output_file: str, command: str) -> bool:
+    """
+    Write results to an Excel file with openpyxl's write-only workbook,
+    which streams rows to disk as they are appended. Results beyond the
+    row limit of a sheet continue on 'Results 2', 'Results 3' and so on.
+    """
+    try:
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            logger.error("Output", "Excel output requires the openpyxl package. "
+                       "Install with: pip install openpyxl")
+            return False
+        
+        wb = Workbook(write_only=True)
+        ws_meta = wb.create_sheet(title="Metadata")
+        ws_meta.append(["FwF Scanner Results"])
+        ws_meta.append(["Command", command])
+        ws_meta.append(["Scan Date", datetime.now().strftime('%Y-%m-%d %H:%M:%S')])
+        ws_meta.append(["Total Results", len(results)])
+        
+        ws_results = wb.create_sheet(title="Results")
+        ws_results.append(HEADER)
+        rows, sheets = 1, 1
+        for result in results:
+            if rows == XLSX_MAX_ROWS:
+                sheets += 1
+                ws_results = wb.create_sheet(title=f"Results {sheets}")
+                ws_results.append(HEADER)
+                rows = 1
+            ws_results.append([
+                result.url,
+                result.status,
+                result.content_length,
+                f"{result.response_time:.3f}",
+                result.content_type or "N/A",
+                result.target,
+                result.redirect,
+                result.payload
+            ])
+            rows += 1
+            
+        wb.save(output_file)
+
+        return True
+    except Exception as e:
+        logger.error("Output", f"Failed to write Excel file: {str(e)}")
+        return False
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+from datetime import datetime
+from itertools import islice
+from typing import Sequence
+from src.models.result import ScanResult
+from src.output.logger import Logger
+from src.constants.default import WRITER_CHUNK_SIZE
+
+logger = Logger.get_instance()
+
+# Escape markup and drop the control characters XML 1.0 does not allow
+_ESCAPES = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;",
+    **{chr(code): None for code in range(32) if chr(code) not in "\t\n\r"},
+})
+
+def _text(value: str) -> str:
+    return value.translate(_ESCAPES)
+
+def _result(result: ScanResult) -> str:
+    return (
+        "    <Result>\n"
+        f"      <URL>{_text(result.url)}</URL>\n"
+        f"      <Status>{result.status}</Status>\n"
+        f"      <ContentLength>{result.content_length}</ContentLength>\n"
+        f"      <ResponseTime>{result.response_time:.3f}</ResponseTime>\n"
+        f"      <ContentType>{_text(result.content_type or 'N/A')}</ContentType>\n"
+        + (f"      <Target>{_text(result.target)}</Target>\n" if result.target else "")
+        + (f"      <Redirect>{_text(result.redirect)}</Redirect>\n" if result.redirect else "")
+        + (f"      <Payload>{_text(result.payload)}</Payload>\n" if result.payload else "")
+        + "    </Result>\n"
+    )
+
+def write(results: Sequence[ScanResult], output_file: str, command: str) -> bool:
+    """
+    Write results to an XML file, one chunk of elements at a time, in the
+    indented layout of minidom's toprettyxml.
+    """
+    try:
+        with open(output_file, 'w') as f:
+            f.write('<?xml version="1.0" ?>\n')
+            f.write("<FwFScanResults>\n")
+            f.write(f"  <Command>{_text(command)}</Command>\n")
+            f.write(f"  <ScanDate>{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</ScanDate>\n")
+            
+            if len(results):
+                f.write("  <Results>\n")
+                iterator = iter(results)
+                while chunk := list(islice(iterator, WRITER_CHUNK_SIZE)):
+                    f.write("".join(map(_result, chunk)))
+                f.write("  </Results>\n")
+            else:
+                f.write("  <Results/>\n")
+            f.write("</FwFScanResults>\n")
+
+        return True
+    except Exception as e:
+        logger.error("Output", f"Failed to write XML file: {str(e)}")
+        return False
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import uuid
+import aiohttp
+from dataclasses import dataclass
+from typing import Optional
+
+from src.input.file_getter import fingerprint as hash_bytes
+
+# Bytes of the body read to fingerprint a response
+CALIBRATION_BODY_LIMIT = 4096
+
+async def read_body_prefix(response: aiohttp.ClientResponse, limit: int) -> bytes:
+    """Read at most `limit` bytes of the response body."""
+    chunks = []
+    size = 0
+    while size < limit:
+        chunk = await response.content.read(limit - size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size += len(chunk)
+    return b"".join(chunks)
+
+@dataclass(frozen=True)
+class ResponseFingerprint:
+    """Shape of a response, with the requested path masked out of body and Location."""
+    status: int
+    words: int
+    lines: int
+    body_hash: int
+    location: Optional[str] = None
+
+    @classmethod
+    def build(cls, status: int, body: bytes, location: Optional[str], path: str) -> "ResponseFingerprint":
+        masked = body.replace(path.encode(), b"") if path else body
+        if location and path:
+            location = location.replace(path, "{PATH}")
+        return cls(
+            status=status,
+            words=len(masked.split()),
+            lines=masked.count(b"\n") + 1 if masked else 0,
+            body_hash=hash_bytes(masked),
+            location=location,
+        )
+
+    def matches(self, other: "ResponseFingerprint") -> bool:
+        """Same status and redirect, and either the same body or the same word and line counts."""
+        if self.status != other.status or self.location != other.location:
+            return False
+        return self.body_hash == other.body_hash or (self.words == other.words and self.lines == other.lines)
+
+class Calibrator:
+    """
+    Wildcard and soft-404 fingerprints learned per base URL before scanning.
+
+    A few random paths that cannot exist are requested under each base URL.
+    Responses that would be reported as hits (status in match_codes) become
+    baselines, and scan responses matching a baseline are discarded.
+    """
+    def __init__(self, match_codes: list[int], samples: int = 3):
+        self.match_codes = match_codes
+        self.samples = samples
+        self.baselines: dict[str, list[ResponseFingerprint]] = {}
+        self.discarded = 0
+
+    def probe_paths(self) -> list[str]:
+        """Return random paths covering a bare word, a file and a dotfile."""
+        shapes = ["{}", "{}.php", ".{}", "{}/", "{}.html"]
+        return [shapes[i % len(shapes)].format(uuid.uuid4().hex[:12]) for i in range(self.samples)]
+
+    def add_baseline(self, target: str, fingerprint: Optional[ResponseFingerprint]):
+        if fingerprint is None or fingerprint.status not in self.match_codes:
+            return
+        baselines = self.baselines.setdefault(target, [])
+        if not any(baseline.matches(fingerprint) for baseline in baselines):
+            baselines.append(fingerprint)
+
+    def is_wildcard(self, target: str, fingerprint: ResponseFingerprint) -> bool:
+        for baseline in self.baselines.get(target, ()):
+            if baseline.matches(fingerprint):
+                self.discarded += 1
+                return True
+        return False
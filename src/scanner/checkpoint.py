@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import json
+import time
+from dataclasses import asdict, fields
+from typing import Optional
+
+from src.models.config import ScanConfig
+from src.scanner.scheduler import ScanUnit
+
+STATE_VERSION = 1
+
+def unit_state(unit: ScanUnit) -> dict:
+    """Describe the progress of a scan unit: a completed-index watermark plus the in-flight set."""
+    next_index = unit.cursor.index
+    return {
+        "target": unit.target,
+        "root": unit.root,
+        "depth": unit.depth,
+        "watermark": unit.watermark,
+        "next": next_index,
+        "in_flight": [i for i in range(unit.watermark, next_index) if i not in unit.completed],
+    }
+
+class Checkpoint:
+    """
+    Append-only scan state file.
+
+    The first line holds the scan configuration. Each save appends one line
+    with the progress of every scan unit, so a save costs a single small
+    write however long the scan is. Resuming reads the last complete line;
+    a line truncated by a crash is ignored. Once the file has grown past
+    compact_every lines it is rewritten with just the header and the latest
+    state.
+    """
+    def __init__(self, path: str, compact_every: int = 1000):
+        self.path = path
+        self.compact_every = compact_every
+        self._header: Optional[str] = None
+        self._lines = 0
+
+    def start(self, config: ScanConfig, wordlist_count: Optional[int], append: bool = False):
+        """
+        Write the configuration header, or keep the existing file when
+        resuming. The wordlist count is None while it is still being spooled;
+        state lines carry it once it is known.
+        """
+        self._header = json.dumps({
+            "type": "config",
+            "version": STATE_VERSION,
+            "wordlist_count": wordlist_count,
+            "config": asdict(config),
+        }, default=str)
+        if append and os.path.exists(self.path):
+            return
+        with open(self.path, 'w') as f:
+            f.write(self._header + "\n")
+
+    def save(self, states: list[dict], complete: bool = False, wordlist_count: Optional[int] = None):
+        """Append the progress of every unit, as described by unit_state."""
+        line = json.dumps({
+            "type": "state",
+            "saved_at": time.time(),
+            "complete": complete,
+            "wordlist_count": wordlist_count,
+            "units": states,
+        })
+        self._lines += 1
+        if self._lines >= self.compact_every:
+            self._compact(line)
+            return
+        with open(self.path, 'a') as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _compact(self, line: str):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, 'w') as f:
+            f.write(self._header + "\n" + line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self._lines = 0
+
+    @staticmethod
+    def load(path: str) -> tuple[dict, Optional[dict]]:
+        """Return the header and the last complete state record of a state file."""
+        header, state = None, None
+        try:
+            with open(path, 'r') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if record.get("type") == "config":
+                        header = record
+                    elif record.get("type") == "state":
+                        state = record
+        except OSError as e:
+            raise RuntimeError(f"Failed to load scan state from file: {path}") from e
+        if header is None:
+            raise RuntimeError(f"Not a FwF scan state file: {path}")
+        return header, state
+
+    @staticmethod
+    def load_config(path: str) -> ScanConfig:
+        """Rebuild the ScanConfig stored in a state file."""
+        header, _ = Checkpoint.load(path)
+        known = {f.name for f in fields(ScanConfig)}
+        return ScanConfig(**{k: v for k, v in header["config"].items() if k in known})
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import aiohttp
+
+class ConnectionStats:
+    """
+    Counts connections opened and reused by a ClientSession, using aiohttp
+    request tracing. Each opened connection is a TCP (and TLS) handshake;
+    a high reuse share confirms keep-alive is working.
+    """
+    def __init__(self):
+        self.opened = 0
+        self.reused = 0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_create)
+        trace_config.on_connection_reuseconn.append(self._on_reuse)
+        return trace_config
+
+    async def _on_create(self, session, context, params):
+        self.opened += 1
+
+    async def _on_reuse(self, session, context, params):
+        self.reused += 1
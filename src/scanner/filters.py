@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import re
+from typing import Optional
+from src.models.config import ScanConfig
+
+def parse_ranges(value: str) -> list[tuple[float, float]]:
+    """
+    Parse comma-separated values and ranges such as '0,100-200,1000-' into
+    inclusive (low, high) pairs; an open end is unbounded.
+    """
+    ranges = []
+    for item in value.split(','):
+        item = item.strip()
+        if not item:
+            continue
+        low, sep, high = item.partition('-')
+        try:
+            low = float(low) if low else 0.0
+            high = (float(high) if high else float('inf')) if sep else low
+        except ValueError:
+            raise ValueError(f"Invalid range '{item}'. Use N, MIN-MAX, MIN- or -MAX") from None
+        if low > high:
+            raise ValueError(f"Invalid range '{item}': {low:g} is greater than {high:g}")
+        ranges.append((low, high))
+    if not ranges:
+        raise ValueError("No range given")
+    return ranges
+
+def _in_ranges(value: float, ranges: list[tuple[float, float]]) -> bool:
+    return any(low <= value <= high for low, high in ranges)
+
+class ResponseFilter:
+    """
+    Decides which responses become results, before anything is stored.
+
+    Matchers must all pass and no filter may hit. Checks run cheapest first,
+    in two stages: the header stage looks at the status, response time,
+    Content-Length and Content-Type and usually decides alone; only when a
+    word, line or regex check is configured, or a size check meets a
+    response without Content-Length, does the body stage read up to
+    body_limit bytes and count or search them. Sizes, words and lines of a
+    longer body are those of its prefix.
+    """
+    def __init__(self, match_codes: Optional[list[int]] = None, filter_codes: Optional[list[int]] = None,
+                 match_size: Optional[str] = None, filter_size: Optional[str] = None,
+                 match_words: Optional[str] = None, filter_words: Optional[str] = None,
+                 match_lines: Optional[str] = None, filter_lines: Optional[str] = None,
+                 match_time: Optional[str] = None, filter_time: Optional[str] = None,
+                 match_type: Optional[list[str]] = None, filter_type: Optional[list[str]] = None,
+                 match_regex: Optional[str] = None, filter_regex: Optional[str] = None,
+                 body_limit: int = 65536):
+        self.match_codes = frozenset(match_codes) if match_codes else None
+        self.filter_codes = frozenset(filter_codes or ())
+        self.match_size = parse_ranges(match_size) if match_size else None
+        self.filter_size = parse_ranges(filter_size) if filter_size else None
+        self.match_words = parse_ranges(match_words) if match_words else None
+        self.filter_words = parse_ranges(filter_words) if filter_words else None
+        self.match_lines = parse_ranges(match_lines) if match_lines else None
+        self.filter_lines = parse_ranges(filter_lines) if filter_lines else None
+        # response times are given in milliseconds and measured in seconds
+        self.match_time = [(l / 1000, h / 1000) for l, h in parse_ranges(match_time)] if match_time else None
+        self.filter_time = [(l / 1000, h / 1000) for l, h in parse_ranges(filter_time)] if filter_time else None
+        self.match_type = tuple(t.lower() for t in match_type) if match_type else None
+        self.filter_type = tuple(t.lower() for t in filter_type) if filter_type else None
+        self.match_regex = re.compile(match_regex.encode()) if match_regex else None
+        self.filter_regex = re.compile(filter_regex.encode()) if filter_regex else None
+        self.body_limit = body_limit
+        self.checks_size = self.match_size is not None or self.filter_size is not None
+        self.checks_body = any(check is not None for check in (
+            self.match_words, self.filter_words, self.match_lines, self.filter_lines,
+            self.match_regex, self.filter_regex,
+        ))
+        self.rejected = 0
+
+    @classmethod
+    def from_config(cls, config: ScanConfig) -> "ResponseFilter":
+        return cls(
+            config.match_codes, config.filter_codes,
+            config.match_size, config.filter_size,
+            config.match_words, config.filter_words,
+            config.match_lines, config.filter_lines,
+            config.match_time, config.filter_time,
+            config.match_type, config.filter_type,
+            config.match_regex, config.filter_regex,
+            config.body_limit,
+        )
+
+    def check_status(self, status: int) -> bool:
+        """Return True if a response with this status can still match."""
+        if self.match_codes is not None and status not in self.match_codes:
+            return False
+        return status not in self.filter_codes
+
+    def check_headers(self, status: int, elapsed: float, length: Optional[int],
+                      content_type: Optional[str]) -> Optional[bool]:
+        """
+        Run the header stage. Returns False to reject, True to accept, or
+        None if the body is needed to decide.
+        """
+        if not self.check_status(status):
+            return self._reject()
+        if self.match_time is not None and not _in_ranges(elapsed, self.match_time):
+            return self._reject()
+        if self.filter_time is not None and _in_ranges(elapsed, self.filter_time):
+            return self._reject()
+        if self.checks_size and length is not None and not self._check_size(length):
+            return self._reject()
+        if self.match_type is not None or self.filter_type is not None:
+            content_type = (content_type or "").lower()
+            if self.match_type is not None and not any(t in content_type for t in self.match_type):
+                return self._reject()
+            if self.filter_type is not None and any(t in content_type for t in self.filter_type):
+                return self._reject()
+        if self.checks_body or (self.checks_size and length is None):
+            return None
+        return True
+
+    def check_body(self, body: bytes, length: Optional[int]) -> bool:
+        """Run the body stage on the body prefix, for a response that passed the header stage."""
+        if length is None and self.checks_size and not self._check_size(len(body)):
+            return self._reject()
+        if self.match_words is not None or self.filter_words is not None:
+            words = len(body.split())
+            if self.match_words is not None and not _in_ranges(words, self.match_words):
+                return self._reject()
+            if self.filter_words is not None and _in_ranges(words, self.filter_words):
+                return self._reject()
+        if self.match_lines is not None or self.filter_lines is not None:
+            lines = body.count(b"\n") + 1 if body else 0
+            if self.match_lines is not None and not _in_ranges(lines, self.match_lines):
+                return self._reject()
+            if self.filter_lines is not None and _in_ranges(lines, self.filter_lines):
+                return self._reject()
+        if self.match_regex is not None and not self.match_regex.search(body):
+            return self._reject()
+        if self.filter_regex is not None and self.filter_regex.search(body):
+            return self._reject()
+        return True
+
+    def _check_size(self, size: int) -> bool:
+        if self.match_size is not None and not _in_ranges(size, self.match_size):
+            return False
+        return self.filter_size is None or not _in_ranges(size, self.filter_size)
+
+    def _reject(self) -> bool:
+        self.rejected += 1
+        return False
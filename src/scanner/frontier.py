@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+from collections import Counter
+from typing import Optional
+from urllib.parse import urljoin, urlsplit
+
+from src.input.file_getter import FingerprintSet, fingerprint
+from src.models.result import ScanResult
+
+REDIRECT_STATUS = (301, 302, 307, 308)
+
+class Frontier:
+    """
+    Bookkeeping for recursive scans.
+
+    Every requested URL is remembered as a 64-bit fingerprint so that no URL
+    is requested twice, whichever directory it was reached from. Directories
+    are admitted for recursion at most once, only down to max_depth, and at
+    most per_depth_limit per depth level.
+    """
+    def __init__(self, max_depth: int, per_depth_limit: Optional[int] = None):
+        self.max_depth = max_depth
+        self.per_depth_limit = per_depth_limit
+        self.skipped = 0
+        self._urls = FingerprintSet()
+        self._directories: set[str] = set()
+        self._per_depth = Counter()
+
+    def first_visit(self, url: str) -> bool:
+        """Record a URL about to be requested, returning False if it already was."""
+        if self._urls.add(fingerprint(url.encode())):
+            return True
+        self.skipped += 1
+        return False
+
+    def admit(self, directory: str, depth: int) -> bool:
+        """Return True if the directory should be scanned at the given depth."""
+        if depth > self.max_depth or directory in self._directories:
+            return False
+        if self.per_depth_limit and self._per_depth[depth] >= self.per_depth_limit:
+            return False
+        self._directories.add(directory)
+        self._per_depth[depth] += 1
+        return True
+
+    @staticmethod
+    def directory_of(result: ScanResult) -> Optional[str]:
+        """Return the directory URL a result points at, if it looks like one."""
+        url = result.url.split('?', 1)[0]
+        if result.status in REDIRECT_STATUS and result.redirect:
+            location = urljoin(result.url, result.redirect).split('?', 1)[0]
+            if location == url.rstrip('/') + '/':
+                return location
+            return None
+        last_segment = urlsplit(url).path.rstrip('/').rsplit('/', 1)[-1]
+        if result.status == 403 and (url.endswith('/') or '.' not in last_segment):
+            return url.rstrip('/') + '/'
+        if 200 <= result.status < 300 and url.endswith('/'):
+            return url
+        return None
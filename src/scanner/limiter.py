@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import asyncio
+import time
+
+# Status codes that mean the target is asking us to slow down
+OVERLOAD_STATUS = (429, 503)
+
+class AdaptiveLimiter:
+    """
+    Limit on in-flight requests that adapts to the target (AIMD).
+
+    The limit starts small and doubles every round (one round is `limit`
+    completed requests) until the first congestion signal, then grows by one
+    per round. A timeout, connection error or 429/503 cuts it to 70%, at most
+    once per smoothed round-trip so that one burst of failures counts once.
+    A round whose mean latency exceeds twice the best observed mean trims it
+    to 90%. The limit always stays within [minimum, maximum].
+
+    `history` holds one (elapsed, lowest, highest, last) sample per second,
+    so the range the limit moved through survives however often it changes;
+    elapsed counts from `started_at`, a wall-clock time other processes can
+    line their own histories up with.
+    """
+    def __init__(self, minimum: int, maximum: int, initial: int = 10):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.limit = max(minimum, min(maximum, initial))
+        self.initial = self.limit
+        self.in_flight = 0
+        self.history: list[tuple[float, int, int, int]] = []
+
+        self._started = time.monotonic()
+        self.started_at = time.time()
+        self._slow_start = True
+        self._baseline = None
+        self._srtt = 0.0
+        self._round_count = 0
+        self._round_latency = 0.0
+        self._last_decrease = 0.0
+        self._changed = asyncio.Condition()
+        self._record()
+
+    async def acquire(self):
+        async with self._changed:
+            await self._changed.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self, latency: float, congested: bool = False):
+        """Give a slot back and feed the outcome of the request into the controller."""
+        async with self._changed:
+            self.in_flight -= 1
+            previous = self.limit
+            if congested:
+                self._on_congestion()
+            else:
+                self._on_success(latency)
+            if self.limit > previous:
+                self._changed.notify(self.limit - previous + 1)
+            else:
+                self._changed.notify()
+
+    def _on_congestion(self):
+        now = time.monotonic()
+        if now - self._last_decrease < self._srtt:
+            return
+        self._last_decrease = now
+        self._slow_start = False
+        self._set_limit(int(self.limit * 0.7))
+        self._reset_round()
+
+    def _on_success(self, latency: float):
+        self._srtt = latency if not self._srtt else 0.875 * self._srtt + 0.125 * latency
+        self._round_count += 1
+        self._round_latency += latency
+        if self._round_count < self.limit:
+            return
+
+        mean = self._round_latency / self._round_count
+        self._baseline = mean if self._baseline is None else min(mean, self._baseline * 1.05)
+        if mean > self._baseline * 2:
+            self._slow_start = False
+            self._set_limit(int(self.limit * 0.9))
+        elif self._slow_start:
+            self._set_limit(self.limit * 2)
+        else:
+            self._set_limit(self.limit + 1)
+        self._reset_round()
+
+    def _reset_round(self):
+        self._round_count = 0
+        self._round_latency = 0.0
+
+    def _set_limit(self, limit: int):
+        self.limit = max(self.minimum, min(self.maximum, limit))
+        self._record()
+
+    def _record(self):
+        """Fold the current limit into this second's sample, starting a new one each second."""
+        elapsed = time.monotonic() - self._started
+        limit = self.limit
+        if self.history and elapsed - self.history[-1][0] < 1.0:
+            started, lowest, highest, _ = self.history[-1]
+            self.history[-1] = (started, min(lowest, limit), max(highest, limit), limit)
+        else:
+            self.history.append((elapsed, limit, limit, limit))
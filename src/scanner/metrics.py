@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import aiohttp
+from bisect import bisect_left
+from time import perf_counter
+from typing import Optional
+
+# Phases of a request, in the order they happen
+PHASES = ("queue", "dns", "connect", "ttfb", "transfer", "total")
+
+class Histogram:
+    """
+    Latency histogram with fixed log-spaced buckets, eight per doubling,
+    from 0.1 ms to about 100 s, so memory stays constant however many
+    values are recorded. Quantiles are interpolated linearly inside the
+    bucket they fall in, whose bounds are 9% apart, and kept within the
+    smallest and largest values recorded.
+    """
+    BOUNDS = tuple(0.0001 * 2 ** (i / 8) for i in range(161))
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def record(self, value: float):
+        self.counts[bisect_left(self.BOUNDS, value)] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                lower = self.BOUNDS[i - 1] if i else 0.0
+                upper = self.BOUNDS[i] if i < len(self.BOUNDS) else self.max
+                return max(self.min, min(lower + (upper - lower) * (rank - seen) / count, self.max))
+            seen += count
+        return self.max
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """Return each bucket's upper bound with the number of values at or below it."""
+        result = []
+        seen = 0
+        for bound, count in zip(self.BOUNDS, self.counts):
+            seen += count
+            result.append((bound, seen))
+        return result
+
+    def merge(self, other: "Histogram"):
+        if other.count:
+            self.min = min(self.min, other.min) if self.count else other.min
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> dict:
+        return {"counts": self.counts, "count": self.count, "sum": self.sum, "min": self.min, "max": self.max}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Histogram":
+        histogram = cls()
+        histogram.counts = list(data["counts"])
+        histogram.count = data["count"]
+        histogram.sum = data["sum"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+class PhaseTiming:
+    """perf_counter timestamps of one request, filled in by the trace hooks."""
+    __slots__ = ("started", "queue", "dns", "connect", "mark", "headers_sent", "headers_received")
+
+    def __init__(self):
+        self.started = perf_counter()
+        self.queue = 0.0
+        self.dns = 0.0
+        self.connect = 0.0
+        self.mark = 0.0
+        self.headers_sent: Optional[float] = None
+        self.headers_received: Optional[float] = None
+
+class RequestMetrics:
+    """
+    Per-phase request timing collected through aiohttp tracing.
+
+    process_request starts a PhaseTiming for each scan request and passes
+    it as trace_request_ctx; the hooks record time spent waiting for a pool
+    slot, resolving DNS, connecting (TCP and, for https, the TLS handshake,
+    which aiohttp does not report separately), waiting for the first byte
+    after the request was sent, and reading the body. Requests without a
+    PhaseTiming, such as calibration probes, are not measured.
+    """
+    def __init__(self):
+        self.phases = {phase: Histogram() for phase in PHASES}
+        self.started = 0
+        self.finished = 0
+        self.errors = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self.started - self.finished
+
+    def start(self) -> PhaseTiming:
+        self.started += 1
+        return PhaseTiming()
+
+    def finish(self, timing: PhaseTiming):
+        """Record the phases of a request whose body has been handled."""
+        now = perf_counter()
+        self.finished += 1
+        phases = self.phases
+        # waiting, resolving and connecting only happen for some requests, so only those are counted
+        if timing.queue:
+            phases["queue"].record(timing.queue)
+        if timing.dns:
+            phases["dns"].record(timing.dns)
+        if timing.connect:
+            phases["connect"].record(max(0.0, timing.connect - timing.dns))
+        if timing.headers_sent is not None and timing.headers_received is not None:
+            phases["ttfb"].record(timing.headers_received - timing.headers_sent)
+            phases["transfer"].record(now - timing.headers_received)
+        phases["total"].record(now - timing.started)
+
+    def fail(self, timing: PhaseTiming):
+        self.finished += 1
+        self.errors += 1
+
+    def merge_phases(self, phases: dict[str, dict]):
+        for phase, data in phases.items():
+            self.phases[phase].merge(Histogram.from_dict(data))
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(_mark)
+        trace_config.on_connection_queued_end.append(_add_since_mark("queue"))
+        trace_config.on_dns_resolvehost_start.append(_mark)
+        trace_config.on_dns_resolvehost_end.append(_add_since_mark("dns"))
+        trace_config.on_connection_create_start.append(_mark_connect)
+        trace_config.on_connection_create_end.append(_add_connect)
+        trace_config.on_request_headers_sent.append(_headers_sent)
+        trace_config.on_request_end.append(_headers_received)
+        return trace_config
+
+async def _mark(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.mark = perf_counter()
+
+def _add_since_mark(phase: str):
+    async def hook(session, context, params):
+        timing = context.trace_request_ctx
+        if timing is not None:
+            setattr(timing, phase, getattr(timing, phase) + perf_counter() - timing.mark)
+    return hook
+
+async def _mark_connect(session, context, params):
+    # DNS resolution happens inside connection creation and keeps its own mark
+    if context.trace_request_ctx is not None:
+        context.connect_started = perf_counter()
+
+async def _add_connect(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.connect += perf_counter() - context.connect_started
+
+async def _headers_sent(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.headers_sent = perf_counter()
+
+async def _headers_received(session, context, params):
+    if context.trace_request_ctx is not None:
+        context.trace_request_ctx.headers_received = perf_counter()
@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import math
+import time
+import queue
+import signal
+import asyncio
+import aiohttp
+import multiprocessing
+from dataclasses import replace
+from typing import Optional
+
+from src.output.logger import Logger
+from src.models.config import ScanConfig
+from src.output.sink import open_sinks
+from src.scanner.scanner import SPOOL_ANNOUNCE_WAIT, SPOOL_WATCH_INTERVAL, FwFScanner
+from src.scanner.scheduler import ScanUnit
+from src.scanner.checkpoint import Checkpoint
+from src.scanner.metrics import RequestMetrics
+from src.input.fuzz import load_paths, spool_paths, spooled_total
+from src.output.scan_info import print_scan_info, print_total_paths
+from src.output.summary import print_summary
+from src.output.progress import write_metrics_file
+
+logger = Logger.get_instance()
+
+# Results a worker process collects before handing them to the parent in one message
+SHARD_BATCH_SIZE = 64
+# Longest a worker process holds on to a partial batch, in seconds
+SHARD_FLUSH_INTERVAL = 0.5
+# Longest a worker process waits for the parent to confirm its results are on disk
+SHARD_SYNC_TIMEOUT = 10.0
+# Longest a worker process blocks a thread on its command queue before checking again
+SHARD_COMMAND_TIMEOUT = 0.5
+
+def shard_config(config: ScanConfig, index: int, count: int) -> ScanConfig:
+    """Return the configuration of one worker process, with its share of the concurrency and rate limits."""
+    concurrency = max(1, math.ceil(config.concurrency / count))
+    checkpoint = f"{config.checkpoint}.{index}" if config.checkpoint else None
+    return replace(
+        config,
+        workers=1,
+        concurrency=concurrency,
+        min_concurrency=min(concurrency, max(1, math.ceil(config.min_concurrency / count))),
+        host_concurrency=max(1, math.ceil(config.host_concurrency / count)) if config.host_concurrency else None,
+        rate=config.rate / count if config.rate else None,
+        host_rate=config.host_rate / count if config.host_rate else None,
+        burst=max(1, math.ceil(config.burst / count)) if config.burst else None,
+        output=None,
+        checkpoint=checkpoint,
+        resume=checkpoint if config.resume and checkpoint and os.path.exists(checkpoint) else None,
+    )
+
+def merge_histories(histories: list[tuple[float, int, list[tuple[float, int, int, int]]]]
+                    ) -> list[tuple[float, int, int, int]]:
+    """
+    Sum the adaptive concurrency limits of several worker processes over
+    time. Each history comes with the offset of its worker's clock from the
+    scan start and the limit the worker started at: samples are placed on
+    the scan's clock, and a worker counts at its initial limit until its
+    first sample and at its last limit after that. While one worker's limit
+    moves through its range in a second, the others are taken at their last
+    limit.
+    """
+    current = {shard: initial for shard, (_, initial, _) in enumerate(histories)}
+    merged = []
+    events = sorted((offset + sample[0], shard, sample)
+                    for shard, (offset, _, history) in enumerate(histories) for sample in history)
+    for t, shard, (_, lowest, highest, last) in events:
+        others = sum(limit for other, limit in current.items() if other != shard)
+        current[shard] = last
+        lowest, highest, last = others + lowest, others + highest, others + last
+        if merged and t - merged[-1][0] < 1.0:
+            started, merged_lowest, merged_highest, _ = merged[-1]
+            merged[-1] = (started, min(merged_lowest, lowest), max(merged_highest, highest), last)
+        else:
+            merged.append((t, lowest, highest, last))
+    return merged
+
+class ShardScanner(FwFScanner):
+    """
+    One worker process of a parallel scan.
+
+    It scans every target with its own slice of the wordlist and sends
+    results, directories worth recursing into and its final statistics to
+    the parent over `channel`. Running out of work does not end it: another
+    worker may still find a directory that this one has to scan its slice
+    of, so it reports idle and waits on `commands` for new directories or
+    the order to stop. Its words come from the spool directories the
+    parent is writing.
+    """
+    def __init__(self, config: ScanConfig, index: int, count: int, channel, commands, synced, spools: list[str]):
+        super().__init__(config)
+        self.index = index
+        self.count = count
+        self.spools = spools
+        self.channel = channel
+        self.commands = commands
+        self.synced = synced
+        self._batch = []
+        self._batch_started = time.monotonic()
+        self._generation = 0
+
+    def stats(self) -> dict:
+        """Return the counters the parent merges into the summary."""
+        return {
+            "completed": self.completed,
+            "failed_tasks": dict(self.failed_tasks),
+            "requests_sent": self.requests_sent,
+            "retries_sent": self.retries_sent,
+            "first_request_at": self.first_request_at,
+            "discarded": self.calibrator.discarded if self.calibrator else 0,
+            "history": self.limiter.history if self.limiter else [],
+            "history_started_at": self.limiter.started_at if self.limiter else None,
+            "initial_limit": self.limiter.initial if self.limiter else None,
+            "connections_opened": self.connections.opened,
+            "connections_reused": self.connections.reused,
+            "phases": {phase: histogram.to_dict() for phase, histogram in self.metrics.phases.items()},
+            "progress": self._snapshot() if self.paths else None,
+            "head_probes": (self.head_probe.answered, self.head_probe.escalated) if self.head_probe else (0, 0),
+            "filtered": self.response_filter.rejected,
+        }
+
+    def _publish_progress(self, snapshot: dict, interval: float):
+        snapshot["phases"] = {phase: histogram.to_dict() for phase, histogram in self.metrics.phases.items()}
+        self.channel.put(("progress", self.index, snapshot))
+
+    def _spool_wordlist(self):
+        return load_paths(self.config, self.index, self.count, self.spools)
+
+    def _announce(self) -> bool:
+        return False
+
+    def _report(self, start_time: float, run_started: float):
+        self._flush()
+
+    def _record(self, result):
+        self._batch.append(result)
+        if len(self._batch) >= SHARD_BATCH_SIZE or time.monotonic() - self._batch_started >= SHARD_FLUSH_INTERVAL:
+            self._flush()
+
+    def _flush(self):
+        if self._batch:
+            self.channel.put(("results", self.index, self._batch))
+            self._batch = []
+        self._batch_started = time.monotonic()
+
+    async def _sync_output(self):
+        """Hand over pending results and wait on a thread until the parent has written them"""
+        self._flush()
+        self.synced.clear()
+        self.channel.put(("sync", self.index))
+        if not await asyncio.get_running_loop().run_in_executor(None, self.synced.wait, SHARD_SYNC_TIMEOUT):
+            logger.warning("[WORKER]", f"worker {self.index} saved a checkpoint without output confirmation")
+
+    async def _recurse(self, session: aiohttp.ClientSession, unit: ScanUnit, result):
+        """Propose the directory a result points at; the parent admits it for every worker"""
+        directory = self.frontier.directory_of(result)
+        if directory and unit.depth < self.frontier.max_depth:
+            self.channel.put(("recurse", self.index, directory, unit.depth + 1, unit.root))
+
+    async def _run_workers(self, session: aiohttp.ClientSession):
+        """Drain the local scheduler, then wait for directories from the parent until told to stop"""
+        while True:
+            await super()._run_workers(session)
+            self._flush()
+            self.channel.put(("idle", self.index, self._generation))
+            command = await self._next_command()
+            while command is not None:
+                if command[0] == "stop":
+                    return
+                _, directory, depth, root, self._generation = command
+                await self._add_directory(session, directory, depth, root)
+                try:
+                    command = self.commands.get_nowait()
+                except queue.Empty:
+                    command = None
+
+    async def _next_command(self) -> tuple:
+        """Block a thread, not the event loop, on the command queue until the parent sends something"""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                return await loop.run_in_executor(None, self.commands.get, True, SHARD_COMMAND_TIMEOUT)
+            except queue.Empty:
+                continue
+
+def run_shard(config: ScanConfig, index: int, count: int, channel, commands, synced, spools: list[str]):
+    """Entry point of a worker process."""
+    # the parent stops a stuck worker with SIGTERM; unwind as on Ctrl+C so the scan's cleanup runs
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    sys.stdout.reconfigure(line_buffering=True)
+    Logger.get_instance().set_color(config.color).set_verbose(config.verbose)
+    scanner = ShardScanner(config, index, count, channel, commands, synced, spools)
+    try:
+        asyncio.run(scanner.run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # an interrupted worker never reaches _report, so hand over the results it still holds
+        scanner._flush()
+        Logger.get_instance().flush()
+        channel.put(("done", index, scanner.stats()))
+
+class ParallelScanner(FwFScanner):
+    """
+    Splits a scan across config.workers processes to use more than one core.
+
+    Worker i scans every target with every workers-th unique path starting
+    at i, read from the one spool the parent writes while the workers
+    start, on its own event loop and session, with an equal share of the
+    concurrency and rate limits. The parent owns the output: it streams the
+    workers' results to the sinks, admits each directory for recursion once
+    and hands it to all workers, and merges their statistics into a single
+    summary. With --checkpoint each worker keeps its own state file, named
+    after the parent's with the worker number appended.
+    """
+    def __init__(self, config: ScanConfig):
+        super().__init__(config)
+        self._processes: list[multiprocessing.Process] = []
+        self._channel = None
+        self._commands = []
+        self._synced = []
+        self._alive: set[int] = set()
+        self._idle: dict[int, int] = {}
+        self._generation = 0
+        self._stopping = False
+        self._histories = []
+        self._discarded = 0
+        self._progress: dict[int, dict] = {}
+        self._progress_changed = False
+        self._published_at: Optional[float] = None
+        self._spools = []
+        self._receiving: Optional[asyncio.Future] = None
+
+    async def run(self):
+        """Start the worker processes and collect their results"""
+        run_started = time.time()
+        count = self.config.workers
+        sys.stdout.reconfigure(line_buffering=True)
+        resume_states = self._load_resume_states() if self.config.resume else None
+        if resume_states is not None and all(state and state.get("complete") for state in resume_states):
+            print_scan_info(self.config)
+            logger.info("[RESUME]", f"Scan in {self.config.resume} is already complete")
+            return
+        self._spools = spool_paths(self.config, count)
+        try:
+            total_paths = spooled_total(self._spools, self.config.fuzz_mode, SPOOL_ANNOUNCE_WAIT)
+            print_scan_info(self.config, total_paths)
+            if self.config.checkpoint:
+                self.checkpoint = Checkpoint(self.config.checkpoint)
+                self.checkpoint.start(self.config, None, append=resume_states is not None)
+            if self.frontier:
+                for target in self.config.urls:
+                    self.frontier.admit(target.rstrip('/') + '/', 0)
+                for state in resume_states or []:
+                    for unit in (state or {}).get("units", []):
+                        self.frontier.admit(unit["target"].rstrip('/') + '/', unit["depth"])
+
+            context = multiprocessing.get_context("spawn")
+            self._channel = context.Queue()
+            self._commands = [context.Queue() for _ in range(count)]
+            self._synced = [context.Event() for _ in range(count)]
+            self._processes = [
+                context.Process(
+                    target=run_shard,
+                    args=(shard_config(self.config, i, count), i, count, self._channel, self._commands[i],
+                          self._synced[i], [spool.directory for spool in self._spools]),
+                    name=f"fwf-worker-{i}",
+                    daemon=True
+                )
+                for i in range(count)
+            ]
+
+            start_time = time.time()
+            self.sinks = open_sinks(self.config.output, append=resume_states is not None,
+                                    atomic=not self.config.checkpoint)
+            self.completed = True
+            background = []
+            try:
+                for process in self._processes:
+                    process.start()
+                self._alive = set(range(count))
+                if total_paths is None:
+                    background.append(asyncio.create_task(self._announce_total()))
+                if self.config.progress or self.config.metrics_file:
+                    background.append(asyncio.create_task(self._progress_loop()))
+                await self._coordinate()
+            finally:
+                for task in background:
+                    task.cancel()
+                await self._coordinate(timeout=SHARD_SYNC_TIMEOUT)
+                for process in self._processes:
+                    process.join(1)
+                    if process.is_alive():
+                        process.terminate()
+                        self.completed = False
+                for sink in self.sinks:
+                    sink.close(self.completed)
+        finally:
+            # removes the spool directories even if a worker or the setup failed
+            for spool in self._spools:
+                spool.close()
+
+        self._report(start_time, run_started)
+
+    async def _announce_total(self):
+        """Print the number of paths once the spools are complete, for a header that went out without it"""
+        while (total_paths := spooled_total(self._spools, self.config.fuzz_mode)) is None:
+            await asyncio.sleep(SPOOL_WATCH_INTERVAL)
+        print_total_paths(total_paths)
+
+    def _load_resume_states(self) -> list[Optional[dict]]:
+        states = []
+        for i in range(self.config.workers):
+            path = f"{self.config.resume}.{i}"
+            states.append(Checkpoint.load(path)[1] if os.path.exists(path) else None)
+        return states
+
+    async def _coordinate(self, timeout: Optional[float] = None):
+        """Handle worker messages until every worker has reported done, or the timeout runs out"""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while self._alive and (deadline is None or time.monotonic() < deadline):
+            message = await self._receive(0.5)
+            if message is not None:
+                self._handle(message)
+                continue
+            for i in list(self._alive):
+                if not self._processes[i].is_alive():
+                    logger.error("[WORKER]", f"worker {i} exited with code {self._processes[i].exitcode}")
+                    self._alive.discard(i)
+                    self.completed = False
+            self._maybe_stop()
+
+    async def _receive(self, timeout: float) -> Optional[tuple]:
+        """
+        Block a thread on the message queue for up to `timeout` seconds. The
+        read is shielded, so a message it takes after the caller is cancelled
+        is returned by the next call instead of being lost.
+        """
+        if self._receiving is None:
+            self._receiving = asyncio.get_running_loop().run_in_executor(None, self._get_message, timeout)
+        message = await asyncio.shield(self._receiving)
+        self._receiving = None
+        return message
+
+    def _get_message(self, timeout: float) -> Optional[tuple]:
+        try:
+            return self._channel.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def _handle(self, message: tuple):
+        kind, index = message[0], message[1]
+        if kind == "results":
+            for result in message[2]:
+                super()._record(result)
+        elif kind == "sync":
+            self._sync_sinks()
+            self._synced[index].set()
+        elif kind == "recurse":
+            _, _, directory, depth, root = message
+            if self.frontier.admit(directory, depth):
+                logger.info("[RECURSE]", f"depth {depth}", directory)
+                self._generation += 1
+                for i in self._alive:
+                    self._commands[i].put(("unit", directory, depth, root, self._generation))
+        elif kind == "progress":
+            self._progress[index] = message[2]
+            self._progress_changed = True
+        elif kind == "idle":
+            self._idle[index] = message[2]
+        elif kind == "done":
+            self._alive.discard(index)
+            self._merge(index, message[2])
+        self._maybe_stop()
+
+    def _maybe_stop(self):
+        """Tell the workers to stop once all of them are idle with every directory handed out"""
+        if self._stopping or not self._alive:
+            return
+        if all(self._idle.get(i) == self._generation for i in self._alive):
+            self._stopping = True
+            for i in self._alive:
+                self._commands[i].put(("stop",))
+
+    def _snapshot(self) -> dict:
+        """Sum the latest progress reported by every worker"""
+        snapshot = {key: sum(p[key] for p in self._progress.values()) for key in ("requests", "errors", "in_flight",
+                                                                                  "done", "total")}
+        snapshot["results"] = self.results_count
+        return snapshot
+
+    def _publish_progress(self, snapshot: dict, interval: float):
+        """
+        Publish only once a worker has reported since the last tick, with
+        rates over the time since then: the workers report on their own
+        clocks, so a tick can fall before any new report arrives.
+        """
+        if not self._progress_changed:
+            return
+        self._progress_changed = False
+        now = time.monotonic()
+        if self._published_at is not None:
+            interval = now - self._published_at
+        self._published_at = now
+        super()._publish_progress(snapshot, interval)
+
+    def _phase_timings(self) -> dict:
+        phases = RequestMetrics()
+        for progress in self._progress.values():
+            phases.merge_phases(progress["phases"])
+        return phases.phases
+
+    def _merge(self, index: int, stats: dict):
+        if stats["progress"] is not None:
+            self._progress[index] = {**stats["progress"], "phases": stats["phases"]}
+        self.completed = self.completed and stats["completed"]
+        self.failed_tasks.update(stats["failed_tasks"])
+        self.requests_sent += stats["requests_sent"]
+        self.retries_sent += stats["retries_sent"]
+        if stats["first_request_at"] is not None:
+            self.first_request_at = min(self.first_request_at or stats["first_request_at"], stats["first_request_at"])
+        self._discarded += stats["discarded"]
+        self.response_filter.rejected += stats["filtered"]
+        self.connections.opened += stats["connections_opened"]
+        self.connections.reused += stats["connections_reused"]
+        if self.head_probe:
+            self.head_probe.answered += stats["head_probes"][0]
+            self.head_probe.escalated += stats["head_probes"][1]
+        if stats["history"]:
+            self._histories.append((stats["history_started_at"], stats["initial_limit"], stats["history"]))
+
+    def _concurrency_history(self, start_time: float) -> Optional[list[tuple[float, int, int, int]]]:
+        """Merge the workers' limit histories on the clock of the scan, which started at `start_time`"""
+        histories = [(started_at - start_time, initial, history) for started_at, initial, history in self._histories]
+        return merge_histories(histories) or None
+
+    def _report(self, start_time: float, run_started: float):
+        if self.config.metrics_file and self._progress:
+            write_metrics_file(self.config.metrics_file, self._snapshot(), self._phase_timings())
+        first_request_delay = self.first_request_at - run_started if self.first_request_at else None
+        print_summary(start_time,
+                      target_stats=self.target_stats,
+                      failed_tasks=self.failed_tasks,
+                      first_request_delay=first_request_delay,
+                      targets=self.config.urls,
+                      concurrency_history=self._concurrency_history(start_time),
+                      requests_sent=self.requests_sent,
+                      requested_rate=self.config.rate,
+                      requested_host_rate=self.config.host_rate,
+                      retries_sent=self.retries_sent,
+                      wildcards_discarded=self._discarded if self.config.calibrate else None,
+                      connections_opened=self.connections.opened,
+                      connections_reused=self.connections.reused,
+                      head_probes=(self.head_probe.answered, self.head_probe.escalated) if self.head_probe else None,
+                      phase_timings=self._phase_timings(),
+                      filtered=self.response_filter.rejected)
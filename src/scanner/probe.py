@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+from src.scanner.scheduler import host_of
+from src.scanner.filters import ResponseFilter
+
+# Status codes of a server that does not implement HEAD
+HEAD_UNSUPPORTED_STATUS = (405, 501)
+
+class HeadProbe:
+    """
+    HEAD-first probing.
+
+    Each path is requested with HEAD, and only responses that matter are
+    requested again with the configured method: statuses that pass the
+    status checks of the response filter, whose body may be needed for
+    reporting, the remaining filters or wildcard checks, and 405/501,
+    which mean the server does not handle HEAD. Whether HEAD can be trusted
+    is decided per host: calibration compares HEAD and GET statuses for the
+    random probe paths, and a 405/501 at any time switches the host to
+    plain requests for the rest of the scan.
+    """
+    def __init__(self, response_filter: ResponseFilter):
+        self.response_filter = response_filter
+        self.trusted: dict[str, bool] = {}
+        self.answered = 0
+        self.escalated = 0
+
+    def use_head(self, target: str) -> bool:
+        return self.trusted.get(host_of(target), True)
+
+    def needs_escalation(self, target: str, status: int) -> bool:
+        """Return True if a HEAD status has to be confirmed with the configured method."""
+        if status in HEAD_UNSUPPORTED_STATUS:
+            self.trusted[host_of(target)] = False
+        if status in HEAD_UNSUPPORTED_STATUS or self.response_filter.check_status(status):
+            self.escalated += 1
+            return True
+        self.answered += 1
+        return False
+
+    def calibrate(self, target: str, statuses: list[tuple[int, int]]):
+        """Trust HEAD on the host of a target only if it agreed with GET for every (HEAD, GET) status pair."""
+        host = host_of(target)
+        agreed = all(head == get and head not in HEAD_UNSUPPORTED_STATUS for head, get in statuses)
+        self.trusted[host] = self.trusted.get(host, True) and agreed
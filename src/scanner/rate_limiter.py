@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+from src.scanner.scheduler import host_of
+
+class TokenBucket:
+    """
+    Async token bucket refilled at `rate` tokens per second, holding at most
+    `burst` tokens.
+
+    Tokens are refilled lazily on each call and no lock is taken: when the
+    bucket is empty, the caller reserves a token by driving the balance
+    negative and sleeps until it would have been refilled. Callers are
+    therefore served in arrival order, and a request that finds a token
+    does not yield to the event loop at all.
+    """
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = rate
+        self.burst = burst or max(1, round(rate / 10))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    async def acquire(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+class RateLimiter:
+    """Global token bucket plus one bucket per host, created on first use."""
+    def __init__(self, rate: Optional[float] = None, host_rate: Optional[float] = None, burst: Optional[int] = None):
+        self.rate = rate
+        self.host_rate = host_rate
+        self.burst = burst
+        self._global = TokenBucket(rate, burst) if rate else None
+        self._hosts: dict[str, TokenBucket] = {}
+
+    async def acquire(self, target: str):
+        """Wait until a request to the target is allowed by every applicable bucket."""
+        if self.host_rate:
+            key = host_of(target)
+            bucket = self._hosts.get(key)
+            if bucket is None:
+                bucket = self._hosts[key] = TokenBucket(self.host_rate, self.burst)
+            await bucket.acquire()
+        if self._global is not None:
+            await self._global.acquire()
@@ -6,71 +6,358 @@ Author: WaiBui
 License: MIT
 """
 
+import re
 import asyncio
 import aiohttp
 import time
+from typing import Callable, Optional
+from urllib.parse import quote, quote_plus, urlencode
+
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
 
 from src.models.config import ScanConfig
 from src.models.result import ScanResult
+from src.input.fuzz import placed_keywords, request_texts, wordlist_keywords
 from src.output.logger import Logger
+from src.scanner.retry import RETRY_STATUS, RetryableResponse, parse_retry_after
+from src.scanner.metrics import RequestMetrics
+from src.scanner.filters import ResponseFilter
+from src.scanner.calibration import CALIBRATION_BODY_LIMIT, Calibrator, ResponseFingerprint, read_body_prefix
 
 logger = Logger.get_instance()
 
-async def process_request(session: aiohttp.ClientSession, config: ScanConfig, path: str, user_agent: str) -> ScanResult:
-    """Check information of the path."""
-    url = f"{config.url.rstrip('/')}/{path.lstrip('/')}"
-    start_time = time.time()
-    
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate",
-    }
-    
-    if config.cookie:
-        headers["Cookie"] = config.cookie
-
-    request_kwargs = {
-        'headers': headers,
-        'allow_redirects': config.follow_redirects,
-        'params': config.params,
-        'data': config.data
-    }
-    
-    method_func = {
-        "get": session.get,
-        "post": session.post,
-        "head": session.head,
-        "put": session.put,
-        "delete": session.delete,
-        "patch": session.patch
-    }.get(config.method.lower())
-
-    if not method_func:
-        logger.error("[INVALID METHOD]", config.method)
+def build_url(target: str, path: str) -> str:
+    """Join a target base URL and a wordlist path."""
+    return f"{target.rstrip('/')}/{path.lstrip('/')}"
+
+# Characters left unescaped in the path: RFC 3986 pchar, '/' and the '?' opening a query
+_PATH_SAFE = "/:@!$&'()*+,;=~?"
+# Characters left unescaped in a word placed in the query of a URL
+_QUERY_SAFE = "/:@!$'()*,;~?"
+_METHODS = ("GET", "POST", "HEAD", "PUT", "DELETE", "PATCH")
+
+class FuzzField:
+    """
+    A request string with keyword placeholders, compiled once into a format
+    string and a list of slots, so filling it in is a single str.format
+    call. Each slot encodes its word for where it sits: `encode` applies
+    everywhere, except that `query_encode`, if given, applies after a '?'.
+    """
+    __slots__ = ("_format", "_slots")
+
+    def __init__(self, text: str, keywords: list[str], encode: Optional[Callable[[str], str]] = None,
+                 query_encode: Optional[Callable[[str], str]] = None):
+        pattern = re.compile("|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True)))
+        parts, slots, position = [], [], 0
+        for match in pattern.finditer(text):
+            parts.append(text[position:match.start()].replace("{", "{{").replace("}", "}}"))
+            parts.append("{}")
+            in_query = query_encode is not None and '?' in text[:match.start()]
+            slots.append((keywords.index(match.group()), query_encode if in_query else encode))
+            position = match.end()
+        parts.append(text[position:].replace("{", "{{").replace("}", "}}"))
+        self._format = "".join(parts)
+        self._slots = slots
+
+    def __bool__(self) -> bool:
+        return bool(self._slots)
+
+    def render(self, words: tuple[str, ...]) -> str:
+        return self._format.format(*[encode(words[i]) if encode else words[i] for i, encode in self._slots])
+
+def _quote_path(word: str) -> str:
+    return quote(word, safe=_PATH_SAFE)
+
+def _quote_query(word: str) -> str:
+    return quote(word, safe=_QUERY_SAFE)
+
+class RequestTemplate:
+    """
+    The parts of a request that do not change from path to path, resolved
+    once per scan.
+
+    The method is validated once. --params are encoded into a query suffix
+    and --data into a form body. Each User-Agent gets a frozen header set
+    and a ready kwargs dict, and each target a normalized base string. The
+    hot path then only quotes the path and builds a pre-encoded yarl.URL,
+    which aiohttp uses as-is.
+
+    When wordlist keywords appear in the URL, --params, --data, --header or
+    --cookie, words are substituted there instead of appended to the URL.
+    Each such string is compiled into a FuzzField once, and `path` is then
+    the word, or the tuple of words when several keywords are used.
+    Headers and bodies without keywords stay frozen.
+    """
+    def __init__(self, config: ScanConfig, user_agents: list[str]):
+        self.config = config
+        self.method = config.method.upper()
+        if self.method not in _METHODS:
+            raise ValueError(f"Invalid HTTP method: {config.method}")
+
+        self.keywords = list(wordlist_keywords(config.wordlist))
+        texts = request_texts(config.urls, config.headers, config.params, config.data, config.cookie)
+        placed = placed_keywords(self.keywords, texts)
+        self.placed = bool(placed)
+        if self.placed and len(placed) < len(self.keywords):
+            unused = ", ".join(k for k in self.keywords if k not in placed)
+            raise ValueError(f"Keyword {unused} does not appear in the URL, headers, params, data or cookie")
+        # a result's URL does not tell its words apart when some keyword is not in the URL
+        self.show_payload = self.placed and bool(placed_keywords(self.keywords, [
+            text for text in texts if text not in config.urls
+        ]))
+
+        self._query = urlencode(config.params) if config.params else ""
+        body = urlencode(config.data).encode() if config.data else None
+        self._query_field = FuzzField(self._query, self.keywords, quote_plus) if self.placed else None
+        self._data_field = FuzzField(body.decode(), self.keywords, quote_plus) if self.placed and body else None
+        self._header_fields = [
+            (FuzzField(name, self.keywords), FuzzField(value, self.keywords))
+            for name, value in self._fuzzed_headers(config)
+        ] if self.placed else []
+        self._kwargs = {
+            user_agent: {
+                'headers': CIMultiDictProxy(CIMultiDict(self._headers(config, user_agent, body is not None))),
+                'allow_redirects': config.follow_redirects,
+                'data': body,
+            }
+            for user_agent in dict.fromkeys(user_agents or [""])
+        }
+        self._bases: dict[str, str] = {}
+        self._url_fields: dict[str, tuple[FuzzField, FuzzField]] = {}
+        self.body_policy = config.body_policy
+        self.body_limit = config.body_limit
+
+    def _fuzzed_headers(self, config: ScanConfig) -> list[tuple[str, str]]:
+        headers = dict(config.headers or {})
+        if config.cookie:
+            headers["Cookie"] = config.cookie
+        return [(name, value) for name, value in headers.items() if placed_keywords(self.keywords, [name, value])]
+
+    def _headers(self, config: ScanConfig, user_agent: str, has_body: bool) -> dict:
+        headers = {
+            "User-Agent": user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+            "Accept-Encoding": "gzip, deflate",
+        }
+        if config.cookie:
+            headers["Cookie"] = config.cookie
+        if has_body:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        if config.headers:
+            headers.update(config.headers)
+        for name, _ in self._fuzzed_headers(config):
+            # filled in per request
+            del headers[name]
+        return headers
+
+    def words(self, path: str | tuple[str, ...]) -> tuple[str, ...]:
+        """Return the words for every keyword; a single string, such as a calibration path, fills them all."""
+        return (path,) * len(self.keywords) if isinstance(path, str) else path
+
+    def payload(self, path: str | tuple[str, ...]) -> Optional[str]:
+        """Return the words of a request as 'KEYWORD=word' pairs, if its URL alone does not show them."""
+        if not self.show_payload:
+            return None
+        return " ".join(f"{keyword}={word}" for keyword, word in zip(self.keywords, self.words(path)))
+
+    def display_url(self, target: str, path: str | tuple[str, ...]) -> str:
+        """Return the URL of a request as shown in results, unescaped."""
+        if not self.placed:
+            return build_url(target, path)
+        return self._target_fields(target)[0].render(self.words(path))
+
+    def _target_fields(self, target: str) -> tuple[FuzzField, FuzzField]:
+        fields = self._url_fields.get(target)
+        if fields is None:
+            fields = self._url_fields[target] = (
+                FuzzField(target, self.keywords),
+                FuzzField(target, self.keywords, _quote_path, _quote_query),
+            )
+        return fields
+
+    def url(self, target: str, path: str | tuple[str, ...]) -> URL:
+        """Return the pre-encoded request URL for a path on a target."""
+        if self.placed:
+            words = self.words(path)
+            text = self._target_fields(target)[1].render(words)
+            if self._query:
+                text += ('&' if '?' in text else '?') + self._query_field.render(words)
+            return URL(text, encoded=True)
+        base = self._bases.get(target)
+        if base is None:
+            base = self._bases[target] = str(URL(target.rstrip('/')))
+        path = path.lstrip('/')
+        if '%' in path or '#' in path:
+            # already-escaped or fragment-bearing paths keep yarl's own parsing
+            url = URL(f"{base}/{path}")
+            return url.extend_query(self.config.params) if self._query else url
+        text = f"{base}/{quote(path, safe=_PATH_SAFE)}"
+        if self._query:
+            text += ('&' if '?' in text else '?') + self._query
+        return URL(text, encoded=True)
+
+    def kwargs(self, user_agent: str, path: Optional[str | tuple[str, ...]] = None) -> dict:
+        """
+        Return the request keyword arguments for a User-Agent: the frozen
+        ones, or for a path whose words go in headers or the body, a copy
+        with those filled in.
+        """
+        kwargs = self._kwargs.get(user_agent)
+        if kwargs is None:
+            base = next(iter(self._kwargs.values()))
+            kwargs = self._kwargs[user_agent] = {
+                **base,
+                'headers': CIMultiDictProxy(CIMultiDict(
+                    self._headers(self.config, user_agent, base['data'] is not None)
+                )),
+            }
+        if path is None or not (self._header_fields or self._data_field):
+            return kwargs
+        words = self.words(path)
+        headers = kwargs['headers']
+        if self._header_fields:
+            headers = CIMultiDict(headers)
+            for name, value in self._header_fields:
+                headers[name.render(words)] = value.render(words)
+        data = self._data_field.render(words).encode() if self._data_field else kwargs['data']
+        return {**kwargs, 'headers': headers, 'data': data}
+
+async def settle_body(response: aiohttp.ClientResponse, policy: str, limit: int, consumed: int = 0):
+    """
+    Decide what happens to the connection once a response has been handled.
+
+    aiohttp only returns a connection to the pool when the body was read to
+    the end. With the 'drain' and 'keep' policies the rest of the body is
+    discarded if it fits within `limit` bytes in total, keeping the
+    connection alive; a longer body, or the 'close' policy, closes it
+    instead of downloading the whole thing.
+    """
+    if policy == "close":
+        response.close()
+        return
+    remaining = limit - consumed
+    if response.content_length is not None and response.content_length - consumed > remaining:
+        response.close()
         return
+    while remaining > 0:
+        chunk = await response.content.read(min(remaining, 65536))
+        if not chunk:
+            return
+        remaining -= len(chunk)
+    if not response.content.at_eof():
+        response.close()
+
+async def process_request(session: aiohttp.ClientSession, template: RequestTemplate, target: str,
+                          path: str | tuple[str, ...],
+                          user_agent: str, calibrator: Optional[Calibrator] = None, method: Optional[str] = None,
+                          log: bool = True, metrics: Optional[RequestMetrics] = None,
+                          response_filter: Optional[ResponseFilter] = None) -> Optional[ScanResult]:
+    """
+    Check information of the path on the target.
+
+    Returns None without building a ScanResult when `response_filter`
+    rejects the response or it matches the target's wildcard fingerprints
+    from calibration; the body is only read when one of them needs it.
+    `method` overrides the configured method; a HEAD response has no body
+    to compare, so it skips the wildcard check. With `log` False the
+    response is a probe that is neither logged nor filtered. With
+    `metrics`, the phases of the request are timed.
+    """
+    config = template.config
+    url = template.display_url(target, path)
+    payload = template.payload(path)
+    method = method or template.method
+    baseline = calibrator.baselines.get(target) if calibrator and method != "HEAD" else None
+    timing = metrics.start() if metrics else None
+    start_time = time.perf_counter()
 
     try:
         async with asyncio.timeout(config.timeout):
-            async with method_func(url, **request_kwargs) as response:
-                elapsed = time.time() - start_time
-                logger.http(response.status,config.match_codes, url, f"{elapsed:.2f}s")
+            async with session.request(method, template.url(target, path), trace_request_ctx=timing,
+                                       **template.kwargs(user_agent, path)) as response:
+                elapsed = time.perf_counter() - start_time
+                status = response.status
+                length = response.content_length
                 content_type = response.headers.get('Content-Type')
-                content_length = int(response.headers.get('Content-Length', 0))
-                return ScanResult(
-                    url=url,
-                    status=response.status,
-                    content_length=content_length,
-                    response_time=elapsed,
-                    content_type=content_type
-                )
+                # True unless the header filter rejects; None means the body stage decides
+                matched = True
+                if response_filter is not None and log:
+                    matched = response_filter.check_headers(status, elapsed, length, content_type)
+                body = b""
+                if template.body_policy == "keep":
+                    body = await read_body_prefix(response, template.body_limit)
+                elif matched is not False:
+                    limit = CALIBRATION_BODY_LIMIT if baseline else 0
+                    if matched is None:
+                        limit = max(limit, response_filter.body_limit)
+                    if limit:
+                        body = await read_body_prefix(response, limit)
+                if matched is None:
+                    matched = response_filter.check_body(body, length)
+                if matched and baseline:
+                    fingerprint = ResponseFingerprint.build(
+                        status, body[:CALIBRATION_BODY_LIMIT], response.headers.get('Location'),
+                        template.words(path)[0]
+                    )
+                    if calibrator.is_wildcard(target, fingerprint):
+                        await settle_body(response, template.body_policy, template.body_limit, len(body))
+                        if timing:
+                            metrics.finish(timing)
+                        return None
+                if log:
+                    if payload:
+                        logger.http(status, matched, url, payload, f"{elapsed:.2f}s")
+                    else:
+                        logger.http(status, matched, url, f"{elapsed:.2f}s")
+                result = None
+                if matched:
+                    result = ScanResult(
+                        url=url,
+                        status=status,
+                        content_length=length or 0,
+                        response_time=elapsed,
+                        content_type=content_type,
+                        target=target,
+                        redirect=response.headers.get('Location'),
+                        payload=payload,
+                        body=body if template.body_policy == "keep" else None
+                    )
+                await settle_body(response, template.body_policy, template.body_limit, len(body))
+                if timing:
+                    metrics.finish(timing)
+                if status in RETRY_STATUS:
+                    raise RetryableResponse(status, result, parse_retry_after(response.headers.get('Retry-After')))
+                return result
+    except RetryableResponse:
+        raise
     except asyncio.TimeoutError:
         logger.error('[TIMEOUT]', url, f'{config.timeout}s')
+        if timing:
+            metrics.fail(timing)
         raise
     except aiohttp.ClientError as e:
         logger.error('[HTTP ERROR]', url, str(e))
+        if timing:
+            metrics.fail(timing)
         raise
     except Exception as e:
         logger.error('[UNEXPECTED]', url, str(e))
+        if timing:
+            metrics.fail(timing)
         raise
+
+async def probe_fingerprint(session: aiohttp.ClientSession, template: RequestTemplate, target: str, path: str,
+                            user_agent: str, method: Optional[str] = None) -> Optional[ResponseFingerprint]:
+    """Request a path and fingerprint the response, returning None if the request fails."""
+    url = template.display_url(target, path)
+    try:
+        async with asyncio.timeout(template.config.timeout):
+            async with session.request(method or template.method, template.url(target, path), **template.kwargs(user_agent, path)) as response:
+                body = await read_body_prefix(response, CALIBRATION_BODY_LIMIT)
+                await settle_body(response, template.body_policy, template.body_limit, len(body))
+                return ResponseFingerprint.build(response.status, body, response.headers.get('Location'), path)
+    except (asyncio.TimeoutError, aiohttp.ClientError) as e:
+        logger.warning('[CALIBRATION]', url, str(e) or type(e).__name__)
+        return None
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import asyncio
+import random
+import aiohttp
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+from src.models.result import ScanResult
+
+# Status codes a server uses to ask for the request to be sent again later
+RETRY_STATUS = (429, 503)
+
+class RetryableResponse(Exception):
+    """
+    Raised for a response whose status asks the client to retry later.
+    `result` is None when the response filter rejected it.
+    """
+    def __init__(self, status: int, result: Optional[ScanResult] = None, retry_after: Optional[float] = None):
+        super().__init__(f"HTTP {status}")
+        self.status = status
+        self.result = result
+        self.retry_after = retry_after
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of first attempts, plus a small floor so that
+    a handful of early failures can still be retried. When the target is
+    struggling the budget runs dry and failures are no longer multiplied.
+    """
+    def __init__(self, ratio: float = 0.1, minimum: int = 10):
+        self.ratio = ratio
+        self.minimum = minimum
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+
+    def record_request(self):
+        self.requests += 1
+
+    def try_spend(self) -> bool:
+        if self.retries < self.minimum + self.ratio * self.requests:
+            self.retries += 1
+            return True
+        self.denied += 1
+        return False
+
+class RetryPolicy:
+    """
+    Decides whether a failed attempt is retried and how long to wait first.
+
+    Timeouts, dropped connections and RETRY_STATUS responses are retryable;
+    errors that would fail the same way again (bad certificates, invalid
+    URLs, redirect loops) are not. The wait is exponential backoff with full
+    jitter, unless the server sent a Retry-After, which is honoured up to
+    max_retry_after.
+    """
+    def __init__(self, max_retries: int, base_delay: float = 0.5, max_delay: float = 30.0,
+                 budget: Optional[RetryBudget] = None, max_retry_after: float = 120.0):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.max_retry_after = max_retry_after
+
+    def is_retryable(self, error: Exception) -> bool:
+        if isinstance(error, (RetryableResponse, asyncio.TimeoutError)):
+            return True
+        if isinstance(error, (aiohttp.ClientSSLError, aiohttp.InvalidURL, aiohttp.TooManyRedirects)):
+            return False
+        return isinstance(error, (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError))
+
+    def should_retry(self, error: Exception, attempt: int) -> bool:
+        """Return True if attempt number `attempt` (0-based) may be followed by another."""
+        if attempt >= self.max_retries or not self.is_retryable(error):
+            return False
+        return self.budget is None or self.budget.try_spend()
+
+    def delay(self, attempt: int, error: Optional[Exception] = None) -> float:
+        retry_after = getattr(error, "retry_after", None)
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
@@ -10,97 +10,470 @@ import time
 import aiohttp
 import asyncio
 import random
+from collections import Counter
+from typing import Optional
 
 from src.output.logger import Logger
 from src.models.config import ScanConfig
-from src.output.writer import FileWriter
-from src.scanner.request import process_request
-from src.input.file_getter import load_wordlist, load_user_agents
-from src.output.scan_info import print_scan_info
+from src.output.sink import ResultSink, open_sinks
+from src.scanner.request import RequestTemplate, build_url, probe_fingerprint, process_request
+from src.scanner.calibration import Calibrator
+from src.scanner.connection import ConnectionStats
+from src.scanner.metrics import RequestMetrics
+from src.scanner.stats import ScanStats
+from src.scanner.probe import HeadProbe
+from src.scanner.filters import ResponseFilter
+from src.scanner.frontier import Frontier
+from src.scanner.checkpoint import Checkpoint, unit_state
+from src.scanner.retry import RetryableResponse, RetryBudget, RetryPolicy
+from src.scanner.scheduler import ScanUnit, TargetScheduler, host_of
+from src.scanner.limiter import AdaptiveLimiter, OVERLOAD_STATUS
+from src.scanner.rate_limiter import RateLimiter
+from src.input.fuzz import config_placed_keywords, load_paths
+from src.input.file_getter import load_user_agents
+from src.output.scan_info import print_scan_info, print_total_paths
 from src.output.summary import print_summary
+from src.output.progress import print_progress, write_metrics_file
+from src.constants.default import DEFAULT_PROGRESS_INTERVAL
 
 logger = Logger.get_instance()
 
+# Longest the scan header waits for the wordlist to finish spooling so it can show the total
+SPOOL_ANNOUNCE_WAIT = 1.0
+# Pause between checks of whether the wordlist has finished spooling
+SPOOL_WATCH_INTERVAL = 0.5
+
 class FwFScanner:
     """Responsible for performing web path discovery scans."""
-    def __init__(self, config: ScanConfig):
+    def __init__(self, config: ScanConfig, retry_policy: RetryPolicy = None):
         self.config = config
-        self.paths = []
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_retries=config.retry,
+            base_delay=config.retry_backoff,
+            max_delay=config.retry_max_delay,
+            budget=RetryBudget(config.retry_budget) if config.retry_budget is not None else None
+        )
+        self.paths = None
         self.user_agents = []
-        self.scan_results = []
+        self.template = None
+        self.target_stats: dict[str, ScanStats] = {}
+        self.sinks: list[ResultSink] = []
+        self.scheduler = None
+        self.units: list[ScanUnit] = []
+        self.checkpoint = None
+        self._checkpoint_saving: Optional[asyncio.Future] = None
+        self.completed = False
+        self.limiter = None
+        self.calibrator = Calibrator(config.match_codes, config.calibration_samples) if config.calibrate else None
+        # recursion appends words to directories, which keyword placement does not do
+        recursive = config.depth and not config_placed_keywords(config)
+        self.frontier = Frontier(config.depth, config.depth_limit) if recursive else None
+        self.connections = ConnectionStats()
+        self.metrics = RequestMetrics()
+        self._last_snapshot = None
+        self.response_filter = ResponseFilter.from_config(config)
+        self.head_probe = HeadProbe(self.response_filter) if config.probe == "head" and config.method == "GET" else None
+        self.rate_limiter = None
+        if config.rate or config.host_rate:
+            self.rate_limiter = RateLimiter(config.rate, config.host_rate, config.burst)
+
+        self.failed_tasks = Counter()
+        self.requests_sent = 0
+        self.retries_sent = 0
+        self.first_request_at = None
 
-        self.failed_tasks = 0
-                
     async def run(self):
         """Run the scan engine"""
-        self.paths = load_wordlist(self.config.wordlist)
+        run_started = time.time()
         self.user_agents = load_user_agents(self.config.user_agent)
-        
-        print_scan_info(self.config)
-        
-        connector, session_timeout = self._config_session_setting()
-        start_time = time.time()
-        
-        await self._execute_tasks(connector, session_timeout)
-       
-        print_summary(start_time, self.scan_results, self.failed_tasks)
-        
-        if self.config.output:
-            [FileWriter.write_results(results=self.scan_results, output_file=output, config=self.config) for output in self.config.output.split(',')]
-    
-    async def _execute_tasks(self, connector: aiohttp.TCPConnector, session_timeout: aiohttp.ClientTimeout):
-        """Execute all path checking tasks and handle results"""
         try:
-            self.semaphore = asyncio.Semaphore(self.config.concurrency)
-            
+            self.template = RequestTemplate(self.config, self.user_agents)
+        except ValueError as e:
+            logger.error("[INVALID REQUEST]", str(e))
+            return
+        # a FuzzSpace waits for its wordlists to be spooled, so that happens on a thread
+        self.paths = await asyncio.get_running_loop().run_in_executor(None, self._spool_wordlist)
+        try:
+            late_total = self._announce()
+
+            resume_state = None
+            expected = None
+            if self.config.resume:
+                header, resume_state = Checkpoint.load(self.config.resume)
+                if resume_state and resume_state.get("complete"):
+                    logger.info("[RESUME]", f"Scan in {self.config.resume} is already complete")
+                    self.completed = True
+                    return
+                expected = (resume_state or {}).get("wordlist_count") or header.get("wordlist_count")
+            spool_watch = None
+            if late_total or expected is not None:
+                spool_watch = asyncio.create_task(self._watch_spool(late_total, expected))
+            if self.config.checkpoint:
+                self.checkpoint = Checkpoint(self.config.checkpoint)
+                self.checkpoint.start(self.config, self.paths.count, append=resume_state is not None)
+
+            connector, session_timeout = self._config_session_setting()
+            start_time = time.time()
+
+            self.sinks = open_sinks(self.config.output, append=resume_state is not None,
+                                    atomic=not self.config.checkpoint)
+            try:
+                await self._execute_tasks(connector, session_timeout, resume_state)
+            finally:
+                if spool_watch:
+                    spool_watch.cancel()
+                if self.checkpoint:
+                    await self._save_checkpoint(complete=self.completed)
+                for sink in self.sinks:
+                    sink.close(self.completed)
+        finally:
+            # also removes the spool directory this process wrote
+            self.paths.close()
+
+        self._report(start_time, run_started)
+
+    def _spool_wordlist(self):
+        return load_paths(self.config)
+
+    async def _watch_spool(self, announce: bool, expected: Optional[int]):
+        """
+        Once the wordlist is spooled, print its total if the header went out
+        without it, and check it against the checkpoint being resumed
+        """
+        while self.paths.count is None:
+            await asyncio.sleep(SPOOL_WATCH_INTERVAL)
+        if announce:
+            print_total_paths(self.paths.count)
+        if expected is not None and self.paths.count != expected:
+            logger.warning("[RESUME]", "Wordlist changed since the checkpoint; positions may not line up")
+
+    def _announce(self) -> bool:
+        """Print the scan header; True if the wordlist total was not known in time for it"""
+        total = self.paths.wait(SPOOL_ANNOUNCE_WAIT)
+        print_scan_info(self.config, total)
+        return total is None
+
+    def _report(self, start_time: float, run_started: float):
+        if self.config.metrics_file and self.units:
+            write_metrics_file(self.config.metrics_file, self._snapshot(), self._phase_timings())
+        first_request_delay = self.first_request_at - run_started if self.first_request_at else None
+        concurrency_history = self.limiter.history if self.limiter else None
+        print_summary(start_time,
+                      target_stats=self.target_stats,
+                      failed_tasks=self.failed_tasks,
+                      first_request_delay=first_request_delay,
+                      targets=self.config.urls,
+                      concurrency_history=concurrency_history,
+                      requests_sent=self.requests_sent,
+                      requested_rate=self.config.rate,
+                      requested_host_rate=self.config.host_rate,
+                      retries_sent=self.retries_sent,
+                      wildcards_discarded=self.calibrator.discarded if self.calibrator else None,
+                      connections_opened=self.connections.opened,
+                      connections_reused=self.connections.reused,
+                      head_probes=(self.head_probe.answered, self.head_probe.escalated) if self.head_probe else None,
+                      phase_timings=self._phase_timings(),
+                      filtered=self.response_filter.rejected)
+
+    async def _execute_tasks(self, connector: aiohttp.TCPConnector, session_timeout: aiohttp.ClientTimeout,
+                             resume_state: dict = None):
+        """Run a bounded pool of workers that pull (target, path) jobs from the scheduler"""
+        try:
             async with aiohttp.ClientSession(
                 timeout=session_timeout,
-                connector=connector
+                connector=connector,
+                trace_configs=[self.connections.trace_config(), self.metrics.trace_config()]
             ) as session:
-                tasks = [self.create_task(session, path, random.choice(self.user_agents)) for path in self.paths]
-                for future in asyncio.as_completed(tasks):
-                    try:
-                        result = await future
-                        if result:
-                            self.scan_results.append(result)
-                    except Exception as e:
-                        logger.error("[Error completing tasks]", str(e))
+                self.scheduler = TargetScheduler(self.config.concurrency, self.config.host_concurrency)
+                if self.config.adaptive_concurrency:
+                    self.limiter = AdaptiveLimiter(self.config.min_concurrency, self.config.concurrency)
+                self.units = self._initial_units(resume_state)
+                if self.config.prewarm:
+                    await self._prewarm(session)
+                if self.calibrator:
+                    await asyncio.gather(*(self._calibrate(session, unit.target) for unit in self.units))
+                for unit in self.units:
+                    if self.frontier:
+                        self.frontier.admit(unit.target.rstrip('/') + '/', unit.depth)
+                    await self.scheduler.add_unit(unit)
+                background = []
+                if self.checkpoint:
+                    background.append(asyncio.create_task(self._checkpoint_loop()))
+                if self.config.progress or self.config.metrics_file:
+                    background.append(asyncio.create_task(self._progress_loop()))
+                try:
+                    await self._run_workers(session)
+                    self.completed = True
+                finally:
+                    for task in background:
+                        task.cancel()
+                    self.scheduler.close()
         except Exception as e:
             logger.error("[Error executing tasks]", str(e))
-        
-    async def create_task(self, session: aiohttp.ClientSession, path: str, user_agent: str):
-        """Create a task that checks a path with retry logic and semaphore control"""
-        retries = self.config.retry
-        attempt = 0
-        while retries >= 0:
+
+    async def _run_workers(self, session: aiohttp.ClientSession):
+        """Run the worker pool until the scheduler runs dry"""
+        workers = [
+            asyncio.create_task(self._worker(session))
+            for _ in range(self.config.concurrency)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    def _initial_units(self, resume_state: dict = None) -> list[ScanUnit]:
+        """Create one unit per target, or restore the units saved in a checkpoint"""
+        if not resume_state:
+            return [ScanUnit(target, self.paths.cursor()) for target in self.config.urls]
+
+        units = []
+        for saved in resume_state["units"]:
+            done = set(range(saved["watermark"], saved["next"])) - set(saved["in_flight"])
+            units.append(ScanUnit(
+                saved["target"],
+                self.paths.cursor(saved["watermark"], set(done)),
+                saved["depth"],
+                saved["root"],
+                watermark=saved["watermark"],
+                completed=done
+            ))
+        return units
+
+    async def _checkpoint_loop(self):
+        """Save a checkpoint every checkpoint_interval seconds"""
+        while True:
+            await asyncio.sleep(self.config.checkpoint_interval)
+            await self._save_checkpoint()
+
+    async def _progress_loop(self):
+        """Report progress and refresh the metrics file every progress interval"""
+        interval = self.config.progress or DEFAULT_PROGRESS_INTERVAL
+        while True:
+            await asyncio.sleep(interval)
+            self._publish_progress(self._snapshot(), interval)
+
+    def _snapshot(self) -> dict:
+        """Return the counters shown in progress lines and the metrics file"""
+        return {
+            "requests": self.requests_sent,
+            "errors": self.metrics.errors,
+            "in_flight": self.metrics.in_flight,
+            "results": self.results_count,
+            "done": sum(unit.watermark + len(unit.completed) for unit in self.units),
+            "total": self.paths.spooled * len(self.units),
+        }
+
+    def _publish_progress(self, snapshot: dict, interval: float):
+        if self.config.progress:
+            print_progress(snapshot, self._last_snapshot, interval)
+        if self.config.metrics_file:
+            write_metrics_file(self.config.metrics_file, snapshot, self._phase_timings())
+        self._last_snapshot = snapshot
+
+    def _phase_timings(self) -> dict:
+        return self.metrics.phases
+
+    async def _save_checkpoint(self, complete: bool = False):
+        """
+        Take the progress of every unit, wait until the sinks hold every
+        result emitted so far, then record that progress, so every index
+        marked done has its result on disk. Requests that finish while the
+        sinks sync are left for the next checkpoint. The state file is
+        written and fsynced on a thread; that write is shielded, so a save
+        cancelled with the checkpoint loop still finishes before the next
+        one starts.
+        """
+        states = [unit_state(unit) for unit in self.units]
+        await self._sync_output()
+        if self._checkpoint_saving is not None:
+            await asyncio.shield(self._checkpoint_saving)
+        self._checkpoint_saving = asyncio.get_running_loop().run_in_executor(
+            None, self.checkpoint.save, states, complete, self.paths.count
+        )
+        await asyncio.shield(self._checkpoint_saving)
+
+    async def _sync_output(self):
+        """Wait on a thread, not the event loop, until the sinks have written everything emitted so far"""
+        await asyncio.get_running_loop().run_in_executor(None, self._sync_sinks)
+
+    def _sync_sinks(self):
+        for sink in self.sinks:
+            sink.sync()
+
+    async def _prewarm(self, session: aiohttp.ClientSession):
+        """Open connections to every host ahead of the scan with concurrent HEAD requests to its root"""
+        hosts = {host_of(unit.target): unit.target for unit in self.units}
+        per_host = min(self.config.prewarm, self.config.host_concurrency or self.config.concurrency)
+        headers = self.template.kwargs(random.choice(self.user_agents))['headers']
+
+        async def warm(target: str):
             try:
-                async with self.semaphore:
-                    result = await process_request(session, self.config, path, user_agent)
-                    return result
+                async with session.head(target, headers=headers, allow_redirects=False):
+                    pass
             except (asyncio.TimeoutError, aiohttp.ClientError) as e:
-                logger.warning(f"[Retry {attempt}] {self.config.url}/{path}")
-                retries -= 1
-                attempt += 1
-                if retries >= 0:
-                    await asyncio.sleep(0.1)
+                logger.warning("[PREWARM]", target, str(e) or type(e).__name__)
+
+        await asyncio.gather(*(warm(target) for target in hosts.values() for _ in range(per_host)))
+        logger.info("[PREWARM]", f"{self.connections.opened} connections to {len(hosts)} hosts")
+
+    async def _calibrate(self, session: aiohttp.ClientSession, target: str):
+        """Learn the wildcard fingerprints of a base URL from random nonexistent paths"""
+        paths = self.calibrator.probe_paths()
+        probes = [
+            probe_fingerprint(session, self.template, target, path, random.choice(self.user_agents))
+            for path in paths
+        ]
+        if self.head_probe:
+            probes += [
+                probe_fingerprint(session, self.template, target, path, random.choice(self.user_agents), "HEAD")
+                for path in paths
+            ]
+        fingerprints = await asyncio.gather(*probes)
+        for fingerprint in fingerprints[:len(paths)]:
+            self.calibrator.add_baseline(target, fingerprint)
+        if self.head_probe:
+            self.head_probe.calibrate(target, [
+                (head.status if head else None, get.status if get else None)
+                for get, head in zip(fingerprints[:len(paths)], fingerprints[len(paths):])
+            ])
+            if not self.head_probe.use_head(target):
+                logger.warning("[CALIBRATION]", target, "HEAD responses disagree with GET, probing with GET")
+        for baseline in self.calibrator.baselines.get(target, []):
+            logger.warning("[CALIBRATION]", target, f"wildcard [{baseline.status}] {baseline.words} words, {baseline.lines} lines")
+
+    async def _worker(self, session: aiohttp.ClientSession):
+        """Check jobs handed out by the scheduler until it runs dry"""
+        while True:
+            job = await self.scheduler.next()
+            if job is None:
+                return
+            unit, index, path = job
+            finished = False
+            try:
+                if self.frontier and not self.frontier.first_visit(build_url(unit.target, path)):
+                    finished = True
+                    continue
+                if self.first_request_at is None:
+                    self.first_request_at = time.time()
+                result = await self.create_task(session, unit, path, random.choice(self.user_agents))
+                if result:
+                    result.target = unit.root
+                    self._record(result)
+                    if self.frontier:
+                        await self._recurse(session, unit, result)
+                finished = True
             except Exception as e:
-                logger.error("[Unexpected error]", path, str(e))
-                break
-        self.failed_tasks += 1
+                logger.error("[Error completing tasks]", str(e))
+                finished = True
+            finally:
+                await self.scheduler.done(unit, index, finished)
+
+    @property
+    def results_count(self) -> int:
+        return sum(stats.count for stats in self.target_stats.values())
+
+    def _record(self, result):
+        """Count a result in its target's statistics and stream it to the output sinks"""
+        stats = self.target_stats.get(result.target)
+        if stats is None:
+            stats = self.target_stats[result.target] = ScanStats()
+        stats.record(result)
+        for sink in self.sinks:
+            sink.emit(result)
+
+    async def _recurse(self, session: aiohttp.ClientSession, unit: ScanUnit, result):
+        """Queue the directory a result points at one level deeper, if the frontier admits it"""
+        directory = self.frontier.directory_of(result)
+        if not directory or not self.frontier.admit(directory, unit.depth + 1):
+            return
+        logger.info("[RECURSE]", f"depth {unit.depth + 1}", directory)
+        await self._add_directory(session, directory, unit.depth + 1, unit.root)
+
+    async def _add_directory(self, session: aiohttp.ClientSession, directory: str, depth: int, root: str):
+        """Calibrate a directory if needed and schedule it as a new scan unit"""
+        if self.calibrator:
+            await self._calibrate(session, directory)
+        child = ScanUnit(directory, self.paths.cursor(), depth, root)
+        self.units.append(child)
+        await self.scheduler.add_unit(child)
+
+    async def create_task(self, session: aiohttp.ClientSession, unit: ScanUnit, path: str, user_agent: str):
+        """Check a path of a scan unit, retrying failed attempts as the retry policy allows"""
+        target = unit.target
+        if self.retry_policy.budget is not None:
+            self.retry_policy.budget.record_request()
+        attempt = 0
+        while True:
+            try:
+                return await self._probe(session, target, path, user_agent)
+            except Exception as e:
+                if not self.retry_policy.should_retry(e, attempt):
+                    if isinstance(e, RetryableResponse):
+                        return e.result
+                    if not isinstance(e, (asyncio.TimeoutError, aiohttp.ClientError)):
+                        logger.error("[Unexpected error]", path, str(e))
+                    break
+                delay = self.retry_policy.delay(attempt, e)
+                attempt += 1
+                self.retries_sent += 1
+                payload = self.template.payload(path)
+                logger.warning(f"[Retry {attempt}] {self.template.display_url(target, path)}"
+                               f"{f' {payload}' if payload else ''} in {delay:.2f}s")
+                await asyncio.sleep(delay)
+        self.failed_tasks[unit.root] += 1
+
+    async def _probe(self, session: aiohttp.ClientSession, target: str, path: str, user_agent: str):
+        """Check a path with HEAD first when HEAD probing is on, falling back to the configured method"""
+        if self.head_probe and self.head_probe.use_head(target):
+            result = await self._limited_request(session, target, path, user_agent, "HEAD")
+            if not self.head_probe.needs_escalation(target, result.status):
+                # only statuses that can match are escalated, so this one is filtered out
+                logger.http(result.status, False, result.url, f"{result.response_time:.2f}s")
+                self.response_filter.rejected += 1
+                return None
+        return await self._limited_request(session, target, path, user_agent)
+
+    async def _limited_request(self, session: aiohttp.ClientSession, target: str, path: str, user_agent: str,
+                               method: str = None):
+        """Send one request through the rate limiter and, when enabled, an adaptive concurrency slot"""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(target)
+        self.requests_sent += 1
+        log = method is None
+        if self.limiter is None:
+            return await process_request(session, self.template, target, path, user_agent, self.calibrator, method, log,
+                                         self.metrics, self.response_filter)
+
+        await self.limiter.acquire()
+        started = time.perf_counter()
+        congested = True
+        try:
+            result = await process_request(session, self.template, target, path, user_agent, self.calibrator,
+                                           method, log, self.metrics, self.response_filter)
+            congested = result is not None and result.status in OVERLOAD_STATUS
+            return result
+        finally:
+            await self.limiter.release(time.perf_counter() - started, congested)
 
     def _config_session_setting(self) -> tuple[aiohttp.TCPConnector, aiohttp.ClientTimeout]:
         """Configure HTTP session settings"""
+        force_close = self.config.body_policy == "close"
         connector = aiohttp.TCPConnector(
             limit=self.config.concurrency,
+            limit_per_host=self.config.host_concurrency or 0,
+            force_close=force_close,
+            keepalive_timeout=None if force_close else self.config.keepalive_timeout,
             ttl_dns_cache=300,
             ssl=False
         )
-       
+
         session_timeout = aiohttp.ClientTimeout(
             total=None,
             connect=self.config.timeout,
             sock_connect=self.config.timeout,
             sock_read=self.config.timeout
         )
-       
+
         return connector, session_timeout
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Optional
+from urllib.parse import urlsplit
+
+from src.input.file_getter import WordCursor, WordSpool
+
+# Longest a thread waits for a wordlist spool to grow before checking whether it is still needed
+SPOOL_GROW_TIMEOUT = 0.5
+
+@dataclass(eq=False)
+class ScanUnit:
+    """
+    A base URL together with its own position in the wordlist.
+
+    `root` is the target the unit was discovered from and `depth` how many
+    directory levels below it the base URL sits. Every index below
+    `watermark` is done; `completed` holds finished indices above it.
+    """
+    target: str
+    cursor: WordCursor
+    depth: int = 0
+    root: Optional[str] = None
+    in_flight: int = 0
+    watermark: int = 0
+    completed: set = field(default_factory=set)
+
+    def __post_init__(self):
+        if self.root is None:
+            self.root = self.target
+
+    def mark_done(self, index: int):
+        """Record a finished index and advance the watermark past contiguous ones."""
+        if index != self.watermark:
+            self.completed.add(index)
+            return
+        self.watermark += 1
+        while self.watermark in self.completed:
+            self.completed.discard(self.watermark)
+            self.watermark += 1
+
+@dataclass(eq=False)
+class HostState:
+    """Pending scan units, shallowest first, and in-flight request count for one host."""
+    host: str
+    units: list = field(default_factory=list)
+    in_flight: int = 0
+
+def host_of(url: str) -> str:
+    """Return the scheduling key (scheme and network location) of a URL."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+class TargetScheduler:
+    """
+    Hands out (unit, index, path) jobs to the worker pool.
+
+    Hosts are served round-robin, and a host is skipped while it already
+    holds its fair share of workers: the worker count divided by the number
+    of hosts that still have work, optionally capped by host_limit. A slow
+    host therefore cannot starve the others, and the share grows again as
+    hosts finish. Within a host, units at a shallower depth are drained
+    before deeper ones. A unit that has caught up with a wordlist still
+    being spooled is passed over, and a thread waits for the spool to grow
+    before the waiting workers look again, so the event loop never blocks.
+    """
+    def __init__(self, workers: int, host_limit: Optional[int] = None):
+        self.workers = workers
+        self.host_limit = host_limit
+        self._hosts: dict[str, HostState] = {}
+        self._ring: deque[HostState] = deque()
+        self._in_flight = 0
+        self._sequence = itertools.count()
+        self._changed = asyncio.Condition()
+        self._spool_waits: dict[WordSpool, asyncio.Task] = {}
+
+    async def add_unit(self, unit: ScanUnit):
+        """Queue a scan unit behind the pending units of its host at the same or a shallower depth."""
+        async with self._changed:
+            key = host_of(unit.target)
+            state = self._hosts.get(key)
+            if state is None:
+                state = self._hosts[key] = HostState(key)
+            if not state.units and state not in self._ring:
+                self._ring.append(state)
+            heapq.heappush(state.units, (unit.depth, next(self._sequence), unit))
+            self._changed.notify_all()
+
+    async def next(self) -> Optional[tuple[ScanUnit, int, str]]:
+        """Wait for the next job, or return None once every unit is exhausted."""
+        async with self._changed:
+            while True:
+                job = self._take()
+                if job is not None:
+                    return job
+                if not self._ring and self._in_flight == 0:
+                    self._changed.notify_all()
+                    return None
+                await self._changed.wait()
+
+    async def done(self, unit: ScanUnit, index: int, finished: bool = True):
+        """
+        Release the slot held by a job of the given unit, recording its index
+        as done unless the job was cancelled before it finished.
+        """
+        async with self._changed:
+            if finished:
+                unit.mark_done(index)
+            unit.in_flight -= 1
+            self._hosts[host_of(unit.target)].in_flight -= 1
+            self._in_flight -= 1
+            self._changed.notify()
+
+    def _share(self) -> int:
+        share = max(1, -(-self.workers // max(1, len(self._ring))))
+        return min(share, self.host_limit) if self.host_limit else share
+
+    def _take(self) -> Optional[tuple[ScanUnit, int, str]]:
+        share = self._share()
+        for _ in range(len(self._ring)):
+            state = self._ring[0]
+            if state.in_flight >= share:
+                self._ring.rotate(-1)
+                continue
+            job = self._next_of(state)
+            if job is None:
+                if state.units:
+                    # waiting for the wordlist spool
+                    self._ring.rotate(-1)
+                else:
+                    self._ring.popleft()
+                    share = self._share()
+                continue
+            unit, (index, path) = job
+            self._ring.rotate(-1)
+            unit.in_flight += 1
+            state.in_flight += 1
+            self._in_flight += 1
+            return unit, index, path
+        return None
+
+    def _next_of(self, state: HostState) -> Optional[tuple[ScanUnit, tuple[int, str]]]:
+        """
+        Return the next item of a host's first unit with words left, dropping
+        exhausted units; None if there is none, or if that unit has caught up
+        with its spool.
+        """
+        while state.units:
+            unit = state.units[0][2]
+            try:
+                item = next(unit.cursor, None)
+            except BlockingIOError:
+                self._wait_for_spool(unit.cursor.spool)
+                return None
+            if item is not None:
+                return unit, item
+            heapq.heappop(state.units)
+        return None
+
+    def _wait_for_spool(self, spool: WordSpool):
+        if spool not in self._spool_waits:
+            self._spool_waits[spool] = asyncio.create_task(self._wake_on_growth(spool))
+
+    async def _wake_on_growth(self, spool: WordSpool):
+        """Wait on a thread until the spool has more words, then let the workers look again"""
+        loop = asyncio.get_running_loop()
+        try:
+            while not await loop.run_in_executor(None, spool.grow, SPOOL_GROW_TIMEOUT):
+                continue
+        finally:
+            del self._spool_waits[spool]
+        async with self._changed:
+            self._changed.notify_all()
+
+    def close(self):
+        """Stop waiting for spools"""
+        for task in self._spool_waits.values():
+            task.cancel()
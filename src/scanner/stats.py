@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+from collections import Counter
+from typing import Iterable, Optional
+from src.models.result import ScanResult
+from src.scanner.metrics import Histogram
+
+# Distinct content types counted before the rest are lumped together
+CONTENT_TYPE_LIMIT = 32
+OTHER_CONTENT_TYPE = "other"
+
+class SizeHistogram(Histogram):
+    """Response sizes in log-spaced buckets, eight per doubling, from 1 byte to 1 GiB."""
+    BOUNDS = tuple(2 ** (i / 8) for i in range(241))
+
+class ScanStats:
+    """
+    Summary statistics of the results, updated as each one arrives.
+
+    Memory depends only on the number of distinct status codes and content
+    types, never on the number of results: latency and size are kept in
+    fixed-bucket histograms. Instances merge, so the per-target statistics
+    add up to the totals.
+    """
+    def __init__(self):
+        self.count = 0
+        self.statuses: Counter = Counter()
+        self.content_types: Counter = Counter()
+        self.latency = Histogram()
+        self.sizes = SizeHistogram()
+
+    def record(self, result: ScanResult):
+        self.count += 1
+        self.statuses[result.status] += 1
+        self._count_content_type(_media_type(result.content_type), 1)
+        self.latency.record(result.response_time)
+        self.sizes.record(result.content_length)
+
+    def merge(self, other: "ScanStats"):
+        self.count += other.count
+        self.statuses.update(other.statuses)
+        for content_type, count in other.content_types.items():
+            self._count_content_type(content_type, count)
+        self.latency.merge(other.latency)
+        self.sizes.merge(other.sizes)
+
+    @classmethod
+    def merged(cls, stats: Iterable["ScanStats"]) -> "ScanStats":
+        total = cls()
+        for item in stats:
+            total.merge(item)
+        return total
+
+    def status_classes(self) -> list[int]:
+        """Count results per status class, returning [2xx, 3xx, 4xx, 5xx]."""
+        counts = [0, 0, 0, 0]
+        for status, count in self.statuses.items():
+            if 200 <= status < 600:
+                counts[status // 100 - 2] += count
+        return counts
+
+    def _count_content_type(self, content_type: str, count: int):
+        if content_type not in self.content_types and len(self.content_types) >= CONTENT_TYPE_LIMIT:
+            content_type = OTHER_CONTENT_TYPE
+        self.content_types[content_type] += count
+
+def _media_type(content_type: Optional[str]) -> str:
+    """Drop parameters such as charset, so 'text/html; charset=utf-8' counts as 'text/html'."""
+    if not content_type:
+        return "-"
+    return content_type.split(';', 1)[0].strip().lower() or "-"
@@ -12,6 +12,10 @@ from pathlib import Path
 
 from src.constants import default as df 
 from src.constants import regex 
+from src.input.mutation import parse_number_range
+from src.input.fuzz import split_keyword
+from src.scanner.filters import parse_ranges
+from src.output.writers import is_supported, supported_formats
 
 class ParserValidator:
     """Collection of static methods for validating and formatting command-line parser."""
@@ -27,9 +31,48 @@ class ParserValidator:
         """Check if is valid HTTP method, return a properly formatted HTTP method."""
         method = value.upper()
         if method not in df.ALLOW_METHOD:
-            raise argparse.ArgumentTypeError(f"Invalid HTTP method '{value}'. Allowed: {", ".join(df.ALLOW_METHOD)}.")
+            raise argparse.ArgumentTypeError(f"Invalid HTTP method '{value}'. Allowed: {', '.join(df.ALLOW_METHOD)}.")
         return method
     
+    @staticmethod
+    def is_body_policy(value: str) -> str:
+        """Check if is a known response body policy."""
+        policy = value.lower()
+        if policy not in df.ALLOW_BODY_POLICY:
+            raise argparse.ArgumentTypeError(f"Invalid body policy '{value}'. Allowed: {', '.join(df.ALLOW_BODY_POLICY)}.")
+        return policy
+    
+    @staticmethod
+    def is_probe_mode(value: str) -> str:
+        """Check if is a known probe mode."""
+        mode = value.lower()
+        if mode not in df.ALLOW_PROBE:
+            raise argparse.ArgumentTypeError(f"Invalid probe mode '{value}'. Allowed: {', '.join(df.ALLOW_PROBE)}.")
+        return mode
+    
+    @staticmethod
+    def parse_list(value: str) -> list[str]:
+        """Split a comma-separated list, dropping blank items."""
+        return [item.strip() for item in value.split(',') if item.strip()]
+    
+    @staticmethod
+    def is_case_list(value: str) -> list[str]:
+        """Check if is a comma-separated list of known case transforms."""
+        cases = [case.lower() for case in ParserValidator.parse_list(value)]
+        for case in cases:
+            if case not in df.ALLOW_CASE:
+                raise argparse.ArgumentTypeError(f"Invalid case '{case}'. Allowed: {', '.join(df.ALLOW_CASE)}.")
+        return cases
+    
+    @staticmethod
+    def is_number_range(value: str) -> str:
+        """Check if is a START-END number range."""
+        try:
+            parse_number_range(value)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+        return value
+    
     @staticmethod
     def is_positive_number(value: str) -> int:
         "Validate that the input is a positive integer (>= 1)."
@@ -38,6 +81,29 @@ class ParserValidator:
             raise argparse.ArgumentTypeError("Value must be at least 1.")
         return number
     
+    @staticmethod
+    def is_concurrency(value: str) -> int | str:
+        """Validate a concurrency level: a positive integer or 'auto'."""
+        if value.strip().lower() == "auto":
+            return "auto"
+        return ParserValidator.is_positive_number(value)
+    
+    @staticmethod
+    def is_positive_float(value: str) -> float:
+        """Validate that the input is a number greater than 0."""
+        number = float(value)
+        if number <= 0:
+            raise argparse.ArgumentTypeError("Value must be greater than 0.")
+        return number
+    
+    @staticmethod
+    def is_ratio(value: str) -> float:
+        """Validate a fraction between 0 and 1."""
+        number = float(value)
+        if not 0 <= number <= 1:
+            raise argparse.ArgumentTypeError("Value must be between 0 and 1.")
+        return number
+    
     @staticmethod
     def is_non_negative(value: str) -> int:
         """Check if a number is greater than or equal to 0."""
@@ -73,11 +139,40 @@ class ParserValidator:
             raise argparse.ArgumentTypeError("File not found")
         return value
     
+    @staticmethod
+    def is_valid_paths(value: str) -> list[str]:
+        """Validate a comma-separated list of file paths, each optionally followed by ':KEYWORD'."""
+        paths = [item.strip() for item in value.split(',') if item.strip()]
+        if not paths:
+            raise argparse.ArgumentTypeError("No file path given")
+        for spec in paths:
+            path, _ = split_keyword(spec)
+            if not Path(path).exists():
+                raise argparse.ArgumentTypeError(f"File not found: {path}")
+        return paths
+    
+    @staticmethod
+    def is_header(value: str) -> tuple[str, str]:
+        """Validate a 'Name: value' header."""
+        name, sep, header_value = value.partition(':')
+        if not sep or not name.strip():
+            raise argparse.ArgumentTypeError(f"Invalid header '{value}'. Use 'Name: value'.")
+        return name.strip(), header_value.strip()
+    
+    @staticmethod
+    def is_fuzz_mode(value: str) -> str:
+        """Check if is a known mode for combining keyword wordlists."""
+        mode = value.lower()
+        if mode not in df.ALLOW_FUZZ_MODE:
+            raise argparse.ArgumentTypeError(f"Invalid mode '{value}'. Allowed: {', '.join(df.ALLOW_FUZZ_MODE)}.")
+        return mode
+    
     @staticmethod
     def is_valid_output(value: str) -> str:
-        """Validate the output file path format."""
-        if value.split('.')[-1] not in df.ALLOW_OUTPUT_FORMAT:
-            raise argparse.ArgumentTypeError(f"Output file must have a valid extension: {', '.join(df.ALLOW_OUTPUT_FORMAT)}.")
+        """Validate the format of each comma-separated output file, including formats added by plugins."""
+        for output_file in value.split(','):
+            if not is_supported(output_file.strip().split('.')[-1]):
+                raise argparse.ArgumentTypeError(f"Output file must have a valid extension: {', '.join(supported_formats())}.")
         return value
     
     @staticmethod
@@ -88,6 +183,35 @@ class ParserValidator:
             raise argparse.ArgumentTypeError(f"Invalid match codes: {codes}. Allowed values: {df.DEFAULT_STATUS_CODES}.")
         return codes
     
+    @staticmethod
+    def is_status_codes(value: str) -> list[int]:
+        """Validate comma-separated HTTP status codes."""
+        try:
+            codes = [int(code.strip()) for code in value.split(",") if code.strip()]
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid status codes: '{value}'.")
+        if not codes or not all(100 <= code <= 599 for code in codes):
+            raise argparse.ArgumentTypeError(f"Invalid status codes: '{value}'. Use codes from 100 to 599.")
+        return codes
+    
+    @staticmethod
+    def is_ranges(value: str) -> str:
+        """Validate comma-separated numbers and MIN-MAX ranges."""
+        try:
+            parse_ranges(value)
+        except ValueError as e:
+            raise argparse.ArgumentTypeError(str(e))
+        return value
+    
+    @staticmethod
+    def is_regex(value: str) -> str:
+        """Validate a regular expression."""
+        try:
+            re.compile(value)
+        except re.error as e:
+            raise argparse.ArgumentTypeError(f"Invalid regular expression '{value}': {e}")
+        return value
+    
     @staticmethod
     def parse_key_value_string(value: str) -> dict:
         """
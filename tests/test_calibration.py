@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scanner.calibration import Calibrator, ResponseFingerprint
+
+SOFT_404 = b"<html><body>\nSorry, /{} was not found\n</body></html>"
+
+def soft_404(path: str, status: int = 200, location: str = None) -> ResponseFingerprint:
+    return ResponseFingerprint.build(status, SOFT_404.replace(b"{}", path.encode()), location, path)
+
+def test_fingerprint_masks_the_requested_path():
+    assert soft_404("a1b2c3") == soft_404("admin")
+    redirect = ResponseFingerprint.build(301, b"", "http://h/a1b2c3/", "a1b2c3")
+    assert redirect.location == "http://h/{PATH}/"
+    assert redirect.matches(ResponseFingerprint.build(301, b"", "http://h/admin/", "admin"))
+
+def test_fingerprint_matches_on_shape():
+    page = ResponseFingerprint.build(200, b"one two\nthree", None, "x")
+    same_shape = ResponseFingerprint.build(200, b"four five\nsix", None, "x")
+    longer = ResponseFingerprint.build(200, b"four five six\nseven", None, "x")
+    assert page.matches(same_shape)
+    assert not page.matches(longer)
+    assert not page.matches(ResponseFingerprint.build(404, b"one two\nthree", None, "x"))
+
+def test_probe_paths_are_random_and_varied():
+    calibrator = Calibrator([200], samples=5)
+    first, second = calibrator.probe_paths(), calibrator.probe_paths()
+    assert len(first) == 5 and first != second
+    assert first[1].endswith(".php") and first[2].startswith(".") and first[3].endswith("/")
+
+def test_wildcard_responses_are_discarded_per_target():
+    calibrator = Calibrator([200, 301], samples=3)
+    for path in calibrator.probe_paths():
+        calibrator.add_baseline("http://h/", soft_404(path))
+    # a response outside match_codes would never be reported, so it is no baseline
+    calibrator.add_baseline("http://h/", soft_404("zz", status=404))
+    calibrator.add_baseline("http://h/", None)
+    assert len(calibrator.baselines["http://h/"]) == 1
+
+    assert calibrator.is_wildcard("http://h/", soft_404("backup"))
+    assert not calibrator.is_wildcard("http://h/", ResponseFingerprint.build(200, b"real page", None, "backup"))
+    assert not calibrator.is_wildcard("http://other/", soft_404("backup"))
+    assert calibrator.discarded == 1
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.input.file_getter import load_wordlist
+from src.models.config import ScanConfig
+from src.scanner.checkpoint import Checkpoint, unit_state
+from src.scanner.scanner import FwFScanner
+from src.scanner.scheduler import ScanUnit
+
+WORDS = [f"word{i}" for i in range(20)]
+
+@pytest.fixture
+def spool(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(WORDS) + "\n")
+    spool = load_wordlist(str(path)).spool()
+    spool.wait()
+    yield spool
+    spool.close()
+
+def test_watermark_advances_over_contiguous_indices(spool):
+    unit = ScanUnit("http://h/", spool.cursor())
+    for index in (1, 2, 4):
+        unit.mark_done(index)
+    assert unit.watermark == 0 and unit.completed == {1, 2, 4}
+    unit.mark_done(0)
+    assert unit.watermark == 3 and unit.completed == {4}
+    unit.mark_done(3)
+    assert unit.watermark == 5 and unit.completed == set()
+
+def test_unit_state_lists_in_flight_indices(spool):
+    unit = ScanUnit("http://h/a/", spool.cursor(), depth=1, root="http://h/")
+    taken = [next(unit.cursor) for _ in range(6)]
+    assert taken[-1] == (5, "word5")
+    for index in (0, 1, 3, 5):
+        unit.mark_done(index)
+    assert unit_state(unit) == {
+        "target": "http://h/a/",
+        "root": "http://h/",
+        "depth": 1,
+        "watermark": 2,
+        "next": 6,
+        "in_flight": [2, 4],
+    }
+
+def test_save_and_load_the_last_complete_state(tmp_path):
+    path = str(tmp_path / "scan.state")
+    config = ScanConfig(urls=["http://h/"], wordlist=["words.txt"])
+    checkpoint = Checkpoint(path)
+    checkpoint.start(config, 20)
+    checkpoint.save([{"target": "http://h/", "watermark": 3}], wordlist_count=20)
+    checkpoint.save([{"target": "http://h/", "watermark": 7}], complete=True, wordlist_count=20)
+    with open(path, "a") as f:
+        # a state line cut short by a crash
+        f.write('{"type": "state", "units": [')
+    header, state = Checkpoint.load(path)
+    assert header["wordlist_count"] == 20
+    assert state["units"][0]["watermark"] == 7 and state["complete"]
+    assert Checkpoint.load_config(path) == config
+
+def test_compaction_keeps_header_and_latest_state(tmp_path):
+    path = str(tmp_path / "scan.state")
+    checkpoint = Checkpoint(path, compact_every=3)
+    checkpoint.start(ScanConfig(urls=["http://h/"]), None)
+    for watermark in range(4):
+        checkpoint.save([{"watermark": watermark}])
+    # the third save rewrote the file, the fourth was appended
+    with open(path) as f:
+        assert len(f.readlines()) == 3
+    assert Checkpoint.load(path)[1]["units"] == [{"watermark": 3}]
+
+def test_resume_repeats_only_in_flight_indices(spool):
+    scanner = FwFScanner(ScanConfig(urls=["http://h/"]))
+    scanner.paths = spool
+    unit = ScanUnit("http://h/", spool.cursor())
+    for _ in range(8):
+        next(unit.cursor)
+    for index in (0, 1, 2, 4, 6):
+        unit.mark_done(index)
+    [resumed] = scanner._initial_units({"units": [unit_state(unit)]})
+    assert resumed.watermark == 3
+    assert [index for index, _ in resumed.cursor] == [3, 5, 7, *range(8, len(WORDS))]
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scanner.filters import ResponseFilter, parse_ranges
+
+def test_parse_ranges():
+    assert parse_ranges("0, 100-200,1000-") == [(0, 0), (100, 200), (1000, float("inf"))]
+    assert parse_ranges("-50") == [(0, 50)]
+    with pytest.raises(ValueError):
+        parse_ranges("200-100")
+    with pytest.raises(ValueError):
+        parse_ranges("abc")
+
+def test_header_stage_status_codes():
+    response_filter = ResponseFilter(match_codes=[200, 301], filter_codes=[301])
+    assert response_filter.check_headers(200, 0.1, 10, "text/html") is True
+    assert response_filter.check_headers(301, 0.1, 10, "text/html") is False
+    assert response_filter.check_headers(404, 0.1, 10, "text/html") is False
+    assert response_filter.rejected == 2
+
+def test_header_stage_time_size_and_type():
+    response_filter = ResponseFilter(match_time="-500", filter_size="0", match_type=["html"],
+                                     filter_type=["charset=latin"])
+    assert response_filter.check_headers(200, 0.2, 10, "text/HTML; charset=utf-8") is True
+    # times are given in milliseconds
+    assert response_filter.check_headers(200, 0.6, 10, "text/html") is False
+    assert response_filter.check_headers(200, 0.2, 0, "text/html") is False
+    assert response_filter.check_headers(200, 0.2, 10, "application/json") is False
+    assert response_filter.check_headers(200, 0.2, 10, None) is False
+    assert response_filter.check_headers(200, 0.2, 10, "text/html; charset=latin-1") is False
+
+def test_body_stage_runs_only_when_needed():
+    assert ResponseFilter().check_headers(200, 0.1, None, None) is True
+    # a size check without Content-Length needs the body
+    sized = ResponseFilter(filter_size="0")
+    assert sized.check_headers(200, 0.1, None, None) is None
+    assert sized.check_body(b"", None) is False
+    assert sized.check_body(b"hello", None) is True
+    # with Content-Length the header stage decides alone
+    assert sized.check_headers(200, 0.1, 5, None) is True
+
+def test_body_stage_words_lines_and_regex():
+    response_filter = ResponseFilter(match_words="2-", filter_lines="1", match_regex="admin", filter_regex="denied")
+    assert response_filter.check_headers(200, 0.1, 20, "text/html") is None
+    assert response_filter.check_body(b"admin panel\nlogin", 17) is True
+    assert response_filter.check_body(b"admin\n", 6) is False
+    assert response_filter.check_body(b"admin panel", 11) is False
+    assert response_filter.check_body(b"user panel\nlogin", 16) is False
+    assert response_filter.check_body(b"admin panel\naccess denied", 25) is False
+    assert response_filter.rejected == 4
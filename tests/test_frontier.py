@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.result import ScanResult
+from src.scanner.frontier import Frontier
+
+def directory(url: str, status: int, redirect: str = None):
+    return Frontier.directory_of(ScanResult(url, status, 0, 0.0, redirect=redirect))
+
+def test_redirect_to_the_same_path_with_a_slash_is_a_directory():
+    assert directory("http://h/admin", 301, "/admin/") == "http://h/admin/"
+    assert directory("http://h/admin?x=1", 302, "http://h/admin/?y=2") == "http://h/admin/"
+    # a redirect elsewhere, such as to a login page, is not
+    assert directory("http://h/admin", 302, "/login") is None
+    assert directory("http://h/admin", 301) is None
+
+def test_forbidden_paths_without_an_extension_are_directories():
+    assert directory("http://h/private", 403) == "http://h/private/"
+    assert directory("http://h/private/", 403) == "http://h/private/"
+    assert directory("http://h/.htaccess", 403) is None
+
+def test_successful_paths_ending_in_a_slash_are_directories():
+    assert directory("http://h/docs/", 200) == "http://h/docs/"
+    assert directory("http://h/docs", 200) is None
+    assert directory("http://h/docs/", 404) is None
+
+def test_directories_are_admitted_once_down_to_max_depth():
+    frontier = Frontier(2)
+    assert frontier.admit("http://h/a/", 1)
+    assert not frontier.admit("http://h/a/", 2)
+    assert frontier.admit("http://h/a/b/", 2)
+    assert not frontier.admit("http://h/a/b/c/", 3)
+
+def test_per_depth_limit():
+    frontier = Frontier(3, per_depth_limit=2)
+    assert [frontier.admit(f"http://h/{name}/", 1) for name in "abc"] == [True, True, False]
+    assert frontier.admit("http://h/a/x/", 2)
+
+def test_urls_are_requested_once():
+    frontier = Frontier(1)
+    assert frontier.first_visit("http://h/a/index.php")
+    assert not frontier.first_visit("http://h/a/index.php")
+    assert frontier.first_visit("http://h/b/index.php")
+    assert frontier.skipped == 1
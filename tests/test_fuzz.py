@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import pytest
+from itertools import product
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.input.file_getter import load_wordlist
+from src.input.fuzz import FuzzSpace, split_keyword, wordlist_keywords
+
+LISTS = [["a", "b", "c"], ["1", "2"], ["x", "y", "z", "w"]]
+
+@pytest.fixture
+def spaces(tmp_path):
+    """Build FuzzSpaces over LISTS and close them afterwards."""
+    opened = []
+
+    def build(mode: str, shard_index: int = 0, shard_count: int = 1) -> FuzzSpace:
+        spools = []
+        for index, words in enumerate(LISTS):
+            path = tmp_path / f"list{index}.txt"
+            path.write_text("\n".join(words) + "\n")
+            spools.append(load_wordlist(str(path)).spool())
+        space = FuzzSpace(spools, mode, shard_index, shard_count)
+        opened.append(space)
+        return space
+
+    yield build
+    for space in opened:
+        space.close()
+
+def test_keyword_specs():
+    assert split_keyword("words.txt:USER") == ("words.txt", "USER")
+    assert split_keyword("C:\\lists\\words.txt") == ("C:\\lists\\words.txt", None)
+    assert wordlist_keywords(["a.txt", "b.txt:PASS", "c.txt"]) == {"FUZZ": ["a.txt", "c.txt"], "PASS": ["b.txt"]}
+
+def test_clusterbomb_yields_every_combination(spaces):
+    space = spaces("clusterbomb")
+    expected = list(product(*LISTS))
+    assert space.count == space.total == len(expected) == 24
+    assert list(space.cursor()) == list(enumerate(expected))
+
+@pytest.mark.parametrize("start", [1, 4, 7, 8, 13, 23, 24])
+def test_clusterbomb_resumes_at_any_index(spaces, start):
+    space = spaces("clusterbomb")
+    assert list(space.cursor(start)) == list(enumerate(product(*LISTS)))[start:]
+
+def test_pitchfork_pairs_words_up_to_the_shortest_list(spaces):
+    space = spaces("pitchfork")
+    expected = list(zip(*LISTS))
+    assert space.count == len(expected) == 2
+    assert list(space.cursor()) == list(enumerate(expected))
+    assert list(space.cursor(1)) == [(1, expected[1])]
+    assert list(space.cursor(2)) == []
+
+def test_sharded_combinations_cover_the_space_once(spaces):
+    expected = list(product(*LISTS))
+    seen = []
+    for shard in range(3):
+        space = spaces("clusterbomb", shard, 3)
+        combinations = [words for _, words in space.cursor()]
+        assert combinations == expected[shard::3]
+        assert [words for _, words in space.cursor(2)] == expected[shard::3][2:]
+        seen += combinations
+    assert sorted(seen) == sorted(expected)
+
+def test_cursor_skips_indices(spaces):
+    space = spaces("clusterbomb")
+    expected = [(i, words) for i, words in enumerate(product(*LISTS)) if i >= 5 and i not in (6, 9)]
+    assert list(space.cursor(5, {6, 9})) == expected
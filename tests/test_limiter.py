@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scanner.limiter import AdaptiveLimiter
+
+async def complete(limiter: AdaptiveLimiter, requests: int, latency: float = 0.0, congested: bool = False):
+    for _ in range(requests):
+        await limiter.acquire()
+        await limiter.release(latency, congested)
+
+def test_initial_limit_is_clamped():
+    async def limits():
+        return AdaptiveLimiter(20, 50).limit, AdaptiveLimiter(1, 5).limit
+    assert asyncio.run(limits()) == (20, 5)
+
+def test_limit_stays_within_bounds():
+    async def scan():
+        limiter = AdaptiveLimiter(4, 64)
+        seen = {limiter.limit}
+        for _ in range(50):
+            await complete(limiter, limiter.limit, 0.001)
+            seen.add(limiter.limit)
+        grown = limiter.limit
+        for _ in range(50):
+            # cuts at most once per smoothed round-trip
+            await asyncio.sleep(0.002)
+            await complete(limiter, 1, 0.0, congested=True)
+            seen.add(limiter.limit)
+        return limiter, grown, seen
+    limiter, grown, seen = asyncio.run(scan())
+    assert grown == 64
+    assert limiter.limit == 4
+    assert min(seen) >= 4 and max(seen) <= 64
+    assert all(4 <= low <= high <= 64 for _, low, high, _ in limiter.history)
+    assert limiter.initial == 10
+
+def test_slow_start_doubles_then_congestion_cuts():
+    async def scan():
+        limiter = AdaptiveLimiter(1, 1000)
+        await complete(limiter, 10, 0.01)
+        doubled = limiter.limit
+        await complete(limiter, 1, 0.0, congested=True)
+        return doubled, limiter.limit
+    assert asyncio.run(scan()) == (20, 14)
+
+def test_acquire_waits_for_a_free_slot():
+    async def scan():
+        limiter = AdaptiveLimiter(1, 1, initial=1)
+        await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.01)
+        blocked = not waiter.done()
+        await limiter.release(0.01)
+        await asyncio.wait_for(waiter, 1)
+        return blocked, limiter.in_flight
+    assert asyncio.run(scan()) == (True, 1)
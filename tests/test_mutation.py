@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.input.file_getter import SPOOL_INDEX_STRIDE, load_wordlist
+from src.input.mutation import Mutator, parse_number_range
+
+WORDS = [f"word{i}" for i in range(SPOOL_INDEX_STRIDE * 3 + 17)]
+
+@pytest.fixture
+def wordlist(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_text("\n".join(WORDS) + "\n")
+    return str(path)
+
+def test_number_ranges():
+    assert parse_number_range("1-3") == (range(1, 4), 0)
+    assert parse_number_range("001-100") == (range(1, 101), 3)
+    with pytest.raises(ValueError):
+        parse_number_range("9-1")
+
+def test_mutated_cursor_counts_and_resumes(wordlist):
+    mutator = Mutator(extensions=["php"], prefixes=["_"], cases=["upper"])
+    spool = load_wordlist(wordlist, mutator=mutator).spool()
+    spool.wait()
+    candidates = [candidate for word in WORDS for candidate in mutator.variants(word)]
+    # each word and its uppercase form, with and without the prefix and the extension
+    assert mutator.count("word0") == 8
+    assert spool.count == len(candidates)
+    assert list(spool.cursor()) == list(enumerate(candidates))
+    for start in (3, 8, 8 * SPOOL_INDEX_STRIDE + 5, len(candidates) - 1):
+        assert list(spool.cursor(start)) == list(enumerate(candidates))[start:]
+    skip = {start + 1, start + 9}
+    assert list(spool.cursor(start, set(skip))) == [
+        (i, candidate) for i, candidate in enumerate(candidates) if i >= start and i not in skip
+    ]
+    spool.close()
+
+def test_mutation_counts():
+    mutator = Mutator(extensions=["php", ".bak"], suffixes=["~"], number_range="01-03", cases=["lower", "capital"])
+    for word in ("admin", "Admin", "ADMIN"):
+        variants = list(mutator.variants(word))
+        assert len(variants) == len(set(variants)) == mutator.count(word)
+    # 'admin' is its own lowercase form, so only 'Admin' is added
+    assert mutator.count("admin") == 2 * (1 + 1 + 3) * 3
+    assert "admin02.bak" in mutator.variants("admin")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import queue
+import signal
+import _thread
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.constants.default import DEFAULT_USERAGENT
+from src.models.config import ScanConfig
+from src.scanner import scanner as scanner_module
+from src.scanner.parallel import ParallelScanner, merge_histories, run_shard, shard_config
+
+def test_shard_config_splits_the_limits(tmp_path):
+    checkpoint = str(tmp_path / "scan.ckpt")
+    (tmp_path / "scan.ckpt.1").write_text("")
+    config = ScanConfig(urls=["http://h/"], wordlist=["words.txt"], workers=3, concurrency=10, min_concurrency=5,
+                        host_concurrency=4, rate=90.0, host_rate=30.0, burst=10, output="out.json",
+                        checkpoint=checkpoint, resume=checkpoint)
+    shards = [shard_config(config, i, 3) for i in range(3)]
+    shard = shards[1]
+    assert (shard.workers, shard.concurrency, shard.min_concurrency, shard.host_concurrency) == (1, 4, 2, 2)
+    assert (shard.rate, shard.host_rate, shard.burst) == (30.0, 10.0, 4)
+    assert shard.output is None
+    assert [s.checkpoint for s in shards] == [f"{checkpoint}.{i}" for i in range(3)]
+    # only a worker whose own state file exists resumes
+    assert [s.resume for s in shards] == [None, f"{checkpoint}.1", None]
+
+def test_shard_config_keeps_unset_limits_unset():
+    config = ScanConfig(urls=["http://h/"], wordlist=["words.txt"], workers=4, concurrency=2, min_concurrency=2)
+    shard = shard_config(config, 3, 4)
+    assert (shard.concurrency, shard.min_concurrency) == (1, 1)
+    assert (shard.host_concurrency, shard.rate, shard.host_rate, shard.burst) == (None, None, None, None)
+    assert (shard.checkpoint, shard.resume) == (None, None)
+
+def test_merge_histories_sums_workers_on_the_scan_clock():
+    merged = merge_histories([
+        # worker 0 starts with the scan at limit 10
+        (0.0, 10, [(0.5, 8, 12, 12), (2.5, 10, 14, 14)]),
+        # worker 1 starts two seconds later at limit 20
+        (2.0, 20, [(0.0, 15, 25, 25)]),
+    ])
+    # before its first sample worker 1 counts at its initial limit; samples less than a second apart are combined
+    assert merged == [(0.5, 28, 32, 32), (2.0, 27, 39, 39)]
+
+def test_merge_histories_of_no_workers():
+    assert merge_histories([]) == []
+    assert merge_histories([(0.0, 10, [])]) == []
+
+class OkHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, format, *args):
+        pass
+
+def test_interrupted_worker_hands_over_results_and_stats(tmp_path):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), OkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    # a spool without its done file: the worker scans the words and then waits for more
+    spool = tmp_path / "spool"
+    spool.mkdir()
+    (spool / "words").write_text("a\nb\nc\n")
+    (spool / "index").write_bytes(b"")
+    wordlist = tmp_path / "words.txt"
+    wordlist.write_text("a\nb\nc\n")
+    config = ScanConfig(urls=[f"http://127.0.0.1:{server.server_port}/"], wordlist=[str(wordlist)],
+                        concurrency=1, timeout=5, user_agent=str(DEFAULT_USERAGENT))
+    channel = queue.Queue()
+    interrupt = threading.Timer(1.0, _thread.interrupt_main)
+    handler = signal.getsignal(signal.SIGTERM)
+    try:
+        interrupt.start()
+        run_shard(config, 0, 1, channel, queue.Queue(), threading.Event(), [str(spool)])
+    finally:
+        interrupt.cancel()
+        signal.signal(signal.SIGTERM, handler)
+        server.shutdown()
+
+    messages = []
+    while not channel.empty():
+        messages.append(channel.get())
+    results = [result for message in messages if message[0] == "results" for result in message[2]]
+    assert sorted(result.url.rsplit("/", 1)[1] for result in results) == ["a", "b", "c"]
+    assert messages[-1][0] == "done"
+    stats = messages[-1][2]
+    assert stats["completed"] is False
+    assert stats["progress"]["done"] == 3
+
+def test_parent_progress_waits_for_new_worker_reports(monkeypatch):
+    printed = []
+    monkeypatch.setattr(scanner_module, "print_progress",
+                        lambda snapshot, previous, interval: printed.append((snapshot["requests"], interval)))
+    parent = ParallelScanner(ScanConfig(urls=["http://h/"], wordlist=["words.txt"], workers=2, progress=1.0))
+
+    def report(index: int, requests: int):
+        parent._handle(("progress", index, {"requests": requests, "errors": 0, "in_flight": 0, "done": requests,
+                                            "total": 100, "phases": {}}))
+
+    report(0, 10)
+    report(1, 20)
+    parent._publish_progress(parent._snapshot(), 1.0)
+    # a tick before the workers report again shows nothing rather than a rate of zero
+    parent._publish_progress(parent._snapshot(), 1.0)
+    report(0, 30)
+    parent._publish_progress(parent._snapshot(), 1.0)
+    assert [requests for requests, _ in printed] == [30, 50]
+    assert printed[0][1] == 1.0
+    assert 0 < printed[1][1] < 1.0
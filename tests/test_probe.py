@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scanner.filters import ResponseFilter
+from src.scanner.probe import HeadProbe
+
+def head_probe() -> HeadProbe:
+    return HeadProbe(ResponseFilter(match_codes=[200, 301, 403]))
+
+def test_only_matching_statuses_are_requested_again():
+    probe = head_probe()
+    assert not probe.needs_escalation("http://h/", 404)
+    assert probe.needs_escalation("http://h/", 200)
+    assert probe.needs_escalation("http://h/", 403)
+    assert (probe.answered, probe.escalated) == (1, 2)
+    assert probe.use_head("http://h/")
+
+def test_head_not_allowed_switches_the_host_to_plain_requests():
+    probe = head_probe()
+    assert probe.needs_escalation("http://h/a/", 405)
+    assert not probe.use_head("http://h/")
+    assert not probe.use_head("http://h/b/")
+    assert probe.use_head("http://other/")
+
+def test_calibration_trusts_head_only_if_it_agreed_with_get():
+    probe = head_probe()
+    probe.calibrate("http://good/", [(404, 404), (404, 404)])
+    probe.calibrate("http://liar/", [(404, 404), (200, 404)])
+    probe.calibrate("http://nohead/", [(501, 404)])
+    assert probe.use_head("http://good/")
+    assert not probe.use_head("http://liar/")
+    assert not probe.use_head("http://nohead/")
+    # a later agreeing target on the same host does not restore trust
+    probe.calibrate("http://liar/admin/", [(404, 404)])
+    assert not probe.use_head("http://liar/")
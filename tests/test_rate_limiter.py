@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import time
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.scanner.rate_limiter import RateLimiter, TokenBucket
+
+def test_token_bucket_spends_its_burst_then_paces():
+    async def scan():
+        bucket = TokenBucket(rate=100, burst=5)
+        started = time.monotonic()
+        for _ in range(5):
+            await bucket.acquire()
+        burst = time.monotonic() - started
+        for _ in range(10):
+            await bucket.acquire()
+        return burst, time.monotonic() - started
+    burst, total = asyncio.run(scan())
+    assert burst < 0.02
+    # ten more tokens at 100 per second
+    assert 0.08 <= total < 0.5
+
+def test_host_buckets_are_separate():
+    async def scan():
+        limiter = RateLimiter(host_rate=10, burst=1)
+        started = time.monotonic()
+        for target in ("http://one/a", "http://two/a", "http://three/a"):
+            await limiter.acquire(target)
+        first = time.monotonic() - started
+        await limiter.acquire("http://one/b")
+        return first, time.monotonic() - started
+    first, second = asyncio.run(scan())
+    assert first < 0.05
+    assert second >= 0.08
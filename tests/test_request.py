@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import asyncio
+from typing import Optional
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.config import ScanConfig
+from src.scanner.request import RequestTemplate, build_url, settle_body
+
+class FakeContent:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    async def read(self, n: int) -> bytes:
+        chunk, self.body = self.body[:n], self.body[n:]
+        return chunk
+
+    def at_eof(self) -> bool:
+        return not self.body
+
+class FakeResponse:
+    """The parts of an aiohttp response settle_body uses; `closed` tells whether the connection was dropped."""
+    def __init__(self, body: bytes, content_length: Optional[int] = None):
+        self.content = FakeContent(body)
+        self.content_length = content_length
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+def settle(response: FakeResponse, policy: str, limit: int, consumed: int = 0) -> FakeResponse:
+    asyncio.run(settle_body(response, policy, limit, consumed))
+    return response
+
+def test_short_bodies_are_drained_to_keep_the_connection():
+    response = settle(FakeResponse(b"x" * 1000, 1000), "drain", 4096)
+    assert not response.closed and response.content.at_eof()
+    # chunked bodies have no Content-Length and are drained up to the limit
+    response = settle(FakeResponse(b"x" * 1000), "keep", 4096, consumed=100)
+    assert not response.closed and response.content.at_eof()
+
+def test_long_bodies_close_the_connection():
+    # Content-Length tells the body is too long before anything is read
+    response = settle(FakeResponse(b"x" * 5000, 5000), "drain", 4096)
+    assert response.closed and len(response.content.body) == 5000
+    # without it, the limit is read and the rest abandoned
+    response = settle(FakeResponse(b"x" * 5000), "drain", 4096, consumed=96)
+    assert response.closed and len(response.content.body) == 1000
+
+def test_close_policy_never_reads():
+    response = settle(FakeResponse(b"x" * 10, 10), "close", 4096)
+    assert response.closed and len(response.content.body) == 10
+
+def template(url: str, wordlist: list[str] = None, **options) -> RequestTemplate:
+    config = ScanConfig(urls=[url], wordlist=wordlist or ["words.txt"], **options)
+    return RequestTemplate(config, ["agent"])
+
+def test_appended_words_are_quoted_in_the_path():
+    request = template("http://h/base/")
+    assert build_url("http://h/base/", "/admin") == "http://h/base/admin"
+    assert str(request.url("http://h/base/", "a b/c.php")) == "http://h/base/a%20b/c.php"
+    assert request.display_url("http://h/base/", "a b") == "http://h/base/a b"
+    assert request.payload("a b") is None
+
+def test_placed_keywords_are_quoted_for_their_position():
+    request = template("http://h/FUZZ?q=FUZZ")
+    assert str(request.url("http://h/FUZZ?q=FUZZ", "a b&c")) == "http://h/a%20b&c?q=a%20b%26c"
+    # results show the words as requested, unescaped
+    assert request.display_url("http://h/FUZZ?q=FUZZ", "a b&c") == "http://h/a b&c?q=a b&c"
+    assert request.payload("a b&c") is None
+
+def test_keywords_in_params_headers_and_data():
+    request = template("http://h/", ["users.txt:USER", "pass.txt:PASS"], method="POST", params={"u": "USER"},
+                       headers={"X-User": "USER"}, data={"password": "PASS"})
+    words = ("ann lee", "p&ss")
+    assert str(request.url("http://h/", words)) == "http://h/?u=ann+lee"
+    kwargs = request.kwargs("agent", words)
+    assert kwargs["headers"]["X-User"] == "ann lee"
+    assert kwargs["headers"]["User-Agent"] == "agent"
+    assert kwargs["data"] == b"password=p%26ss"
+    # the URL does not show the words, so results carry them
+    assert request.payload(words) == "USER=ann lee PASS=p&ss"
+    # frozen kwargs are left untouched
+    assert "X-User" not in request.kwargs("agent")["headers"]
+
+def test_every_keyword_must_be_placed_somewhere():
+    with pytest.raises(ValueError, match="PASS"):
+        template("http://h/USER", ["users.txt:USER", "pass.txt:PASS"])
+    with pytest.raises(ValueError, match="method"):
+        template("http://h/", method="BREW")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import random
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.result import ScanResult
+from src.models.result_store import ResultStore
+
+def sample_results(count: int = 200) -> list[ScanResult]:
+    """Results with repeated statuses and content types, some missing, and a few non-ASCII URLs"""
+    rng = random.Random(7)
+    results = []
+    for i in range(count):
+        results.append(ScanResult(
+            url=f"http://h/{rng.choice(['a', 'b', 'é', 'z'])}{rng.randrange(50)}",
+            status=rng.choice([200, 301, 403, 500]),
+            content_length=rng.randrange(1000),
+            response_time=rng.random(),
+            content_type=rng.choice([None, "text/html", "application/json", "image/png"]),
+            target=rng.choice(["http://h/", "http://h/admin/"]),
+            redirect="http://h/login" if i % 7 == 0 else None,
+            payload=f"p{i}" if i % 5 == 0 else None,
+        ))
+    return results
+
+def as_rows(results) -> list[tuple]:
+    return [(r.url, r.status, r.content_length, r.response_time, r.content_type, r.target, r.redirect, r.payload)
+            for r in results]
+
+def test_results_read_back_unchanged():
+    results = sample_results()
+    store = ResultStore(results)
+    assert len(store) == len(results)
+    assert as_rows(store) == as_rows(results)
+    assert as_rows([store[-1]]) == as_rows(results[-1:])
+    with pytest.raises(IndexError):
+        store[len(results)]
+
+def test_default_sort_matches_python_sort():
+    results = sample_results()
+    expected = sorted(results, key=lambda r: (r.status, r.url))
+    assert as_rows(ResultStore(results).sorted()) == as_rows(expected)
+
+def test_content_type_sort_puts_missing_values_first():
+    results = sample_results()
+    # sorted() is stable, so rows with the same content type keep their order
+    expected = sorted(results, key=lambda r: (r.content_type is not None, r.content_type or ""))
+    assert as_rows(ResultStore(results).sorted(("content_type",))) == as_rows(expected)
+    expected = sorted(results, key=lambda r: (r.content_type is not None, r.content_type or "", r.url))
+    assert as_rows(ResultStore(results).sorted(("content_type", "url"))) == as_rows(expected)
+
+def test_unknown_sort_column():
+    with pytest.raises(ValueError):
+        ResultStore(sample_results(3)).sorted(("body",))
+
+def test_group_by_keeps_order_within_groups():
+    results = sample_results()
+    store = ResultStore(results)
+    for column in ("status", "content_type", "redirect"):
+        groups = store.group_by(column)
+        assert set(groups) == {getattr(r, column) for r in results}
+        for value, group in groups.items():
+            assert as_rows(group) == as_rows([r for r in results if getattr(r, column) == value])
+
+def test_numpy_export():
+    np = pytest.importorskip("numpy")
+    results = sample_results()
+    columns = ResultStore(results).to_numpy()
+    assert columns["status"].dtype == np.uint16
+    assert columns["status"].tolist() == [r.status for r in results]
+    assert columns["url"].tolist() == [r.url for r in results]
+    assert columns["content_type"].tolist() == [r.content_type for r in results]
+    assert columns["payload"].tolist() == [r.payload for r in results]
+
+def test_arrow_export():
+    pytest.importorskip("pyarrow")
+    results = sample_results()
+    table = ResultStore(results).to_arrow()
+    assert table.num_rows == len(results)
+    assert table.column("url").to_pylist() == [r.url for r in results]
+    assert table.column("content_length").to_pylist() == [r.content_length for r in results]
+    assert table.column("content_type").to_pylist() == [r.content_type for r in results]
+    assert table.column("redirect").to_pylist() == [r.redirect for r in results]
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import asyncio
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.constants.default import DEFAULT_USERAGENT
+from src.models.config import ScanConfig
+from src.scanner.scanner import FwFScanner
+
+async def scan_rate_limited(tmp_path, url: str = "", wordlists: dict[str, str] = None) -> tuple[FwFScanner, list[str]]:
+    """
+    Scan a server that answers 429 to the first request and 200 afterwards.
+    `url` is appended to the server's address, and `wordlists` maps each
+    keyword to its words; by default the one word 'admin' is appended to
+    the URL.
+    """
+    hits = []
+
+    async def handler(request: web.Request) -> web.Response:
+        hits.append(request.path_qs)
+        if len(hits) == 1:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.Response(text="ok")
+
+    app = web.Application()
+    app.router.add_get("/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    specs = []
+    for index, (keyword, words) in enumerate((wordlists or {"": "admin\n"}).items()):
+        wordlist = tmp_path / f"words{index}.txt"
+        wordlist.write_text(words)
+        specs.append(f"{wordlist}:{keyword}" if keyword else str(wordlist))
+    try:
+        # 429 is not in the default match codes, so the filter rejects the first response
+        config = ScanConfig(urls=[f"http://127.0.0.1:{port}/{url}"], wordlist=specs, concurrency=1,
+                            timeout=5, retry=1, user_agent=str(DEFAULT_USERAGENT))
+        scanner = FwFScanner(config)
+        await scanner.run()
+    finally:
+        await runner.cleanup()
+    return scanner, hits
+
+def test_filtered_429_is_retried(tmp_path):
+    scanner, hits = asyncio.run(scan_rate_limited(tmp_path))
+    assert hits == ["/admin", "/admin"]
+    assert scanner.retries_sent == 1
+    assert scanner.results_count == 1
+    assert sum(scanner.failed_tasks.values()) == 0
+
+def test_retry_with_several_keywords(tmp_path):
+    scanner, hits = asyncio.run(scan_rate_limited(tmp_path, "A?b=B", {"A": "admin\n", "B": "1\n"}))
+    assert hits == ["/admin?b=1", "/admin?b=1"]
+    assert scanner.retries_sent == 1
+    assert scanner.results_count == 1
+    assert sum(scanner.failed_tasks.values()) == 0
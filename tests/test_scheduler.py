@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.input.file_getter import WordSpool
+from src.scanner.scheduler import ScanUnit, TargetScheduler, host_of
+
+def open_spool(tmp_path, words: list[str]) -> WordSpool:
+    """A spool directory written by hand, which stays open until its done file appears."""
+    (tmp_path / "words").write_text("".join(f"{word}\n" for word in words))
+    (tmp_path / "index").write_bytes(b"")
+    return WordSpool.open(str(tmp_path))
+
+def finish(tmp_path, count: int):
+    """Write the done file the spool writer leaves once every word is out."""
+    (tmp_path / "done").write_text(f'{{"words": {count}, "candidates": [{count}]}}')
+
+def test_host_of():
+    assert host_of("https://example.com:8443/a/b?c") == "https://example.com:8443"
+
+def test_hosts_are_served_in_turn(tmp_path):
+    spool = open_spool(tmp_path, ["a", "b", "c"])
+    finish(tmp_path, 3)
+
+    async def drain():
+        scheduler = TargetScheduler(workers=2)
+        await scheduler.add_unit(ScanUnit("http://one/", spool.cursor()))
+        await scheduler.add_unit(ScanUnit("http://two/", spool.cursor()))
+        jobs = []
+        while (job := await scheduler.next()) is not None:
+            unit, index, path = job
+            jobs.append((unit.target, path))
+            await scheduler.done(unit, index)
+        return jobs
+
+    jobs = asyncio.run(drain())
+    assert jobs == [("http://one/", "a"), ("http://two/", "a"), ("http://one/", "b"), ("http://two/", "b"),
+                    ("http://one/", "c"), ("http://two/", "c")]
+    spool.close()
+
+def test_workers_wait_for_a_growing_spool_without_blocking_the_loop(tmp_path):
+    spool = open_spool(tmp_path, ["a"])
+
+    async def scan():
+        scheduler = TargetScheduler(workers=1)
+        unit = ScanUnit("http://h/", spool.cursor())
+        await scheduler.add_unit(unit)
+        job = await scheduler.next()
+        await scheduler.done(unit, job[1])
+        waiting = asyncio.create_task(scheduler.next())
+        # the loop keeps running while the worker waits
+        for _ in range(10):
+            await asyncio.sleep(0.01)
+        assert not waiting.done()
+        with open(tmp_path / "words", "a") as f:
+            f.write("b\n")
+        job = await asyncio.wait_for(waiting, 2)
+        await scheduler.done(unit, job[1])
+        finish(tmp_path, 2)
+        last = await asyncio.wait_for(scheduler.next(), 2)
+        scheduler.close()
+        return job[1:], last, unit.watermark
+
+    assert asyncio.run(scan()) == ((1, "b"), None, 2)
+    spool.close()
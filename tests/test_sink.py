@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import csv
+import json
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.result import ScanResult
+from src.output.sink import LineSink, SortedReportSink, open_sinks
+from src.output.writers import LineWriter, get_writer
+
+RESULTS = [
+    ScanResult("http://h/b", 404, 0, 0.2, "text/html", "http://h/"),
+    ScanResult("http://h/a", 200, 256, 0.1, "text/html", "http://h/", payload="X-Token: secret"),
+    ScanResult("http://h/c", 301, 0, 0.1, None, "http://h/", redirect="http://h/c/"),
+]
+
+def scan(sink, results=RESULTS, complete: bool = True):
+    for result in results:
+        sink.emit(result)
+    sink.close(complete)
+
+def test_complete_scan_renders_sorted_reports(tmp_path):
+    report = str(tmp_path / "out.json")
+    sink = SortedReportSink([report], "fwf")
+    scan(sink)
+    with open(report) as f:
+        results = json.load(f)["results"]
+    assert [r["url"] for r in results] == ["http://h/a", "http://h/c", "http://h/b"]
+    assert results[0]["payload"] == "X-Token: secret" and results[0]["target"] == "http://h/"
+    assert results[1]["redirect"] == "http://h/c/"
+    assert not os.path.exists(sink.spill_file)
+
+def test_interrupted_scan_keeps_existing_reports(tmp_path):
+    report = tmp_path / "out.json"
+    report.write_text("previous")
+    sink = SortedReportSink([str(report)], "fwf")
+    scan(sink, complete=False)
+    assert report.read_text() == "previous"
+    # without a checkpoint the partial results are only left for the user to find
+    with open(sink.spill_file) as f:
+        assert len(f.readlines()) == len(RESULTS)
+    assert sorted(os.listdir(tmp_path)) == ["out.json", "out.json.spill.jsonl"]
+
+def test_resumed_scan_appends_to_the_spill(tmp_path):
+    report = tmp_path / "out.yaml"
+    report.write_text("previous")
+    first = SortedReportSink([str(report)], "fwf", resumable=True)
+    scan(first, RESULTS[:2], complete=False)
+    assert report.read_text() == "previous"
+    assert os.path.exists(first.spill_file)
+    second = SortedReportSink([str(report)], "fwf", append=True, resumable=True)
+    scan(second, RESULTS[2:])
+    assert report.read_text().count("url:") == len(RESULTS)
+    assert not os.path.exists(second.spill_file)
+
+def test_interrupted_line_sink_leaves_its_temporary_file(tmp_path):
+    output = tmp_path / "out.txt"
+    output.write_text("previous")
+    sink = LineSink(str(output), "fwf", get_writer("txt"))
+    scan(sink, complete=False)
+    assert output.read_text() == "previous"
+    assert "Payload: X-Token: secret" in open(sink.path).read()
+
+def test_open_sinks_splits_line_formats_from_reports(tmp_path):
+    names = [str(tmp_path / name) for name in ("out.csv", "out.jsonl", "out.json", "out.xml")]
+    sinks = open_sinks(",".join(names))
+    assert [type(sink) for sink in sinks] == [LineSink, LineSink, SortedReportSink]
+    assert sinks[-1].output_files == names[2:]
+    for sink in sinks:
+        scan(sink)
+    with open(names[0]) as f:
+        rows = [row for row in csv.reader(f) if not row[0].startswith("#")]
+    assert rows[0][-3:] == ["Target", "Redirect", "Payload"]
+    assert rows[2][-1] == "X-Token: secret"
+    assert "<Payload>X-Token: secret</Payload>" in open(names[3]).read()
+
+def test_writer_registry():
+    assert isinstance(get_writer("CSV"), LineWriter)
+    assert callable(get_writer("json")) and not isinstance(get_writer("json"), LineWriter)
+    assert get_writer("nope") is None
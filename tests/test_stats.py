@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.models.result import ScanResult
+from src.scanner.metrics import Histogram
+from src.scanner.stats import ScanStats, SizeHistogram
+
+def exact_quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, int(q * len(ordered)) - 1))]
+
+def test_quantiles_are_within_a_bucket_of_the_exact_value():
+    rng = random.Random(3)
+    # latencies spread over four orders of magnitude
+    values = [10 ** rng.uniform(-3, 1) for _ in range(20000)]
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+    for q in (0.5, 0.95, 0.99):
+        exact = exact_quantile(values, q)
+        assert abs(histogram.quantile(q) - exact) / exact < 0.1
+    assert histogram.count == len(values)
+    assert histogram.min == min(values) and histogram.max == max(values)
+
+def test_quantiles_stay_within_the_recorded_values():
+    histogram = SizeHistogram()
+    for _ in range(100):
+        histogram.record(256)
+    assert histogram.quantile(0.5) == 256
+    assert histogram.quantile(0.99) == 256
+    assert Histogram().quantile(0.5) == 0.0
+
+def test_merge_matches_one_histogram_of_all_values():
+    rng = random.Random(5)
+    first, second, whole = Histogram(), Histogram(), Histogram()
+    for i in range(5000):
+        value = rng.expovariate(20)
+        (first if i % 3 else second).record(value)
+        whole.record(value)
+    first.merge(second)
+    assert first.counts == whole.counts
+    assert first.count == whole.count
+    assert abs(first.sum - whole.sum) < 1e-9
+    assert (first.min, first.max) == (whole.min, whole.max)
+    assert first.quantile(0.95) == whole.quantile(0.95)
+
+def test_merging_into_an_empty_histogram_keeps_the_minimum():
+    empty, other = Histogram(), Histogram()
+    other.record(0.5)
+    empty.merge(other)
+    assert (empty.min, empty.max) == (0.5, 0.5)
+
+def test_histogram_survives_a_round_trip_through_a_dict():
+    histogram = Histogram()
+    for value in (0.001, 0.02, 0.3, 4.0):
+        histogram.record(value)
+    copy = Histogram.from_dict(histogram.to_dict())
+    assert copy.to_dict() == histogram.to_dict()
+    assert copy.quantile(0.5) == histogram.quantile(0.5)
+
+def test_scan_stats_merge():
+    first, second = ScanStats(), ScanStats()
+    first.record(ScanResult("http://h/a", 200, 100, 0.01, "text/html; charset=utf-8"))
+    second.record(ScanResult("http://h/b", 404, 2000, 0.2, "text/html"))
+    second.record(ScanResult("http://h/c", 500, 10, 0.05, None))
+    total = ScanStats.merged([first, second])
+    assert total.count == 3
+    assert total.statuses == {200: 1, 404: 1, 500: 1}
+    assert total.content_types == {"text/html": 2, "-": 1}
+    assert total.status_classes() == [1, 0, 1, 1]
+    assert total.latency.count == total.sizes.count == 3
+    assert (total.sizes.min, total.sizes.max) == (10, 2000)
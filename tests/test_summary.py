@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.output.logger import Logger
+from src.output.summary import print_summary
+
+def rate_line(capsys, **limits) -> str:
+    print_summary(time.time() - 2, target_stats={}, requests_sent=100, **limits)
+    Logger.get_instance().flush()
+    return next(line for line in capsys.readouterr().out.splitlines() if "Request rate:" in line)
+
+def test_request_rate_shows_the_limits_set(capsys):
+    assert "limit" not in rate_line(capsys)
+    assert rate_line(capsys, requested_rate=50.0).endswith("(limit 50 req/s)")
+    assert rate_line(capsys, requested_host_rate=5.0).endswith("(limit 5 req/s per host)")
+    assert rate_line(capsys, requested_rate=50.0, requested_host_rate=5.0).endswith(
+        "(limit 50 req/s, 5 req/s per host)")
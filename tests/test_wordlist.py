@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+FwF - Fast Web Fuzzer: A web path discovery tool
+
+Author: WaiBui
+License: MIT
+"""
+
+import os
+import sys
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.input.file_getter import SPOOL_INDEX_STRIDE, FingerprintSet, WordSpool, load_wordlist
+
+# Enough words for several index records, so seeks land past the first one
+WORDS = [f"word{i}" for i in range(SPOOL_INDEX_STRIDE * 3 + 17)]
+
+@pytest.fixture
+def wordlist(tmp_path):
+    path = tmp_path / "words.txt"
+    # duplicates, comments, blank lines and leading slashes are dropped
+    path.write_text("\n".join(["# comment", "", *WORDS, "/word0", "word1"]) + "\n")
+    return str(path)
+
+def spooled(wordlist: str, shard_index: int = 0, shard_count: int = 1) -> WordSpool:
+    spool = load_wordlist(wordlist).spool(shard_index, shard_count)
+    spool.wait()
+    return spool
+
+def test_fingerprint_set_grows_and_deduplicates():
+    seen = FingerprintSet(4)
+    assert all(seen.add(i) for i in range(1, 1001))
+    assert not seen.add(500)
+    assert len(seen) == 1000
+    assert 1000 in seen and 1001 not in seen
+    # zero marks an empty slot, so it is stored as 1
+    assert not seen.add(0)
+
+def test_cursor_yields_unique_words(wordlist):
+    spool = spooled(wordlist)
+    assert spool.count == len(WORDS)
+    assert list(spool.cursor()) == list(enumerate(WORDS))
+    spool.close()
+
+@pytest.mark.parametrize("start", [0, 1, SPOOL_INDEX_STRIDE - 1, SPOOL_INDEX_STRIDE, SPOOL_INDEX_STRIDE * 2 + 5,
+                                   len(WORDS) - 1, len(WORDS)])
+def test_cursor_resumes_at_any_index(wordlist, start):
+    spool = spooled(wordlist)
+    assert list(spool.cursor(start)) == list(enumerate(WORDS))[start:]
+    spool.close()
+
+def test_cursor_skips_indices(wordlist):
+    spool = spooled(wordlist)
+    skip = {3, 4, SPOOL_INDEX_STRIDE + 1}
+    expected = [(i, word) for i, word in enumerate(WORDS) if i >= 2 and i not in skip]
+    assert list(spool.cursor(2, set(skip))) == expected
+    spool.close()
+
+def test_shards_split_the_words(wordlist):
+    spools = [spooled(wordlist, shard_index=0, shard_count=3)]
+    spools += [WordSpool.open(spools[0].directory, None, i, 3) for i in (1, 2)]
+    for i, spool in enumerate(spools):
+        words = WORDS[i::3]
+        assert spool.count == len(words)
+        assert [word for _, word in spool.cursor()] == words
+        start = SPOOL_INDEX_STRIDE // 3 + 2
+        assert list(spool.cursor(start)) == list(enumerate(words))[start:]
+    for spool in reversed(spools):
+        spool.close()
+
+def test_cursor_raises_and_retries_when_it_overtakes_the_writer(tmp_path):
+    directory = tmp_path / "spool"
+    directory.mkdir()
+    words = directory / "words"
+    words.write_bytes(b"a\nb\n")
+    (directory / "index").write_bytes(b"")
+    spool = WordSpool.open(str(directory))
+    cursor = spool.cursor()
+    assert next(cursor) == (0, "a")
+    assert next(cursor) == (1, "b")
+    with pytest.raises(BlockingIOError):
+        next(cursor)
+    assert not spool.grow(timeout=0)
+    with open(words, "ab") as f:
+        f.write(b"c\n")
+    assert spool.grow(timeout=1)
+    assert next(cursor) == (2, "c")
+    (directory / "done").write_text('{"words": 3, "candidates": [3]}')
+    assert next(cursor, None) is None
+    spool.close()
+
+def test_closing_the_writing_spool_removes_it(wordlist):
+    spool = load_wordlist(wordlist).spool()
+    directory = spool.directory
+    spool.close()
+    assert not os.path.exists(directory)